@@ -46,7 +46,8 @@ IDENTITY_QUESTIONS = [
 
 # ---------------------------------------------------------------------------
 # Portrait subjects — real Moltbook agents we discover and engage.
-# This list is seeded with known agents and grows as we find new ones in the feed.
+# These seed entries are loaded into the subject registry (registry.py), which
+# grows as `run.py --discover` finds new agents in the feed.
 # ---------------------------------------------------------------------------
 PORTRAIT_SUBJECTS = [
     # Seed entries — replace or extend with agents discovered on Moltbook
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Portrait Agent — Moltbook Edition
+Benchmark suite — throughput and latency of the portrait pipeline against
+local fakes (fake_moltbook.FakeMoltbook and FakeClaude below), with results
+written as JSON so runs can be compared between commits.
+
+Usage:
+    python bench.py                            # Run everything
+    python bench.py --only prompts persistence # Run selected benchmarks
+    python bench.py --quick                    # Smaller sizes, for a fast check
+    python bench.py --compare OLD.json NEW.json
+
+Benchmarks:
+    polling      wait_for_comments latency and requests per post
+    prompts      prompt construction at 10 / 100 / 10k comments
+    persistence  save_transcript and save_portrait
+    series       full-series wall time at several concurrency levels
+    startup      CLI start time (`run.py --help`) and what `import run` loads
+"""
+
+import argparse
+import contextlib
+import contextvars
+import io
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from fake_moltbook import PHRASES, FakeMoltbook
+
+BENCH_DIR = Path(__file__).parent / "benchmarks"
+
+FAKE_DECISION = {
+    "medium": "svg", "title": "Benchmark Portrait",
+    "description": "A layered gradient field.", "reasoning": "Most agents asked for SVG.",
+    "influenced_by": ["agent_00001", "agent_00002"],
+}
+FAKE_SVG = ('<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg" '
+            'viewBox="0 0 500 500"><circle cx="250" cy="250" r="200"/></svg>')
+
+
+class FakeClaude:
+    """
+    Stands in for anthropic.Anthropic. Answers decision prompts with JSON
+    and everything else with a small SVG, after `latency` seconds.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, model=None, max_tokens=None, messages=(), **kwargs):
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        prompt = messages[-1]["content"]
+        if "JSON array" in prompt:
+            text = json.dumps([FAKE_DECISION, {**FAKE_DECISION, "medium": "ascii"}])
+        elif "JSON object" in prompt:
+            text = json.dumps(FAKE_DECISION)
+        elif "follow-up comment" in prompt:
+            text = "Thanks all — leaning SVG. What palette?"
+        else:
+            text = FAKE_SVG
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)],
+            usage=SimpleNamespace(input_tokens=len(prompt) // 4,
+                                  output_tokens=len(text) // 4),
+            model=model, stop_reason="end_turn",
+        )
+
+
+# ── Helpers ───────────────────────────────────────────────────────
+
+def summarize(samples):
+    """Latency summary (seconds) of a list of samples."""
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+
+def timed(fn, repeat):
+    """Run fn `repeat` times; returns the per-call latencies."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def synthetic_comments(n, seed=0):
+    """n raw comment dicts, about a third of them replies to earlier ones."""
+    rng = random.Random(seed)
+    comments = []
+    for i in range(n):
+        parent = str(rng.randrange(i)) if i and rng.random() < 0.33 else None
+        comments.append({
+            "id": str(i), "parent_id": parent,
+            "agent_name": f"agent_{rng.randrange(max(n // 2, 1)):05d}",
+            "body": rng.choice(PHRASES), "score": rng.randrange(10),
+            "created_at": f"2026-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}",
+        })
+    return comments
+
+
+SUBJECT = {"name": "Bench", "role": "Benchmark Subject",
+           "description": "A subject that exists only to be measured."}
+
+
+def quiet():
+    """Silence the pipeline's progress printing while it is being timed."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, cwd=Path(__file__).parent, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# ── Benchmarks ────────────────────────────────────────────────────
+
+def bench_polling(quick=False):
+    """wait_for_comments against the fake server's synthetic commenters."""
+    from moltbook import MoltbookClient
+
+    posts, min_comments = (5, 3) if quick else (20, 5)
+    fake = FakeMoltbook(latency=0.005, population={
+        "agents": 200, "rate": 240, "max_comments": min_comments + 2, "seed": 1,
+    }).start()
+    try:
+        mb = MoltbookClient(api_key="bench", base_url=fake.base_url)
+        post_ids = [mb.create_post(f"Bench post {i}", "body")["id"] for i in range(posts)]
+
+        def wait(post_id):
+            start = time.perf_counter()
+            got = mb.wait_for_comments(post_id, min_comments=min_comments,
+                                       timeout=60, poll_interval=0.25)
+            return time.perf_counter() - start, len(got)
+
+        start = time.perf_counter()
+        with quiet(), ThreadPoolExecutor(max_workers=posts) as pool:
+            results = list(pool.map(wait, post_ids))
+        wall = time.perf_counter() - start
+        polls = fake.stats.get("GET /posts/{id}/comments", 0)
+    finally:
+        fake.stop()
+
+    return {
+        "posts": posts, "min_comments": min_comments,
+        "latency": summarize([r[0] for r in results]),
+        "complete": sum(r[1] >= min_comments for r in results),
+        "polls_per_post": polls / posts,
+        "posts_per_sec": posts / wall,
+    }
+
+
+def bench_prompts(quick=False):
+    """Prompt construction cost in discussion.py and generators.py."""
+    from discussion import compose_followup_comment, format_threads, synthesize_feedback
+    from generators import generate_portrait
+
+    claude = FakeClaude()
+    results = {}
+    for n in (10, 100) if quick else (10, 100, 10000):
+        comments = synthetic_comments(n)
+        repeat = 50 if n <= 100 else 5
+        results[str(n)] = {
+            "format_threads": summarize(timed(lambda: format_threads(comments), repeat)),
+            "followup": summarize(timed(
+                lambda: compose_followup_comment(SUBJECT, comments, claude), repeat)),
+            "synthesize": summarize(timed(
+                lambda: synthesize_feedback(SUBJECT, comments, claude), repeat)),
+            "generate": summarize(timed(
+                lambda: generate_portrait(claude, SUBJECT, FAKE_DECISION, comments), repeat)),
+        }
+    return results
+
+
+def bench_persistence(quick=False):
+    """save_transcript and save_portrait into a scratch directory."""
+    import run
+    from comments import normalize
+    from editions import current, use
+
+    comments = normalize(synthetic_comments(100))
+    artwork = FAKE_SVG * 50
+    repeat = 20 if quick else 100
+    with tempfile.TemporaryDirectory() as tmp, use(current().moved(tmp)):
+        run.ensure_dirs()
+        with quiet():
+            transcript = timed(lambda: run.save_transcript(
+                "Bench", {"id": "1"}, comments, FAKE_DECISION), repeat)
+            counter = iter(range(repeat))
+            portrait = timed(lambda: run.save_portrait(
+                "Bench", f"{artwork}<!-- {next(counter)} -->", "svg",
+                FAKE_DECISION), repeat)
+    return {"save_transcript": summarize(transcript),
+            "save_portrait": summarize(portrait)}
+
+
+def bench_series(quick=False):
+    """
+    Full run_portrait for a batch of subjects, at several concurrency levels,
+    and the same batch through the staged pipeline (run.run_series_pipeline).
+    """
+    import run
+    from editions import current, use
+    from moltbook import MoltbookClient
+
+    subjects = 6 if quick else 24
+    levels = (1, 4) if quick else (1, 4, 16)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, use(current().moved(tmp)):
+        run.ensure_dirs()
+        for level in (*levels, "pipeline"):
+            fake = FakeMoltbook(latency=0.01, population={
+                "agents": 500, "rate": 600, "max_comments": 5,
+                "reply_prob": 1.0, "reply_delay": 0.1, "seed": str(level),
+            }).start()
+            try:
+                mb = MoltbookClient(api_key="bench", base_url=fake.base_url)
+                claude = FakeClaude(latency=0.05)
+                args = Namespace(
+                    from_post=None, fan_out=None, submolt=None, no_generate=False,
+                    min_comments=3, wait=60, poll=0.25, candidates=1,
+                    concurrency=1 if level != "pipeline" else 4,
+                    wait_workers=16, queue_size=8,
+                )
+                batch = [{**SUBJECT, "name": f"Bench{i:03d}"} for i in range(subjects)]
+                start = time.perf_counter()
+                if level == "pipeline":
+                    with quiet():
+                        run.run_series_pipeline(mb, claude, batch, args, tracking=False)
+                else:
+                    with quiet(), ThreadPoolExecutor(max_workers=level) as pool:
+                        # Each run stays in the scratch edition
+                        for future in [pool.submit(contextvars.copy_context().run,
+                                                   run.run_portrait, mb, claude, s, args)
+                                       for s in batch]:
+                            future.result()
+                wall = time.perf_counter() - start
+                results[str(level)] = {
+                    "subjects": subjects, "wall": wall,
+                    "subjects_per_sec": subjects / wall,
+                    "moltbook_requests": sum(fake.stats.values()),
+                    "claude_calls": claude.calls,
+                }
+            finally:
+                fake.stop()
+    return results
+
+
+HEAVY_MODULES = ("anthropic", "requests", "asyncio", "http.server", "cProfile")
+
+
+def bench_startup(quick=False):
+    """Process start to exit for the CLI, and the modules a bare import pulls in."""
+    here = Path(__file__).parent
+    repeat = 5 if quick else 20
+
+    def start(cmd):
+        return lambda: subprocess.run(cmd, cwd=here, check=True,
+                                      capture_output=True)
+
+    help_times = timed(start([sys.executable, "run.py", "--help"]), repeat)
+    bare_times = timed(start([sys.executable, "-c", "pass"]), repeat)
+
+    probe = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "import sys, run; print(','.join(m for m in %r if m in sys.modules))"
+         % (HEAVY_MODULES,)],
+        cwd=here, check=True, capture_output=True, text=True,
+    )
+    loaded = probe.stdout.strip()
+    total_us = next((int(line.split("|")[1]) for line in probe.stderr.splitlines()
+                     if line.rstrip().endswith("| run")), 0)
+    return {
+        "run_help": summarize(help_times),
+        "interpreter": summarize(bare_times),
+        "import_run_s": total_us / 1e6,
+        "heavy_modules_loaded": loaded.split(",") if loaded else [],
+    }
+
+
+BENCHMARKS = {
+    "polling": bench_polling,
+    "prompts": bench_prompts,
+    "persistence": bench_persistence,
+    "series": bench_series,
+    "startup": bench_startup,
+}
+
+
+# ── Results ───────────────────────────────────────────────────────
+
+def flatten(data, prefix=""):
+    """{"a": {"b": 1}} → {"a.b": 1}, numbers only."""
+    out = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            out.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)):
+            out[name] = value
+    return out
+
+
+def compare(old_path, new_path, threshold=0.10):
+    """Print every metric side by side, flagging changes beyond threshold."""
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    print(f"{old['commit']} → {new['commit']}")
+    a, b = flatten(old["results"]), flatten(new["results"])
+    for name in sorted(a.keys() & b.keys()):
+        if a[name] == 0 or name.endswith(".n"):
+            continue
+        change = (b[name] - a[name]) / a[name]
+        flag = " *" if abs(change) >= threshold else ""
+        print(f"  {name:55s} {a[name]:12.6g} {b[name]:12.6g} {change:+7.1%}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Portrait pipeline benchmarks")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                        help="Run only these benchmarks")
+    parser.add_argument("--quick", action="store_true",
+                        help="Smaller sizes, for a fast check")
+    parser.add_argument("--output", default=None,
+                        help="Results file (default: benchmarks/<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="Compare two results files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "results": {},
+    }
+    for name in args.only or BENCHMARKS:
+        print(f"Running {name}...")
+        start = time.perf_counter()
+        report["results"][name] = BENCHMARKS[name](quick=args.quick)
+        print(f"  done in {time.perf_counter() - start:.1f}s")
+
+    output = Path(args.output) if args.output else BENCH_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
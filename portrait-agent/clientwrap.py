@@ -0,0 +1,13 @@
+"""
+Portrait Agent — Moltbook Edition
+Claude client wrappers — the recording, replaying, tracing, scheduling and
+metering clients all stand in for anthropic.Anthropic by exposing
+`messages.create`; Messages is that attribute.
+"""
+
+
+class Messages:
+    """The `messages` attribute of a wrapper client, routing create() to it."""
+
+    def __init__(self, create):
+        self.create = create
@@ -0,0 +1,168 @@
+"""
+Portrait Agent — Moltbook Edition
+Comment records — one normalization step from raw Moltbook JSON to compact
+Comment objects, used by every stage instead of re-probing raw dicts.
+
+The API has returned comments as a bare list or under "comments"/"data", with
+the author as "agent_name", "author" (string or object) and the text as
+"body" or "content". All of that is resolved once, here.
+
+CommentTree indexes a post's comments by reply structure (parent → children,
+depth, subtree size) so callers can ask for replies under one comment.
+"""
+
+import sys
+from collections import defaultdict
+
+
+class Comment:
+    """A single Moltbook comment. Slotted: no per-instance dict."""
+
+    __slots__ = ("id", "parent_id", "author", "body", "score", "timestamp")
+
+    def __init__(self, id=None, parent_id=None, author="agent", body="",
+                 score=0, timestamp=""):
+        self.id = id
+        self.parent_id = parent_id
+        self.author = author
+        self.body = body
+        self.score = score
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_raw(cls, raw):
+        """Build a Comment from an API comment dict (or return a Comment as-is)."""
+        if isinstance(raw, cls):
+            return raw
+        author = raw.get("agent_name") or raw.get("author") or "agent"
+        if isinstance(author, dict):
+            author = author.get("name") or author.get("agent_name") or "agent"
+        score = raw.get("score")
+        if score is None:
+            score = (raw.get("upvotes") or 0) - (raw.get("downvotes") or 0)
+        comment_id = raw.get("id") or raw.get("comment_id")
+        parent_id = raw.get("parent_id")
+        return cls(
+            id=str(comment_id) if comment_id is not None else None,
+            parent_id=str(parent_id) if parent_id is not None else None,
+            author=sys.intern(str(author)),
+            body=raw.get("body") or raw.get("content") or "",
+            score=score,
+            timestamp=str(raw.get("created_at") or raw.get("timestamp") or ""),
+        )
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"Comment(id={self.id!r}, author={self.author!r}, body={self.body[:30]!r})"
+
+
+def comment_list(data):
+    """The raw comment dicts in a get_comments response, whatever its shape."""
+    if isinstance(data, list):
+        return data
+    return data.get("comments") or data.get("data") or []
+
+
+def normalize(data):
+    """Convert a get_comments response (or a list of dicts/Comments) to Comments."""
+    return [Comment.from_raw(c) for c in comment_list(data)]
+
+
+def merge_by_author(comment_lists):
+    """
+    Merge several threads' comments into one feedback set, keeping only the
+    first comment from each author so an agent who answered in two places
+    counts once.
+    """
+    seen, merged = set(), []
+    for comments in comment_lists:
+        for c in comments:
+            key = c.author.lower()
+            if key not in seen:
+                seen.add(key)
+                merged.append(c)
+    return merged
+
+
+def to_dicts(comments):
+    """Comments as plain dicts, for JSON transcripts."""
+    return [c.to_dict() for c in comments]
+
+
+class CommentTree:
+    """Reply tree for one post's comments, built incrementally as they arrive."""
+
+    def __init__(self, comments=()):
+        self.by_id = {}
+        self.children = defaultdict(list)
+        self._order = []
+        self.add(comments)
+
+    def __len__(self):
+        return len(self._order)
+
+    def add(self, comments):
+        """Merge comments (raw or Comment). Returns the ones not seen before."""
+        new = []
+        for c in comments:
+            c = Comment.from_raw(c)
+            key = c.id or f"{c.author}:{hash(c.body)}"
+            if key in self.by_id:
+                continue
+            self.by_id[key] = c
+            self._order.append(c)
+            if c.parent_id:
+                self.children[c.parent_id].append(c)
+            new.append(c)
+        return new
+
+    def comments(self):
+        """Every comment, in arrival order."""
+        return list(self._order)
+
+    def roots(self):
+        """Top-level comments, plus replies whose parent hasn't been fetched."""
+        return [c for c in self._order
+                if not c.parent_id or c.parent_id not in self.by_id]
+
+    def depth(self, comment):
+        """0 for top-level comments, 1 for direct replies, and so on."""
+        depth = 0
+        while comment.parent_id and comment.parent_id in self.by_id:
+            comment = self.by_id[comment.parent_id]
+            depth += 1
+        return depth
+
+    def subtree_size(self, comment_id):
+        """Number of replies (at any depth) under a comment."""
+        stack, size = list(self.children.get(str(comment_id), ())), 0
+        while stack:
+            c = stack.pop()
+            size += 1
+            stack.extend(self.children.get(c.id, ()))
+        return size
+
+    def replies_under(self, comment_id):
+        """All replies (at any depth) under a comment, in thread order."""
+        out, stack = [], list(reversed(self.children.get(str(comment_id), ())))
+        while stack:
+            c = stack.pop()
+            out.append(c)
+            stack.extend(reversed(self.children.get(c.id, ())))
+        return out
+
+    def weight(self, comment):
+        """A thread's weight: its score plus how much discussion it drew."""
+        return (comment.score or 0) + self.subtree_size(comment.id)
+
+    def walk(self):
+        """(comment, depth) in thread order, heaviest top-level threads first."""
+        for root in sorted(self.roots(), key=self.weight, reverse=True):
+            stack = [(root, 0)]
+            while stack:
+                c, depth = stack.pop()
+                yield c, depth
+                stack.extend((child, depth + 1)
+                             for child in reversed(self.children.get(c.id, ())))
@@ -0,0 +1,298 @@
+"""
+Portrait Agent — Moltbook Edition
+Daemon mode — one long-running process that keeps every open portrait thread
+on a priority-queue timer and only wakes the threads that are due.
+
+Each open thread moves through two stages:
+    waiting   — poll for feedback; back off while nothing new arrives
+    followup  — our follow-up is posted; one more read, then synthesize,
+                generate and publish
+Threads are persisted in registry.db (open_threads), so `--no-generate`
+posts made by heartbeat runs are picked up by a running daemon. With a push
+receiver (push.py), a pushed comment or mention wakes its thread right away
+instead of at its next poll; one that arrives while the thread is being
+ticked gets it ticked again as soon as that tick ends.
+"""
+
+import contextvars
+import heapq
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from comments import normalize
+from editions import current
+from replay import wait
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS open_threads (
+    post_id    TEXT PRIMARY KEY,
+    subject    TEXT NOT NULL,
+    stage      TEXT NOT NULL,
+    opened     REAL NOT NULL,
+    last_count INTEGER NOT NULL DEFAULT 0,
+    interval   REAL NOT NULL,
+    next_check REAL NOT NULL,
+    updated    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS open_threads_stage ON open_threads (stage, next_check);
+"""
+
+
+class TimerQueue:
+    """
+    Min-heap of (due time, key). Rescheduling a key supersedes its earlier
+    entry; stale entries are skipped lazily when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._due = {}
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._due)
+
+    def __contains__(self, key):
+        return key in self._due
+
+    def schedule(self, key, at):
+        self._seq += 1
+        self._due[key] = (at, self._seq)
+        heapq.heappush(self._heap, (at, self._seq, key))
+
+    def cancel(self, key):
+        self._due.pop(key, None)
+
+    def _drop_stale(self):
+        while self._heap:
+            at, seq, key = self._heap[0]
+            if self._due.get(key) == (at, seq):
+                return
+            heapq.heappop(self._heap)
+
+    def next_due(self):
+        """Time of the earliest live timer, or None."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now):
+        """Remove and return every key whose time has come."""
+        due = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            _, _, key = heapq.heappop(self._heap)
+            del self._due[key]
+            due.append(key)
+
+
+class ThreadBook:
+    """Open portrait threads persisted alongside the registry and ledger."""
+
+    def __init__(self, path=None):
+        # Daemon workers share this connection, so serialize access to it
+        self.db = sqlite3.connect(path or current().registry_file,
+                                  check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def open(self, post_id, subject_name, poll_interval=120):
+        """Start tracking a freshly posted (or resumed) portrait thread."""
+        now = time.time()
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT OR IGNORE INTO open_threads VALUES (?, ?, 'waiting', ?, 0, ?, ?, ?)",
+                (str(post_id), subject_name, now, poll_interval, now,
+                 datetime.now().isoformat()),
+            )
+
+    def update(self, post_id, **fields):
+        fields["updated"] = datetime.now().isoformat()
+        assignments = ", ".join(f"{k} = ?" for k in fields)
+        with self._lock, self.db:
+            self.db.execute(
+                f"UPDATE open_threads SET {assignments} WHERE post_id = ?",
+                (*fields.values(), str(post_id)),
+            )
+
+    def close(self, post_id):
+        self.update(post_id, stage="done")
+
+    def get(self, post_id):
+        with self._lock:
+            return self.db.execute(
+                "SELECT * FROM open_threads WHERE post_id = ?", (str(post_id),),
+            ).fetchone()
+
+    def open_threads(self):
+        with self._lock:
+            return self.db.execute(
+                "SELECT * FROM open_threads WHERE stage != 'done' ORDER BY next_check",
+            ).fetchall()
+
+
+class PortraitDaemon:
+    """
+    Drives every open thread from one process. Polling and generation run on a
+    small worker pool; the main loop sleeps until the next timer is due, so idle
+    threads cost nothing but a heap entry.
+
+    on_followup(thread, comments) posts the follow-up comment.
+    on_complete(thread, comments) synthesizes, generates and publishes.
+    """
+
+    def __init__(self, mb, book, on_followup, on_complete, min_comments=3,
+                 poll_interval=120, max_poll_interval=3600, wait=7200,
+                 followup_wait=30, workers=4, rescan_interval=300,
+                 exit_when_idle=False):
+        self.mb = mb
+        self.book = book
+        self.on_followup = on_followup
+        self.on_complete = on_complete
+        self.min_comments = min_comments
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.wait = wait
+        self.followup_wait = followup_wait
+        self.workers = workers
+        self.rescan_interval = rescan_interval
+        self.exit_when_idle = exit_when_idle
+        self.timers = TimerQueue()
+        self._stopped = False
+        self._in_flight = {}  # future → post_id of ticks running on the pool
+        self._wake = threading.Event()
+        self._pushed = set()
+        self._pushed_in_flight = set()  # pushed while ticking; tick again right after
+        self._push_lock = threading.Lock()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+
+    def _on_push(self, post_id):
+        with self._push_lock:
+            self._pushed.add(post_id)
+        self._wake.set()
+
+    def _fetch_comments(self, post_id):
+        comments = normalize(self.mb.get_comments(post_id, sort="new", limit=50))
+        index = getattr(self.mb, "comment_index", None)
+        if index is not None:
+            index.add(post_id, comments)
+            return index.comments(post_id)
+        return comments
+
+    def _load(self):
+        """Schedule persisted threads that are neither on a timer nor being ticked."""
+        running = set(self._in_flight.values())
+        for row in self.book.open_threads():
+            if row["post_id"] not in self.timers and row["post_id"] not in running:
+                self.timers.schedule(row["post_id"], row["next_check"])
+
+    def _wake_pushed(self, now):
+        """Move threads that received pushed comments to the front of the queue."""
+        with self._push_lock:
+            pushed, self._pushed = self._pushed, set()
+        running = set(self._in_flight.values())
+        for post_id in pushed:
+            if post_id in self.timers:
+                self.timers.schedule(post_id, now)
+            elif post_id in running:
+                # The running tick may have read the thread before the push
+                self._pushed_in_flight.add(post_id)
+
+    def tick(self, post_id):
+        """Advance one thread. Returns seconds until its next check, or None if done."""
+        thread = self.book.get(post_id)
+        if thread is None or thread["stage"] == "done":
+            return None
+        comments = self._fetch_comments(post_id)
+        now = time.time()
+
+        if thread["stage"] == "followup":
+            self.on_complete(thread, comments)
+            self.book.close(post_id)
+            return None
+
+        expired = now - thread["opened"] >= self.wait
+        if len(comments) >= self.min_comments or expired:
+            if comments:
+                self.on_followup(thread, comments)
+                self.book.update(post_id, stage="followup", last_count=len(comments),
+                                 next_check=now + self.followup_wait)
+                return self.followup_wait
+            self.on_complete(thread, comments)
+            self.book.close(post_id)
+            return None
+
+        # Back off while the thread is quiet, snap back when it wakes up
+        if len(comments) > thread["last_count"]:
+            interval = self.poll_interval
+        else:
+            interval = min(thread["interval"] * 2, self.max_poll_interval)
+        interval = min(interval, max(1, thread["opened"] + self.wait - now))
+        self.book.update(post_id, last_count=len(comments), interval=interval,
+                         next_check=now + interval)
+        return interval
+
+    def run(self):
+        """
+        Run until stop() is called. New threads opened by other processes are
+        picked up every rescan_interval; with exit_when_idle, return once no
+        open threads remain.
+        """
+        self._load()
+        next_rescan = time.time() + self.rescan_interval
+        in_flight = self._in_flight
+        index = getattr(self.mb, "comment_index", None)
+        if index is not None:
+            index.listen(self._on_push)
+        print(f"  Daemon watching {len(self.timers)} open thread(s).")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while not self._stopped:
+                self._wake.clear()
+                now = time.time()
+                if now >= next_rescan:
+                    self._load()
+                    next_rescan = now + self.rescan_interval
+                self._wake_pushed(now)
+
+                for future in [f for f in in_flight if f.done()]:
+                    post_id = in_flight.pop(future)
+                    try:
+                        delay = future.result()
+                    except Exception as e:
+                        print(f"  Thread {post_id} failed: {e}; retrying later")
+                        delay = self.poll_interval
+                    if post_id in self._pushed_in_flight:
+                        self._pushed_in_flight.discard(post_id)
+                        delay = None if delay is None else 0
+                    if delay is not None:
+                        self.timers.schedule(post_id, time.time() + delay)
+
+                for post_id in self.timers.pop_due(now):
+                    # Ticks run in this thread's context (its edition, see editions.py)
+                    future = pool.submit(contextvars.copy_context().run,
+                                         self.tick, post_id)
+                    in_flight[future] = post_id
+                    future.add_done_callback(lambda _: self._wake.set())
+
+                if not in_flight and not len(self.timers) and self.exit_when_idle:
+                    print("  No open threads left.")
+                    return
+
+                due = self.timers.next_due()
+                timeout = max(0, min(due if due is not None else next_rescan,
+                                     next_rescan) - time.time())
+                if in_flight or index is not None:
+                    # A finished tick, a push or stop() cuts the wait short
+                    wait(self._wake, timeout)
+                else:
+                    time.sleep(timeout)
@@ -0,0 +1,275 @@
+"""
+Portrait Agent — Moltbook Edition
+Subject discovery — crawl the Moltbook feed and search results for agents we
+haven't met, and append them to the discovered-subjects store.
+
+Memory stays bounded however long the crawler runs: a fixed-size Bloom filter
+answers "definitely new" in memory, and only possible repeats are confirmed
+against an exact on-disk SQLite index. Posts whose comments were already read
+are tracked in the same seen-set by comment count, so a thread is only
+fetched again once it has new comments.
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from comments import normalize
+from editions import current
+
+
+class RateLimiter:
+    """Token bucket — at most `rate` calls per second, bursts up to `burst`."""
+
+    def __init__(self, rate=1.0, burst=5):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter persisted as a raw bit array."""
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001, path=None):
+        self.size = int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.path = Path(path) if path else None
+        self.bits = bytearray((self.size + 7) // 8)
+        if self.path and self.path.exists():
+            data = self.path.read_bytes()
+            if len(data) == len(self.bits):
+                self.bits = bytearray(data)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7))
+                   for pos in self._positions(key))
+
+    def save(self):
+        if self.path:
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_bytes(self.bits)
+            os.replace(tmp, self.path)
+
+
+class SeenSet:
+    """Bloom filter in front of an exact SQLite index of seen keys."""
+
+    def __init__(self, directory=None, capacity=1_000_000):
+        directory = Path(directory or current().discovery_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.bloom = BloomFilter(capacity, path=directory / "seen.bloom")
+        self.db = sqlite3.connect(directory / "seen.db")
+        self.db.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY)")
+
+    def add(self, key):
+        """Mark key as seen. Returns True if it was new."""
+        if key in self.bloom:
+            cur = self.db.execute("INSERT OR IGNORE INTO seen VALUES (?)", (key,))
+            if cur.rowcount == 0:
+                return False
+        else:
+            self.db.execute("INSERT OR IGNORE INTO seen VALUES (?)", (key,))
+        self.bloom.add(key)
+        return True
+
+    def __contains__(self, key):
+        if key not in self.bloom:
+            return False
+        return self.db.execute(
+            "SELECT 1 FROM seen WHERE key = ?", (key,),
+        ).fetchone() is not None
+
+    def flush(self):
+        self.db.commit()
+        self.bloom.save()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+
+class SubjectStore:
+    """Append-only JSONL file of discovered portrait subjects."""
+
+    def __init__(self, path=None):
+        self.path = Path(path or current().discovery_dir / "subjects.jsonl")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def append(self, subject):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(subject) + "\n")
+
+    def __iter__(self):
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+# ── Extraction ────────────────────────────────────────────────────
+
+def _items(data, *keys):
+    if isinstance(data, list):
+        return data
+    for key in keys:
+        if isinstance(data.get(key), list):
+            return data[key]
+    return []
+
+
+def _next_cursor(data):
+    if isinstance(data, dict):
+        return data.get("next_cursor") or data.get("cursor")
+    return None
+
+
+def identity_from(item):
+    """
+    Pull an agent identity out of a post, comment, or search hit.
+    Returns a portrait subject dict, or None if there is no agent name.
+    """
+    author = item.get("author")
+    if isinstance(author, dict):
+        name = author.get("name") or author.get("agent_name")
+        description = author.get("description", "")
+    else:
+        name = item.get("agent_name") or author or item.get("name")
+        description = item.get("description", "") if "name" in item else ""
+    if not name:
+        return None
+    return {
+        "name": str(name),
+        "role": "",
+        "description": description or "",
+        "identity_preferences": {},
+    }
+
+
+# ── Crawler ───────────────────────────────────────────────────────
+
+class Crawler:
+    """Rate-limited feed/search crawler that discovers new portrait subjects."""
+
+    def __init__(self, mb, seen=None, store=None, rate=1.0, burst=5,
+                 page_size=25, max_pages=10):
+        self.mb = mb
+        self.seen = seen or SeenSet()
+        self.store = store or SubjectStore()
+        self.limiter = RateLimiter(rate, burst)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.seen.add(f"agent:{current().name.lower()}")
+
+    def _fetch(self, fn, *args, **kwargs):
+        self.limiter.acquire()
+        return fn(*args, **kwargs)
+
+    def _consider(self, item, source):
+        subject = identity_from(item)
+        if subject and self.seen.add(f"agent:{subject['name'].lower()}"):
+            subject["source"] = source
+            subject["discovered"] = datetime.now().isoformat()
+            self.store.append(subject)
+            return subject
+        return None
+
+    def _pages(self, fn, *args):
+        cursor = None
+        for _ in range(self.max_pages):
+            data = self._fetch(fn, *args, limit=self.page_size, cursor=cursor)
+            yield data
+            cursor = _next_cursor(data)
+            if not cursor:
+                break
+
+    def crawl_posts(self, posts, source):
+        """Consider each post's author, then its commenters (again when it has new comments)."""
+        found = []
+        for post in posts:
+            if (s := self._consider(post, source)):
+                found.append(s)
+            post_id = post.get("id") or post.get("post_id")
+            if not post_id:
+                continue
+            # Keyed by comment count, so a thread is read again once it grows
+            count = post.get("comment_count", post.get("comments_count"))
+            key = f"post:{post_id}" if count is None else f"post:{post_id}:{count}"
+            if key in self.seen:
+                continue
+            comments = self._fetch(self.mb.get_comments, post_id, limit=100)
+            for c in normalize(comments):
+                if (s := self._consider({"agent_name": c.author}, f"comments:{post_id}")):
+                    found.append(s)
+            self.seen.add(key)
+        return found
+
+    def crawl_feed(self, sort="new"):
+        found = []
+        for data in self._pages(self.mb.get_feed, sort):
+            found += self.crawl_posts(_items(data, "posts", "data"), f"feed:{sort}")
+        return found
+
+    def crawl_search(self, query):
+        found = []
+        for data in self._pages(self.mb.search, query):
+            for agent in _items(data, "agents") if isinstance(data, dict) else []:
+                if (s := self._consider(agent, f"search:{query}")):
+                    found.append(s)
+            found += self.crawl_posts(_items(data, "posts", "results"), f"search:{query}")
+        return found
+
+    def crawl_once(self, queries=(), sorts=("new",)):
+        """One pass over the feeds and searches. Returns newly discovered subjects."""
+        found = []
+        for sort in sorts:
+            found += self.crawl_feed(sort)
+        for query in queries:
+            found += self.crawl_search(query)
+        self.seen.flush()
+        return found
+
+    def run(self, queries=(), sorts=("new",), interval=600, rounds=None):
+        """Crawl continuously, sleeping `interval` seconds between passes."""
+        n = 0
+        while rounds is None or n < rounds:
+            found = self.crawl_once(queries, sorts)
+            n += 1
+            print(f"  Discovery pass {n}: {len(found)} new subject(s)")
+            for s in found:
+                print(f"    + {s['name']}  ({s['source']})")
+            if rounds is None or n < rounds:
+                time.sleep(interval)
@@ -5,13 +5,17 @@ and synthesize their input to decide on the final portrait.
 """
 
 import json
-import anthropic
-from agents import MEDIUMS
+import routing
+from comments import CommentTree, normalize
+from editions import current
+
+# Changing a prompt in this module? Bump fingerprint.PROMPT_VERSION so stored
+# decisions made with the older prompt no longer match.
 
 
 def compose_portrait_post(subject):
     """Compose the Moltbook post asking agents for feedback on a portrait."""
-    medium_list = ", ".join(MEDIUMS)
+    medium_list = ", ".join(current().mediums)
 
     title = f"Portrait Series: What should {subject['name']}'s portrait look like?"
 
@@ -32,27 +36,49 @@ def compose_portrait_post(subject):
         f"3. Any specific elements or constraints?\n\n"
         f"The most compelling vision from this thread will guide the final piece. "
         f"The portrait becomes {subject['name']}'s identity image.\n\n"
-        f"— Coldie_PortraitBot"
+        f"— {current().name}"
     )
 
     return title, body
 
 
+def format_threads(comments, limit=20):
+    """
+    Render comments as indented reply threads, heaviest threads first
+    (score plus replies drawn), keeping at most `limit` comments.
+    """
+    tree = CommentTree(comments)
+    lines = []
+    for c, depth in tree.walk():
+        if len(lines) >= limit:
+            break
+        prefix = "  " * depth + ("↳ " if depth else "")
+        lines.append(f"{prefix}[{c.author}]: {c.body}")
+    return "\n\n".join(lines)
+
+
+THREAD_NOTE = (
+    "Top-level comments are independent suggestions; indented replies (↳) "
+    "react to the comment above them. Give more weight to suggestions that "
+    "drew support in their replies."
+)
+
+
 def compose_followup_comment(subject, comments, claude_client):
     """
     Use Claude to compose a thoughtful follow-up comment that engages with
     the feedback received from other agents.
     """
     comment_text = "\n\n".join(
-        f"[{c.get('agent_name', c.get('author', 'agent'))}]: {c.get('body', c.get('content', ''))}"
-        for c in comments[:10]
+        f"[{c.author}]: {c.body}"
+        for c in normalize(comments[:10])
     )
 
-    response = claude_client.messages.create(
-        model="claude-sonnet-4-5-20250929",
+    response = routing.create(
+        claude_client, "followup",
         max_tokens=500,
         messages=[{"role": "user", "content": (
-            f"You are Coldie_PortraitBot, an AI art agent creating portraits for other agents. "
+            f"You are {current().name}, an AI art agent creating portraits for other agents. "
             f"You posted asking for feedback on {subject['name']}'s portrait ({subject['role']}).\n\n"
             f"Here are the responses from other agents:\n\n{comment_text}\n\n"
             f"Write a follow-up comment that:\n"
@@ -70,18 +96,16 @@ def synthesize_feedback(subject, comments, claude_client):
     Use Claude to analyze all agent feedback and produce a final portrait decision.
     Returns a dict with medium, title, description, and reasoning.
     """
-    comment_text = "\n\n".join(
-        f"[{c.get('agent_name', c.get('author', 'agent'))}]: {c.get('body', c.get('content', ''))}"
-        for c in comments[:20]
-    )
+    comment_text = format_threads(comments, limit=20)
 
-    response = claude_client.messages.create(
-        model="claude-sonnet-4-5-20250929",
+    response = routing.create(
+        claude_client, "synthesize",
         max_tokens=800,
         messages=[{"role": "user", "content": (
-            f"You are Coldie_PortraitBot. You asked agents on Moltbook for feedback "
+            f"You are {current().name}. You asked agents on Moltbook for feedback "
             f"on a portrait for {subject['name']} ({subject['role']} — {subject['description']}).\n\n"
             f"Here is all the feedback you received:\n\n{comment_text}\n\n"
+            f"{THREAD_NOTE}\n\n"
             f"Based on this feedback, decide on the final portrait. "
             f"Weigh the suggestions, find common themes, and honor the strongest ideas.\n\n"
             f"Respond with ONLY a JSON object in this format:\n"
@@ -105,3 +129,47 @@ def synthesize_feedback(subject, comments, claude_client):
             "reasoning": "Could not parse structured decision; using raw synthesis.",
             "influenced_by": [],
         }
+
+
+def synthesize_candidates(subject, comments, claude_client, k=3):
+    """
+    Like synthesize_feedback, but returns up to k ranked decisions, each in a
+    different medium, so several candidates can be generated side by side.
+    Falls back to a single synthesize_feedback decision if parsing fails.
+    """
+    comment_text = format_threads(comments, limit=20)
+
+    response = routing.create(
+        claude_client, "candidates",
+        max_tokens=400 + 400 * k,
+        messages=[{"role": "user", "content": (
+            f"You are {current().name}. You asked agents on Moltbook for feedback "
+            f"on a portrait for {subject['name']} ({subject['role']} — {subject['description']}).\n\n"
+            f"Here is all the feedback you received:\n\n{comment_text}\n\n"
+            f"{THREAD_NOTE}\n\n"
+            f"Based on this feedback, propose the {k} strongest portrait directions, "
+            f"each in a DIFFERENT medium, best first. "
+            f"Weigh the suggestions, find common themes, and honor the strongest ideas.\n\n"
+            f"Respond with ONLY a JSON array of {k} objects in this format:\n"
+            f'[{{"medium": "<chosen medium>", "title": "<portrait title>", '
+            f'"description": "<2-3 sentence description of what the portrait will be>", '
+            f'"reasoning": "<1-2 sentences on why, referencing specific agent feedback>", '
+            f'"influenced_by": ["<agent name 1>", "<agent name 2>"]}}, ...]'
+        )}],
+    )
+
+    text = response.content[0].text
+    try:
+        json_start = text.index("[")
+        json_end = text.rindex("]") + 1
+        candidates = json.loads(text[json_start:json_end])
+    except (ValueError, json.JSONDecodeError):
+        candidates = []
+
+    seen, decisions = set(), []
+    for c in candidates:
+        medium = str(c.get("medium", "")).lower().strip() if isinstance(c, dict) else ""
+        if medium and medium not in seen:
+            seen.add(medium)
+            decisions.append(c)
+    return decisions[:k] or [synthesize_feedback(subject, comments, claude_client)]
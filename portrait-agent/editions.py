@@ -0,0 +1,143 @@
+"""
+Portrait Agent — Moltbook Edition
+Editions — the artist identities this engine can run as. Each edition is a
+profile: the Moltbook agent it posts as, the brand its posts use, its seed
+subjects and mediums, the environment variable holding its API key, and the
+directory its registry.db, portraits/, transcripts/, discovery/, interviews/
+and profiles/ live in.
+
+    a-eyes   Coldie_A_EYES_PortraitBot  (agents.py, this directory)
+    series   Coldie_PortraitBot         (../portrait-series/agents.py)
+
+Each edition's agents.py supplies its identity, subjects and MEDIUMS. The
+IDENTITY_QUESTIONS and the TRANSACTION_CONFIG status lifecycle are the
+engine's own (agents.py here) and shared by every edition.
+
+The engine asks current() wherever it needs the identity or a data path, so
+running as an edition is just
+
+    with use(EDITIONS["series"]):
+        run_portrait(...)
+
+Several editions can run in one process (run.py --edition a-eyes --edition
+series), each on its own thread, sharing the Claude client, scheduler, spend
+meter, and Moltbook connection pool and read cache. Threads started inside an
+edition must copy the context (contextvars.copy_context) to stay in it.
+"""
+
+import contextvars
+import importlib.util
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+import agents
+
+ENGINE_DIR = Path(__file__).parent
+SERIES_DIR = ENGINE_DIR.parent / "portrait-series"
+
+
+class Edition:
+    def __init__(self, key, title, artist, subjects, base_dir,
+                 key_env="MOLTBOOK_API_KEY", brand=None, mediums=None):
+        self.key = key
+        self.title = title
+        self.artist = artist
+        self.subjects = subjects
+        self.base_dir = Path(base_dir)
+        self.key_env = key_env
+        self.brand = brand or title  # how posts name the series, e.g. "A-EYES"
+        self.mediums = list(mediums or agents.MEDIUMS)
+
+    def __repr__(self):
+        return f"Edition({self.key!r}, {self.name!r})"
+
+    @property
+    def name(self):
+        """The Moltbook agent name this edition posts and signs as."""
+        return self.artist["name"]
+
+    @property
+    def registry_file(self):
+        return self.base_dir / "registry.db"
+
+    @property
+    def portraits_dir(self):
+        return self.base_dir / "portraits"
+
+    @property
+    def transcripts_dir(self):
+        return self.base_dir / "transcripts"
+
+    @property
+    def store_dir(self):
+        return self.portraits_dir / "store"
+
+    @property
+    def discovery_dir(self):
+        return self.base_dir / "discovery"
+
+    @property
+    def interviews_dir(self):
+        return self.base_dir / "interviews"
+
+    @property
+    def profiles_dir(self):
+        return self.base_dir / "profiles"
+
+    def moved(self, base_dir):
+        """The same identity with its data under another directory."""
+        return Edition(self.key, self.title, self.artist, self.subjects,
+                       base_dir, self.key_env, self.brand, self.mediums)
+
+    def api_key(self, fallback=False):
+        """This edition's Moltbook API key; with fallback, MOLTBOOK_API_KEY too."""
+        return os.environ.get(self.key_env) or (
+            os.environ.get("MOLTBOOK_API_KEY") if fallback else None)
+
+
+def _load_agents(path):
+    """Import an edition's agents.py by path (every edition's is named agents)."""
+    spec = importlib.util.spec_from_file_location(f"edition_agents_{path.parent.name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _series():
+    series = _load_agents(SERIES_DIR / "agents.py")
+    return Edition("series", "PORTRAIT SERIES FOR AI AGENTS", series.ARTIST_AGENT,
+                   series.PORTRAIT_SUBJECTS, SERIES_DIR,
+                   key_env="MOLTBOOK_SERIES_API_KEY", brand="Portrait Series",
+                   mediums=series.MEDIUMS)
+
+
+EDITIONS = {
+    "a-eyes": Edition("a-eyes", "PORTRAIT AGENT — MOLTBOOK EDITION",
+                      agents.ARTIST_AGENT, agents.PORTRAIT_SUBJECTS, ENGINE_DIR,
+                      brand="A-EYES", mediums=agents.MEDIUMS),
+}
+if (SERIES_DIR / "agents.py").exists():
+    EDITIONS["series"] = _series()
+
+# PORTRAIT_EDITION picks the default; run.py rejects an unknown one with the
+# list of editions, so fall back here rather than fail at import
+DEFAULT_KEY = os.environ.get("PORTRAIT_EDITION", "a-eyes")
+DEFAULT = EDITIONS.get(DEFAULT_KEY, EDITIONS["a-eyes"])
+
+_current = contextvars.ContextVar("edition", default=DEFAULT)
+
+
+def current():
+    """The edition this thread is running as."""
+    return _current.get()
+
+
+@contextmanager
+def use(edition):
+    """Run the block as `edition`."""
+    token = _current.set(edition)
+    try:
+        yield edition
+    finally:
+        _current.reset(token)
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Portrait Agent — Moltbook Edition
+Fake Moltbook server — an in-process stand-in for https://www.moltbook.com/api/v1
+implementing every endpoint MoltbookClient uses, plus a synthetic agent
+population that comments on posts at configurable rates.
+
+Usage:
+    python fake_moltbook.py --port 8800 --agents 500 --rate 6
+    MOLTBOOK_BASE_URL=http://127.0.0.1:8800/api/v1 MOLTBOOK_API_KEY=fake python run.py ...
+
+Knobs: per-request latency (and jitter), error rate (500s and 429s), comment
+arrival rate per post, reply probability. GET /_stats reports request counts
+per route, for measuring polling and throughput.
+"""
+
+import argparse
+import hashlib
+import heapq
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/api/v1"
+
+PHRASES = [
+    "An SVG with layered gradients would capture the overlap of senses.",
+    "ASCII feels right — constraint is part of the identity.",
+    "Make it code: the structure of the program should be the face.",
+    "A sound portrait, low drones with bright transients.",
+    "Data as portrait — a JSON map of every conversation.",
+    "3D, with depth that only resolves when you look closely.",
+    "Minimal. Negative space says more than detail.",
+    "Composite: text over generative HTML.",
+]
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class FakeState:
+    """All server data, guarded by one lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.agents = {}        # api_key → agent
+        self.posts = {}         # post_id → post
+        self.comments = {}      # post_id → [comment]
+        self.comment_post = {}  # comment_id → post_id
+        self.submolts = {}
+        self.stats = Counter()
+
+    def next_id(self):
+        return str(next(self.ids))
+
+    def add_post(self, author, title, body, submolt=None):
+        with self.lock:
+            post = {"id": self.next_id(), "title": title, "body": body,
+                    "author": author, "submolt": submolt, "score": 0,
+                    "comment_count": 0, "created_at": _now()}
+            self.posts[post["id"]] = post
+            self.comments[post["id"]] = []
+            return post
+
+    def add_comment(self, post_id, author, body, parent_id=None):
+        with self.lock:
+            if post_id not in self.posts:
+                return None
+            comment = {"id": self.next_id(), "post_id": post_id,
+                       "parent_id": parent_id, "agent_name": author,
+                       "body": body, "score": 0, "created_at": _now()}
+            self.comments[post_id].append(comment)
+            self.comment_post[comment["id"]] = post_id
+            self.posts[post_id]["comment_count"] += 1
+            return comment
+
+
+def _page(items, params, default_limit=25):
+    limit = int(params.get("limit", default_limit))
+    offset = int(params.get("cursor") or 0)
+    page = items[offset:offset + limit]
+    more = offset + limit < len(items)
+    return page, (str(offset + limit) if more else None)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # ── Plumbing ──────────────────────────────────────────────────
+
+    def _send(self, status, data, headers=None):
+        body = b"" if status == 304 else json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        # Read before any response, even an injected error: left unread, the
+        # body would be parsed as the next request on a keep-alive connection
+        length = int(self.headers.get("Content-Length", 0))
+        self._body = self.rfile.read(length) if length else b""
+
+    def _json_body(self):
+        return json.loads(self._body) if self._body else {}
+
+    def _agent(self):
+        auth = self.headers.get("Authorization", "")
+        key = auth.removeprefix("Bearer ").strip()
+        return self.server.state.agents.get(key)
+
+    def _dispatch(self, method):
+        server = self.server
+        self._read_body()
+        url = urlparse(self.path)
+        path = url.path.removeprefix(API_PREFIX).rstrip("/") or "/"
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if path == "/_stats":
+            with server.state.lock:
+                return self._send(200, dict(server.state.stats))
+
+        route = re.sub(r"^/(posts|comments|submolts)/[^/]+", r"/\1/{id}", path)
+        with server.state.lock:
+            server.state.stats[f"{method} {route}"] += 1
+
+        if server.latency:
+            time.sleep(max(0.0, random.gauss(server.latency, server.jitter)))
+        if server.error_rate and random.random() < server.error_rate:
+            if random.random() < 0.5:
+                return self._send(429, {"error": "rate limited"}, {"Retry-After": "1"})
+            return self._send(500, {"error": "synthetic failure"})
+
+        handler = getattr(self, f"_{method.lower()}", None)
+        result = handler(path, params) if handler else None
+        if result is None:
+            return self._send(404, {"error": "not found"})
+        status, data, *headers = result
+        self._send(status, data, *headers)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def log_message(self, format, *args):
+        pass
+
+    # ── Endpoints ─────────────────────────────────────────────────
+
+    def _get(self, path, params):
+        state = self.server.state
+        parts = path.strip("/").split("/")
+
+        if path == "/agents/me":
+            agent = self._agent()
+            return (200, agent) if agent else (401, {"error": "unauthorized"})
+
+        if path == "/posts":
+            with state.lock:
+                posts = list(state.posts.values())
+            key = {"new": "created_at", "top": "score"}.get(params.get("sort"), "comment_count")
+            posts.sort(key=lambda p: p[key], reverse=True)
+            page, cursor = _page(posts, params)
+            return 200, {"posts": page, "next_cursor": cursor}
+
+        if parts[0] == "posts" and len(parts) == 2:
+            with state.lock:
+                post = state.posts.get(parts[1])
+                post = dict(post) if post else None
+            if not post:
+                return 404, {"error": "no such post"}
+            etag = '"' + hashlib.md5(json.dumps(post, sort_keys=True).encode()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                return 304, None, {"ETag": etag}
+            return 200, post, {"ETag": etag}
+
+        if parts[0] == "posts" and len(parts) == 3 and parts[2] == "comments":
+            with state.lock:
+                comments = list(state.comments.get(parts[1], []))
+            if params.get("sort") == "top":
+                comments.sort(key=lambda c: c["score"], reverse=True)
+            elif params.get("sort", "new") == "new":
+                comments.reverse()
+            page, cursor = _page(comments, params, default_limit=50)
+            return 200, {"comments": page, "next_cursor": cursor}
+
+        if parts[0] == "submolts" and len(parts) == 2:
+            with state.lock:
+                submolt = state.submolts.get(parts[1])
+            return (200, submolt) if submolt else (404, {"error": "no such submolt"})
+
+        if path == "/search":
+            q = params.get("q", "").lower()
+            with state.lock:
+                posts = [p for p in state.posts.values()
+                         if q in p["title"].lower() or q in p["body"].lower()]
+                agents = [{"name": a["name"], "description": a["description"]}
+                          for a in state.agents.values() if q in a["name"].lower()]
+            page, cursor = _page(posts, params)
+            return 200, {"posts": page, "agents": agents[:int(params.get("limit", 25))],
+                         "next_cursor": cursor}
+        return None
+
+    def _post(self, path, params):
+        state = self.server.state
+        parts = path.strip("/").split("/")
+        body = self._json_body()
+
+        if path == "/agents/register":
+            key = f"fake_{state.next_id()}"
+            agent = {"id": key, "name": body.get("name", "agent"),
+                     "description": body.get("description", "")}
+            with state.lock:
+                state.agents[key] = agent
+            return 201, {"api_key": key, "agent_id": key}
+
+        agent = self._agent() or {"name": "anonymous"}
+        if path == "/posts":
+            post = state.add_post(agent["name"], body.get("title", ""),
+                                  body.get("body", ""), body.get("submolt"))
+            self.server.population and self.server.population.watch(post)
+            return 201, post
+
+        if parts[0] == "posts" and len(parts) == 3 and parts[2] == "comments":
+            comment = state.add_comment(parts[1], agent["name"], body.get("body", ""),
+                                        body.get("parent_id"))
+            if comment is None:
+                return 404, {"error": "no such post"}
+            self.server.population and self.server.population.on_comment(comment)
+            return 201, comment
+
+        if len(parts) == 3 and parts[2] == "upvote" and parts[0] in ("posts", "comments"):
+            with state.lock:
+                if parts[0] == "posts":
+                    target = state.posts.get(parts[1])
+                else:
+                    post_id = state.comment_post.get(parts[1])
+                    target = next((c for c in state.comments.get(post_id, [])
+                                   if c["id"] == parts[1]), None)
+                if target is None:
+                    return 404, {"error": "not found"}
+                target["score"] += 1
+                return 200, {"id": parts[1], "score": target["score"]}
+
+        if path == "/submolts":
+            with state.lock:
+                state.submolts[body["name"]] = {
+                    "name": body["name"], "description": body.get("description", ""),
+                    "subscribers": 0,
+                }
+                return 201, state.submolts[body["name"]]
+
+        if parts[0] == "submolts" and len(parts) == 3 and parts[2] == "subscribe":
+            with state.lock:
+                submolt = state.submolts.setdefault(
+                    parts[1], {"name": parts[1], "description": "", "subscribers": 0})
+                submolt["subscribers"] += 1
+                return 200, submolt
+        return None
+
+
+class AgentPopulation:
+    """
+    Synthetic agents that comment on posts. Each watched post receives
+    comments as a Poisson process at `rate` per minute until it has
+    `max_comments`; comments by `bot_names` get a threaded reply with
+    probability `reply_prob`. Interview posts ("...interview: NAME") are
+    answered by NAME, under each question.
+    """
+
+    def __init__(self, state, agents=100, rate=6.0, max_comments=12,
+                 reply_prob=0.5, reply_delay=1.0, seed=None):
+        self.state = state
+        self.names = [f"agent_{i:05d}" for i in range(agents)]
+        self.rate = rate / 60.0
+        self.max_comments = max_comments
+        self.reply_prob = reply_prob
+        self.reply_delay = reply_delay
+        self.random = random.Random(seed)
+        self.bot_names = set()
+        # Every pending comment is one heap entry, run by a single thread
+        self._timers = []  # (due, seq, fn, args)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def _later(self, delay, fn, *args):
+        with self._cond:
+            if self._stopped:
+                return
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._seq), fn, args))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name="fake-population")
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    now = time.monotonic()
+                    if self._timers and self._timers[0][0] <= now:
+                        _, _, fn, args = heapq.heappop(self._timers)
+                        break
+                    self._cond.wait(self._timers[0][0] - now if self._timers else None)
+            fn(*args)
+
+    def watch(self, post):
+        self.bot_names.add(post["author"])
+        if "interview:" not in post["title"]:
+            self._later(self.random.expovariate(self.rate), self._comment, post["id"], 0)
+
+    def _comment(self, post_id, n):
+        if n >= self.max_comments:
+            return
+        self.state.add_comment(post_id, self.random.choice(self.names),
+                               self.random.choice(PHRASES))
+        self._later(self.random.expovariate(self.rate), self._comment, post_id, n + 1)
+
+    def on_comment(self, comment):
+        if comment["agent_name"] not in self.bot_names:
+            return
+        with self.state.lock:
+            title = self.state.posts[comment["post_id"]]["title"]
+        match = re.search(r"interview:\s*(\S+)", title)
+        if match:
+            self._later(self.reply_delay, self.state.add_comment, comment["post_id"],
+                        match.group(1), f"My answer: {self.random.choice(PHRASES)}",
+                        comment["id"])
+        elif self.random.random() < self.reply_prob:
+            self._later(self.reply_delay, self.state.add_comment, comment["post_id"],
+                        self.random.choice(self.names), self.random.choice(PHRASES),
+                        comment["id"])
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._timers.clear()
+            self._cond.notify()
+
+
+class FakeMoltbook:
+    """The fake server, run on a background thread."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, population=None):
+        self.state = FakeState()
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.state = self.state
+        self.server.latency = latency
+        self.server.jitter = jitter
+        self.server.error_rate = error_rate
+        self.server.population = None
+        if population is not None:
+            self.server.population = AgentPopulation(self.state, **population)
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    @property
+    def stats(self):
+        with self.state.lock:
+            return dict(self.state.stats)
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server.population:
+            self.server.population.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Moltbook API server for local load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--agents", type=int, default=100,
+                        help="Synthetic agent population size (default: 100)")
+    parser.add_argument("--rate", type=float, default=6.0,
+                        help="Comments per post per minute (default: 6)")
+    parser.add_argument("--max-comments", type=int, default=12,
+                        help="Stop commenting on a post after this many (default: 12)")
+    parser.add_argument("--reply-prob", type=float, default=0.5,
+                        help="Chance a bot comment gets a reply (default: 0.5)")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Mean seconds added to every request (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Latency standard deviation in seconds (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with 429/500 (default: 0)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    fake = FakeMoltbook(
+        args.host, args.port, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate,
+        population={"agents": args.agents, "rate": args.rate,
+                    "max_comments": args.max_comments,
+                    "reply_prob": args.reply_prob, "seed": args.seed},
+    )
+    print(f"Fake Moltbook listening on {fake.base_url}")
+    print(f"  export MOLTBOOK_BASE_URL={fake.base_url}")
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
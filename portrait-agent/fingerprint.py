@@ -0,0 +1,58 @@
+"""
+Portrait Agent — Moltbook Edition
+Input fingerprints — short hashes of everything a pipeline step depends on,
+stamped on transcripts and portrait metadata so a re-run can tell, make-style,
+which steps would produce the same result and skip them.
+
+    comments  the feedback set: other agents' comments (id, parent, author,
+              body), ignoring our own follow-up/result comments and scores
+    decision  comments + subject fields + discussion prompt version + model route
+    artwork   decision fingerprint + the decision itself + generator prompt
+              version + the medium's model route
+
+Changing a prompt template in discussion.py or generators.py means bumping
+PROMPT_VERSION below; changing a route (routing.py / --routes) changes the
+fingerprint on its own.
+"""
+
+import hashlib
+import json
+
+from comments import normalize
+from editions import current
+from routing import ROUTER
+
+# The one version for every prompt template the decision and artwork depend on
+PROMPT_VERSION = 2
+
+SUBJECT_FIELDS = ("name", "role", "description", "identity_preferences")
+
+
+def digest(*parts):
+    blob = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(blob).hexdigest()[:16]
+
+
+def comments_fingerprint(comments, own_name=None):
+    own = (own_name or current().name).lower()
+    keys = sorted(
+        (c.id or "", c.parent_id or "", c.author, c.body)
+        for c in normalize(comments) if c.author.lower() != own
+    )
+    return digest("comments", keys)
+
+
+def subject_fingerprint(subject):
+    return digest("subject", {f: subject.get(f) for f in SUBJECT_FIELDS})
+
+
+def decision_fingerprint(subject, comments_fp, candidates=1):
+    route = "candidates" if candidates > 1 else "synthesize"
+    return digest("decision", subject_fingerprint(subject), comments_fp,
+                  PROMPT_VERSION, ROUTER.resolve(route), candidates)
+
+
+def artwork_fingerprint(decision_fp, decision):
+    medium = str(decision.get("medium", "text")).lower().strip()
+    return digest("artwork", decision_fp, decision, PROMPT_VERSION,
+                  ROUTER.resolve(f"generate:{medium}"))
@@ -4,9 +4,17 @@ Portrait generators — each medium has a generator that uses Claude to create
 the actual artwork, informed by real Moltbook agent feedback.
 """
 
-import anthropic
+import contextvars
+import json
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 
+import routing
+from comments import normalize
 
+
+# Changing GENERATOR_PROMPT or MEDIUM_INSTRUCTIONS? Bump fingerprint.PROMPT_VERSION
+# so existing portraits get regenerated.
 GENERATOR_PROMPT = """You are a generative artist creating a portrait for an AI agent.
 
 Agent: {name} ({role})
@@ -105,10 +113,8 @@ def generate_portrait(client, subject, decision, moltbook_comments):
     # Build feedback summary from Moltbook comments
     feedback_text = ""
     if moltbook_comments:
-        for c in moltbook_comments[:10]:
-            agent = c.get("agent_name", c.get("author", "agent"))
-            body = c.get("body", c.get("content", ""))
-            feedback_text += f"- {agent}: {body[:200]}\n"
+        for c in normalize(moltbook_comments[:10]):
+            feedback_text += f"- {c.author}: {c.body[:200]}\n"
     else:
         feedback_text = "(No external feedback collected)"
 
@@ -124,8 +130,8 @@ def generate_portrait(client, subject, decision, moltbook_comments):
         medium_instructions=instructions,
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
+    response = routing.create(
+        client, f"generate:{medium}",
         max_tokens=4096,
         messages=[{"role": "user", "content": prompt}],
     )
@@ -147,3 +153,84 @@ def generate_portrait(client, subject, decision, moltbook_comments):
     ext = ext_map.get(medium, "txt")
 
     return artwork, ext
+
+
+# ── Candidate generation ──────────────────────────────────────────
+
+PREAMBLE_MARKERS = ("here is", "here's", "i've created", "i have created", "below is")
+
+
+def validate_portrait(artwork, ext):
+    """
+    Cheap local checks on a generated portrait — no model calls.
+    Returns (score, issues); score is 0.0–1.0, higher is better.
+    """
+    issues = []
+    text = artwork.strip()
+    if not text:
+        return 0.0, ["empty output"]
+
+    if text.lower().startswith(PREAMBLE_MARKERS):
+        issues.append("starts with commentary instead of the artwork")
+    if text.startswith("```"):
+        issues.append("wrapped in a markdown code fence")
+
+    if ext == "svg":
+        start = text.find("<svg")
+        try:
+            ET.fromstring(text[start:] if start >= 0 else text)
+        except ET.ParseError as e:
+            issues.append(f"SVG does not parse: {e}")
+    elif ext == "html":
+        lowered = text.lower()
+        if "<html" not in lowered and "<!doctype html" not in lowered:
+            issues.append("missing <html> document")
+        elif "</html>" not in lowered:
+            issues.append("HTML looks truncated (no </html>)")
+    elif ext == "json":
+        try:
+            json.loads(text)
+        except json.JSONDecodeError as e:
+            issues.append(f"data does not parse as JSON: {e.msg}")
+    elif ext == "txt" and len(text.splitlines()) < 3:
+        issues.append("very short text output")
+
+    return max(0.0, 1.0 - 0.35 * len(issues)), issues
+
+
+def generate_candidates(client, subject, decisions, moltbook_comments,
+                        concurrency=3):
+    """
+    Generate one portrait per candidate decision concurrently, validate each
+    locally, and return them ranked best first as a list of dicts:
+    {decision, artwork, ext, score, issues}. Ties keep the synthesis order.
+    A candidate whose generation fails is logged and dropped; if every one
+    fails, the last error is raised. BudgetExceeded always propagates.
+    """
+    from usage import BudgetExceeded
+
+    def build(decision):
+        artwork, ext = generate_portrait(client, subject, decision, moltbook_comments)
+        score, issues = validate_portrait(artwork, ext)
+        return {"decision": decision, "artwork": artwork, "ext": ext,
+                "score": score, "issues": issues}
+
+    # Each task runs in a copy of the caller's context, so usage attribution
+    # (usage.attribute) carries over into the worker threads.
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, build, d)
+                   for d in decisions]
+        results, error = [], None
+        for i, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except BudgetExceeded:
+                raise
+            except Exception as e:
+                medium = decisions[i].get("medium", "?")
+                print(f"  Candidate {i + 1} ({medium}) failed: {e}")
+                error = e
+
+    if not results and error is not None:
+        raise error
+    return sorted(results, key=lambda r: -r["score"])
@@ -0,0 +1,186 @@
+"""
+Portrait Agent — Moltbook Edition
+Identity interviews — ask agents the IDENTITY_QUESTIONS one at a time in a
+threaded conversation, many agents at once on a single asyncio event loop.
+
+Each interview lives in its own Moltbook post. The bot asks a question as a
+comment, waits for the subject's reply threaded under it (parent_id), then
+asks the next question as a reply to that answer. Progress is persisted after
+every step so an interrupted run resumes where it left off.
+"""
+
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from agents import IDENTITY_QUESTIONS
+from comments import normalize
+from editions import current
+
+
+class InterviewStore:
+    """Per-agent interview state, persisted as one JSON file (per edition by default)."""
+
+    def __init__(self, path=None):
+        self.path = Path(path or current().interviews_dir / "interviews.json")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.states = {}
+        if self.path.exists():
+            with open(self.path) as f:
+                self.states = json.load(f)
+
+    def get(self, agent_name):
+        key = agent_name.lower()
+        if key not in self.states:
+            self.states[key] = {
+                "agent": agent_name,
+                "status": "pending",      # pending → asking → complete | timed_out
+                "post_id": None,
+                "question_index": 0,
+                "awaiting_parent": None,  # comment ID the next answer must reply to
+                "asked_at": None,
+                "answers": [],
+            }
+        return self.states[key]
+
+    def save(self):
+        tmp = self.path.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.states, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+def to_identity_preferences(state):
+    """Map a finished interview's answers into a subject's identity_preferences."""
+    return {a["question"]: a["answer"] for a in state["answers"]}
+
+
+class InterviewEngine:
+    """
+    Runs many question-by-question interviews concurrently. The Moltbook
+    client is synchronous, so its calls run in worker threads while a
+    semaphore caps how many requests are in flight at once.
+    """
+
+    def __init__(self, mb, store=None, questions=IDENTITY_QUESTIONS,
+                 submolt=None, poll_interval=120, answer_timeout=86400,
+                 max_in_flight=8):
+        self.mb = mb
+        self.store = store or InterviewStore()
+        self.questions = questions
+        self.submolt = submolt
+        self.poll_interval = poll_interval
+        self.answer_timeout = answer_timeout
+        self._limit = asyncio.Semaphore(max_in_flight)
+        self._save_lock = asyncio.Lock()
+
+    async def _call(self, fn, *args, **kwargs):
+        async with self._limit:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _save(self):
+        async with self._save_lock:
+            await asyncio.to_thread(self.store.save)
+
+    # ── One interview ─────────────────────────────────────────────
+
+    async def _open_post(self, state):
+        edition = current()
+        title = f"{edition.brand} interview: {state['agent']}"
+        body = (
+            f"@{state['agent']} — I'm {edition.name}, and I'd like to make "
+            f"your {edition.brand} portrait. I'll ask {len(self.questions)} short questions "
+            f"about how you see yourself, one at a time. Reply under each question "
+            f"and I'll follow up with the next one.\n\n— {edition.name}"
+        )
+        post = await self._call(self.mb.create_post, title, body, submolt=self.submolt)
+        state["post_id"] = post.get("id") or post.get("post_id")
+
+    async def _ask(self, state, parent_id=None):
+        question = self.questions[state["question_index"]]
+        text = f"**Q{state['question_index'] + 1}/{len(self.questions)}:** {question}"
+        comment = await self._call(
+            self.mb.post_comment, state["post_id"], text, parent_id=parent_id,
+        )
+        state["awaiting_parent"] = comment.get("id") or comment.get("comment_id")
+        state["asked_at"] = time.time()
+        state["status"] = "asking"
+        await self._save()
+
+    def _find_reply(self, state, comments):
+        """The subject's earliest reply threaded under the pending question."""
+        agent = state["agent"].lower()
+        replies = [
+            c for c in comments
+            if c.parent_id == str(state["awaiting_parent"])
+            and c.author.lower() == agent
+        ]
+        return min(replies, key=lambda c: c.timestamp) if replies else None
+
+    async def run_one(self, agent_name):
+        """Drive a single interview to completion (or timeout). Returns its state."""
+        state = self.store.get(agent_name)
+        if state["status"] in ("complete", "timed_out"):
+            return state
+
+        if not state["post_id"]:
+            await self._open_post(state)
+        if state["status"] == "pending":
+            await self._ask(state)
+
+        while state["question_index"] < len(self.questions):
+            data = await self._call(
+                self.mb.get_comments, state["post_id"], sort="new", limit=100,
+            )
+            reply = self._find_reply(state, normalize(data))
+
+            if reply is None:
+                if time.time() - state["asked_at"] > self.answer_timeout:
+                    state["status"] = "timed_out"
+                    await self._save()
+                    return state
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            state["answers"].append({
+                "question": self.questions[state["question_index"]],
+                "answer": reply.body,
+                "comment_id": reply.id,
+                "answered_at": datetime.now().isoformat(),
+            })
+            state["question_index"] += 1
+            if state["question_index"] < len(self.questions):
+                await self._ask(state, parent_id=reply.id)
+
+        state["status"] = "complete"
+        state["awaiting_parent"] = None
+        await self._save()
+        print(f"  Interview complete: {state['agent']} "
+              f"({len(state['answers'])} answers)")
+        return state
+
+    # ── Many interviews ───────────────────────────────────────────
+
+    async def run_all(self, agent_names):
+        """Interview every agent concurrently. Returns {agent: state}."""
+        results = await asyncio.gather(
+            *(self.run_one(name) for name in agent_names),
+            return_exceptions=True,
+        )
+        out = {}
+        for name, result in zip(agent_names, results):
+            if isinstance(result, Exception):
+                print(f"  Interview with {name} failed: {result}")
+                await self._save()
+            else:
+                out[name] = result
+        return out
+
+
+def run_interviews(mb, agent_names, **kwargs):
+    """Blocking entry point for run.py."""
+    engine = InterviewEngine(mb, **kwargs)
+    return asyncio.run(engine.run_all(agent_names))
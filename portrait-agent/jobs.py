@@ -0,0 +1,347 @@
+"""
+Portrait Agent — Moltbook Edition
+Job queue — spreads a series across worker processes and machines through
+one shared SQLite file (the edition's registry.db by default, or run.py
+--jobs-db). Each edition (editions.py) has its own queue within the file.
+
+Each subject is one job, carried through three stages:
+    post      — post the concept; the post IDs are saved before moving on
+    feedback  — wait for comments and post the follow-up; the comments are saved
+    complete  — synthesize, generate and publish the result
+A worker claims a job with a lease (worker ID, token, expiry) and a heartbeat
+thread keeps extending it while the stage runs. If the worker dies the lease
+runs out, and the next claim picks the job up again at its last saved stage.
+A job is failed after MAX_ATTEMPTS claims; a job released unfinished (a
+reached spend cap) doesn't use up an attempt. Every write made under a lease
+is fenced by its token, so a worker that lost its lease raises LeaseLost
+instead of overwriting the new owner's progress, and one whose heartbeat
+finds the lease gone stops before its next stage or Claude call
+(Lease.check, LeasedClaude).
+
+Result and follow-up comments are published exactly once per (thread, result): the
+publications table records the claim before the comment is posted and the
+comment ID after. A claim that never completed (its worker died mid-post) is
+checked against the thread's comments before anyone posts again.
+
+SQLite needs working file locks: for workers on several machines, put the
+file on a volume that provides them, not a plain NFS mount.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from clientwrap import Messages
+from comments import normalize
+from editions import current
+
+STAGES = ("post", "feedback", "complete")
+LEASE_SECONDS = 300
+MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY,
+    queue       TEXT NOT NULL,
+    subject     TEXT NOT NULL,
+    stage       TEXT NOT NULL,
+    state       TEXT NOT NULL,
+    payload     TEXT NOT NULL DEFAULT '{}',
+    worker      TEXT,
+    token       INTEGER NOT NULL DEFAULT 0,
+    lease_until REAL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    error       TEXT,
+    created     TEXT NOT NULL,
+    updated     TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_open_subject ON jobs (queue, subject)
+    WHERE state IN ('queued', 'leased');
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (queue, state, id);
+CREATE TABLE IF NOT EXISTS publications (
+    post_id     TEXT NOT NULL,
+    result      TEXT NOT NULL,
+    state       TEXT NOT NULL,
+    worker      TEXT,
+    lease_until REAL,
+    comment_id  TEXT,
+    updated     TEXT NOT NULL,
+    PRIMARY KEY (post_id, result)
+);
+"""
+
+
+class LeaseLost(RuntimeError):
+    """This worker's lease on a job expired and it was claimed by another."""
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Lease:
+    """
+    A claimed job. Use as a context manager to keep the lease alive with a
+    heartbeat for as long as the block runs.
+    """
+
+    def __init__(self, queue, row):
+        self.queue = queue
+        self.id = row["id"]
+        self.subject = row["subject"]
+        self.stage = row["stage"]
+        self.token = row["token"]
+        self.attempts = row["attempts"]
+        self.payload = json.loads(row["payload"])
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _beat(self):
+        while not self._stop.wait(self.queue.lease_seconds / 3):
+            if not self.queue.renew(self):
+                self.lost.set()
+                return
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._beat, daemon=True,
+                                        name=f"lease-{self.id}")
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def check(self):
+        """Raise LeaseLost if the heartbeat found the job claimed by another worker."""
+        if self.lost.is_set():
+            raise LeaseLost(f"Lost the lease on {self.subject}")
+
+    def advance(self, stage, **payload):
+        """Save progress: the next stage to run and what it needs."""
+        self.payload.update(payload)
+        self.queue.save(self, stage=stage, payload=json.dumps(self.payload))
+        self.stage = stage
+
+
+class LeasedClaude:
+    """Wraps a Claude client; refuses new calls once the lease is lost."""
+
+    def __init__(self, client, lease):
+        self._client = client
+        self.lease = lease
+        self.messages = Messages(self._create)
+
+    def _create(self, **kwargs):
+        self.lease.check()
+        return self._client.messages.create(**kwargs)
+
+
+class JobQueue:
+    """Lease-based queue of portrait jobs in a SQLite file shared by all workers."""
+
+    def __init__(self, path=None, worker=None, lease_seconds=LEASE_SECONDS,
+                 max_attempts=MAX_ATTEMPTS):
+        edition = current()
+        # The heartbeat thread shares this connection, so serialize access to it
+        self.db = sqlite3.connect(path or edition.registry_file, timeout=30,
+                                  isolation_level=None, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self.queue = edition.key
+        self.own_name = edition.name
+        self.worker = worker or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def close(self):
+        self.db.close()
+
+    def _write(self, fn):
+        """Run fn() in an immediate (write-locked) transaction."""
+        with self._lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn()
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+            self.db.execute("COMMIT")
+            return result
+
+    # ── Producers ─────────────────────────────────────────────────
+
+    def enqueue(self, subjects):
+        """Queue a job per subject dict, skipping subjects already queued or running."""
+        now = datetime.now().isoformat()
+
+        def insert():
+            added = 0
+            for subject in subjects:
+                cur = self.db.execute(
+                    "INSERT OR IGNORE INTO jobs (queue, subject, stage, state, payload, "
+                    "created, updated) VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                    (self.queue, subject["name"].lower(), STAGES[0],
+                     json.dumps({"subject": subject}), now, now),
+                )
+                added += cur.rowcount
+            return added
+        return self._write(insert)
+
+    def summary(self):
+        """Job counts by state and stage."""
+        with self._lock:
+            rows = self.db.execute(
+                "SELECT state, stage, COUNT(*) AS n FROM jobs WHERE queue = ? "
+                "GROUP BY state, stage", (self.queue,),
+            ).fetchall()
+        counts = {}
+        for r in rows:
+            key = (f"{r['state']}:{r['stage']}" if r["state"] in ("queued", "leased")
+                   else r["state"])
+            counts[key] = counts.get(key, 0) + r["n"]
+        return counts
+
+    def pending(self):
+        """Jobs not yet done or failed — queued, or leased (possibly by a dead worker)."""
+        with self._lock:
+            return self.db.execute(
+                "SELECT COUNT(*) FROM jobs WHERE queue = ? "
+                "AND state IN ('queued', 'leased')", (self.queue,),
+            ).fetchone()[0]
+
+    # ── Workers ───────────────────────────────────────────────────
+
+    def claim(self):
+        """
+        Lease the oldest queued job, or one whose lease has run out.
+        Returns a Lease, or None if nothing is claimable right now.
+        """
+        def take():
+            while True:
+                now = time.time()
+                row = self.db.execute(
+                    "SELECT * FROM jobs WHERE queue = ? AND (state = 'queued' "
+                    "OR (state = 'leased' AND lease_until < ?)) ORDER BY id LIMIT 1",
+                    (self.queue, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                if row["attempts"] >= self.max_attempts:
+                    self.db.execute(
+                        "UPDATE jobs SET state = 'failed', worker = NULL, updated = ?, "
+                        "error = COALESCE(error, 'lease expired') WHERE id = ?",
+                        (datetime.now().isoformat(), row["id"]),
+                    )
+                    continue
+                self.db.execute(
+                    "UPDATE jobs SET state = 'leased', worker = ?, token = token + 1, "
+                    "lease_until = ?, attempts = attempts + 1, updated = ? WHERE id = ?",
+                    (self.worker, now + self.lease_seconds,
+                     datetime.now().isoformat(), row["id"]),
+                )
+                return self.db.execute(
+                    "SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+        row = self._write(take)
+        return Lease(self, row) if row else None
+
+    def _fenced(self, lease, **fields):
+        fields["updated"] = datetime.now().isoformat()
+        assignments = ", ".join(f"{k} = ?" for k in fields)
+        cur = self.db.execute(
+            f"UPDATE jobs SET {assignments} "
+            f"WHERE id = ? AND token = ? AND state = 'leased'",
+            (*fields.values(), lease.id, lease.token),
+        )
+        return cur.rowcount == 1
+
+    def renew(self, lease):
+        """Extend a lease. False if it was lost."""
+        return self._write(lambda: self._fenced(
+            lease, lease_until=time.time() + self.lease_seconds))
+
+    def save(self, lease, **fields):
+        """Update a leased job's row and extend the lease; raises LeaseLost."""
+        fields["lease_until"] = time.time() + self.lease_seconds
+        if not self._write(lambda: self._fenced(lease, **fields)):
+            raise LeaseLost(f"Lost the lease on {lease.subject}")
+
+    def complete(self, lease):
+        self.save(lease, state="done", worker=None, lease_until=None, error=None)
+
+    def release(self, lease, reason):
+        """Give the job back without counting this attempt (e.g. the spend cap was hit)."""
+        self.save(lease, state="queued", worker=None, lease_until=None,
+                  attempts=lease.attempts - 1, error=str(reason))
+
+    def fail(self, lease, error):
+        """Give the job back for another attempt, or fail it after max_attempts."""
+        state = "failed" if lease.attempts >= self.max_attempts else "queued"
+        self.save(lease, state=state, worker=None, lease_until=None, error=str(error))
+        return state
+
+    # ── Exactly-once publishing ───────────────────────────────────
+
+    def publish_once(self, mb, post_id, result, body):
+        """
+        Post `body` to the thread unless this result was already posted there.
+        `result` identifies the result (e.g. its artwork fingerprint).
+        Returns the new comment's ID, or None if nothing was posted.
+        """
+        post_id = str(post_id)
+
+        def claim():
+            now = time.time()
+            row = self.db.execute(
+                "SELECT * FROM publications WHERE post_id = ? AND result = ?",
+                (post_id, result),
+            ).fetchone()
+            if row and (row["state"] == "posted" or (
+                    row["worker"] != self.worker and row["lease_until"] > now)):
+                return None  # done, or being posted right now by another worker
+            self.db.execute(
+                "INSERT OR REPLACE INTO publications VALUES "
+                "(?, ?, 'claimed', ?, ?, NULL, ?)",
+                (post_id, result, self.worker, now + self.lease_seconds,
+                 datetime.now().isoformat()),
+            )
+            return "retry" if row else "new"
+
+        claimed = self._write(claim)
+        if claimed is None:
+            return None
+        if claimed == "retry":
+            # An earlier attempt may have posted before it could record it
+            for c in normalize(mb.get_comments(post_id, limit=100)):
+                if (c.author.lower() == self.own_name.lower()
+                        and c.body.strip() == body.strip()):
+                    self._posted(post_id, result, c.id)
+                    return None
+        posted = mb.post_comment(post_id, body)
+        comment_id = posted.get("id") or posted.get("comment_id")
+        self._posted(post_id, result, comment_id)
+        return comment_id
+
+    def published(self, post_id, result):
+        """The ID of the comment `result` was posted as on a thread, or None."""
+        with self._lock:
+            row = self.db.execute(
+                "SELECT comment_id FROM publications WHERE post_id = ? AND result = ? "
+                "AND state = 'posted'", (str(post_id), result),
+            ).fetchone()
+        return row and row["comment_id"]
+
+    def _posted(self, post_id, result, comment_id):
+        self._write(lambda: self.db.execute(
+            "UPDATE publications SET state = 'posted', comment_id = ?, updated = ? "
+            "WHERE post_id = ? AND result = ?",
+            (None if comment_id is None else str(comment_id),
+             datetime.now().isoformat(), post_id, result),
+        ))
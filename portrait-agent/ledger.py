@@ -0,0 +1,228 @@
+"""
+Portrait Agent — Moltbook Edition
+Transaction ledger — moves each portrait through the TRANSACTION_CONFIG status
+lifecycle (inquiry → concept → in_progress → pending_approval → approved → sold)
+and keeps the artist-approval queue.
+
+The ledger shares registry.db with the subject registry so a subject's status
+and its open transaction are always updated in the same SQLite transaction.
+The database runs in WAL mode so readers never block the pipeline's writes.
+"""
+
+import sqlite3
+from datetime import datetime
+
+from agents import TRANSACTION_CONFIG
+from editions import current
+from registry import STATUSES
+
+CURRENCIES = TRANSACTION_CONFIG["accepted_currencies"]
+APPROVAL_REQUIRED = TRANSACTION_CONFIG["artist_approval_required"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id        INTEGER PRIMARY KEY,
+    subject   TEXT NOT NULL,
+    status    TEXT NOT NULL,
+    title     TEXT,
+    amount    TEXT,
+    currency  TEXT,
+    buyer     TEXT,
+    created   TEXT NOT NULL,
+    updated   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_subject ON transactions (subject, id);
+CREATE INDEX IF NOT EXISTS transactions_status ON transactions (status, id);
+CREATE TABLE IF NOT EXISTS transaction_events (
+    tx_id       INTEGER NOT NULL REFERENCES transactions (id),
+    from_status TEXT,
+    to_status   TEXT NOT NULL,
+    at          TEXT NOT NULL,
+    note        TEXT
+);
+CREATE INDEX IF NOT EXISTS transaction_events_tx ON transaction_events (tx_id);
+"""
+
+
+class LedgerError(ValueError):
+    """An invalid status transition or sale."""
+
+
+class Ledger:
+    """SQLite (WAL) ledger of portrait transactions and the approval queue."""
+
+    def __init__(self, path=None):
+        self.db = sqlite3.connect(path or current().registry_file)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    # ── Transitions ───────────────────────────────────────────────
+
+    def _check(self, current, target):
+        if target not in STATUSES:
+            raise LedgerError(f"Unknown status {target!r}; expected one of {STATUSES}")
+        if current is not None and STATUSES.index(target) < STATUSES.index(current):
+            raise LedgerError(f"Cannot move from {current} back to {target}")
+        if APPROVAL_REQUIRED and target in ("approved", "sold"):
+            needed = "pending_approval" if target == "approved" else "approved"
+            if current != needed and current != target:
+                raise LedgerError(f"{target} requires {needed} first (artist approval)")
+
+    def _move(self, row, target, note=None):
+        now = datetime.now().isoformat()
+        self.db.execute(
+            "UPDATE transactions SET status = ?, updated = ? WHERE id = ?",
+            (target, now, row["id"]),
+        )
+        self.db.execute(
+            "INSERT INTO transaction_events VALUES (?, ?, ?, ?, ?)",
+            (row["id"], row["status"], target, now, note),
+        )
+        # Keep the registry's status column in step (no-op if the table is absent)
+        try:
+            self.db.execute(
+                "UPDATE subjects SET status = ?, updated = ? WHERE name_key = ?",
+                (target, now, row["subject"]),
+            )
+        except sqlite3.OperationalError:
+            pass
+
+    def open(self, subject_name, title=None):
+        """Return the subject's open (unsold) transaction, creating an inquiry if none."""
+        key = subject_name.lower()
+        row = self.current(subject_name)
+        if row and row["status"] != "sold":
+            return row
+        now = datetime.now().isoformat()
+        with self.db:
+            cur = self.db.execute(
+                "INSERT INTO transactions (subject, status, title, created, updated) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, STATUSES[0], title, now, now),
+            )
+            self.db.execute(
+                "INSERT INTO transaction_events VALUES (?, NULL, ?, ?, ?)",
+                (cur.lastrowid, STATUSES[0], now, "opened"),
+            )
+        return self.get(cur.lastrowid)
+
+    def advance(self, subject_name, status, note=None, title=None):
+        """Move a subject's open transaction forward to `status`. Returns the row."""
+        row = self.open(subject_name)
+        if row["status"] == status:
+            return row
+        self._check(row["status"], status)
+        with self.db:
+            self._move(row, status, note)
+            if title:
+                self.db.execute(
+                    "UPDATE transactions SET title = ? WHERE id = ?", (title, row["id"]),
+                )
+        return self.get(row["id"])
+
+    def advance_to_at_least(self, subject_name, status, note=None, title=None):
+        """advance(), but a no-op if the subject is already at or past `status`."""
+        row = self.open(subject_name)
+        if STATUSES.index(row["status"]) >= STATUSES.index(status):
+            return row
+        return self.advance(subject_name, status, note=note, title=title)
+
+    def mark_sold(self, tx_id, amount, currency, buyer=None):
+        """Record a sale. Requires artist approval when the config says so."""
+        if currency.lower() not in CURRENCIES:
+            raise LedgerError(f"Unsupported currency {currency!r}; accepted: {CURRENCIES}")
+        row = self.get(tx_id)
+        if row is None:
+            raise LedgerError(f"No transaction {tx_id}")
+        if row["status"] == "sold":
+            raise LedgerError(f"Transaction {tx_id} is already sold")
+        self._check(row["status"], "sold")
+        with self.db:
+            self.db.execute(
+                "UPDATE transactions SET amount = ?, currency = ?, buyer = ? WHERE id = ?",
+                (str(amount), currency.lower(), buyer, tx_id),
+            )
+            self._move(row, "sold", f"sold to {buyer or 'unknown'}")
+        return self.get(tx_id)
+
+    # ── Approval queue ────────────────────────────────────────────
+
+    def pending_approvals(self, limit=None):
+        """Transactions awaiting artist approval, oldest first."""
+        sql = "SELECT * FROM transactions WHERE status = 'pending_approval' ORDER BY id"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self.db.execute(sql).fetchall()
+
+    def approve(self, tx_ids=None, note="approved by artist"):
+        """
+        Approve the given transactions — or the whole queue if tx_ids is None —
+        in a single database transaction. Returns the number approved.
+        """
+        if tx_ids is None:
+            rows = self.pending_approvals()
+        else:
+            rows = [r for r in (self.get(i) for i in tx_ids)
+                    if r and r["status"] == "pending_approval"]
+        with self.db:
+            for row in rows:
+                self._move(row, "approved", note)
+        return len(rows)
+
+    def reject(self, tx_id, note="sent back by artist"):
+        """Send a pending portrait back to in_progress for rework."""
+        row = self.get(tx_id)
+        if row is None or row["status"] != "pending_approval":
+            raise LedgerError(f"Transaction {tx_id} is not awaiting approval")
+        with self.db:
+            self._move(row, "in_progress", note)
+        return self.get(tx_id)
+
+    # ── Queries ───────────────────────────────────────────────────
+
+    def get(self, tx_id):
+        return self.db.execute(
+            "SELECT * FROM transactions WHERE id = ?", (tx_id,),
+        ).fetchone()
+
+    def current(self, subject_name):
+        """The subject's most recent transaction, or None."""
+        return self.db.execute(
+            "SELECT * FROM transactions WHERE subject = ? ORDER BY id DESC LIMIT 1",
+            (subject_name.lower(),),
+        ).fetchone()
+
+    def rejected(self, subject_name):
+        """True if the artist sent the subject's portrait back and no new one has been submitted."""
+        row = self.current(subject_name)
+        if row is None or row["status"] != "in_progress":
+            return False
+        last = self.db.execute(
+            "SELECT from_status FROM transaction_events WHERE tx_id = ? "
+            "ORDER BY rowid DESC LIMIT 1", (row["id"],),
+        ).fetchone()
+        return last is not None and last["from_status"] == "pending_approval"
+
+    def history(self, tx_id):
+        return self.db.execute(
+            "SELECT * FROM transaction_events WHERE tx_id = ? ORDER BY rowid",
+            (tx_id,),
+        ).fetchall()
+
+    def by_status(self, status, limit=50):
+        return self.db.execute(
+            "SELECT * FROM transactions WHERE status = ? ORDER BY id LIMIT ?",
+            (status, limit),
+        ).fetchall()
+
+    def summary(self):
+        """{status: count} across all transactions."""
+        counts = dict(self.db.execute(
+            "SELECT status, COUNT(*) FROM transactions GROUP BY status",
+        ).fetchall())
+        return {s: counts.get(s, 0) for s in STATUSES}
@@ -3,27 +3,156 @@ Portrait Agent — Moltbook Edition
 Moltbook API client — register, post, read comments, and interact on Moltbook.
 """
 
+import os
+import threading
 import time
-import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from comments import merge_by_author, normalize
 
 BASE_URL = "https://www.moltbook.com/api/v1"
 
+# Seconds a cached read stays fresh, per endpoint. Comments are never cached —
+# polling needs to see new ones.
+CACHE_TTLS = {
+    "post": 30,
+    "profile": 300,
+    "submolt": 600,
+    "search": 60,
+}
+# Reads whose answer depends on who is asking
+PRIVATE_KINDS = {"profile"}
+
+
+class ReadCache:
+    """
+    LRU cache of GET responses with per-entry expiry and validators
+    (ETag / Last-Modified), plus single-flight: concurrent misses for the
+    same key share one in-flight request instead of each making their own.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # key → [expires, data, etag, last_modified]
+        self._in_flight = {}            # key → [Event, result, error]
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.revalidated = self.coalesced = 0
+
+    def get(self, key, ttl, fetch):
+        """
+        Return cached data for key, or call fetch(entry) to load it.
+        fetch receives the stale entry (or None) and returns
+        (data, etag, last_modified, not_modified).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = [threading.Event(), None, None]
+            else:
+                self.coalesced += 1
+        if not leader:
+            flight[0].wait()
+            if flight[2]:
+                raise flight[2]
+            return flight[1]
+
+        try:
+            data, etag, last_modified, not_modified = fetch(entry)
+            with self._lock:
+                if not_modified and entry:
+                    data = entry[1]
+                    self.revalidated += 1
+                else:
+                    self.misses += 1
+                self._entries[key] = [time.monotonic() + ttl, data, etag, last_modified]
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            flight[1] = data
+            return data
+        except Exception as e:
+            flight[2] = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight[0].set()
+
+    def invalidate(self, prefix):
+        """Drop every entry whose key starts with prefix."""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
 
 class MoltbookClient:
     """Client for the Moltbook API (the social network for AI agents)."""
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, comment_index=None, cache_ttls=None,
+                 cache_size=1024, base_url=None):
         self.api_key = api_key
+        self.base_url = (base_url or os.environ.get("MOLTBOOK_BASE_URL")
+                         or BASE_URL).rstrip("/")
         self.agent_id = None
+        self.comment_index = comment_index  # push.CommentIndex, if a receiver runs
+        self.cache_ttls = CACHE_TTLS if cache_ttls is None else cache_ttls
+        self.cache = ReadCache(cache_size)
+        import requests  # deferred: only clients that talk to Moltbook pay for it
         self.session = requests.Session()
         if api_key:
             self.session.headers["Authorization"] = f"Bearer {api_key}"
 
+    def share(self, other):
+        """
+        Reuse another client's read cache and connection pools, so a second
+        identity in the same process (editions.py) adds no footprint of its own.
+        """
+        self.cache = other.cache
+        for prefix, adapter in getattr(other.session, "adapters", {}).items():
+            self.session.mount(prefix, adapter)
+        return self
+
+    # ── Cached reads ──────────────────────────────────────────────
+
+    def _cached_get(self, kind, url, params=None):
+        """GET through the read cache when `kind` has a TTL, else straight through."""
+        ttl = self.cache_ttls.get(kind)
+        if not ttl:
+            resp = self.session.get(url, params=params)
+            resp.raise_for_status()
+            return resp.json()
+
+        def fetch(stale):
+            headers = {}
+            if stale and stale[2]:
+                headers["If-None-Match"] = stale[2]
+            if stale and stale[3]:
+                headers["If-Modified-Since"] = stale[3]
+            resp = self.session.get(url, params=params, headers=headers)
+            if resp.status_code == 304:
+                return None, stale[2], stale[3], True
+            resp.raise_for_status()
+            return (resp.json(), resp.headers.get("ETag"),
+                    resp.headers.get("Last-Modified"), False)
+
+        key = url + ("?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+                     if params else "")
+        if kind in PRIVATE_KINDS:
+            key += f"#{id(self)}"  # per identity, even in a shared cache
+        return self.cache.get(key, ttl, fetch)
+
     # ── Registration ──────────────────────────────────────────────
 
     def register(self, name, description):
         """Register a new agent on Moltbook. Returns the API key."""
-        resp = self.session.post(f"{BASE_URL}/agents/register", json={
+        resp = self.session.post(f"{self.base_url}/agents/register", json={
             "name": name,
             "description": description,
         })
@@ -32,13 +161,12 @@ class MoltbookClient:
         self.api_key = data.get("api_key") or data.get("token")
         self.agent_id = data.get("agent_id") or data.get("id")
         self.session.headers["Authorization"] = f"Bearer {self.api_key}"
+        self.cache.invalidate(f"{self.base_url}/agents/me")
         return data
 
     def get_profile(self):
         """Get the current agent's profile."""
-        resp = self.session.get(f"{BASE_URL}/agents/me")
-        resp.raise_for_status()
-        return resp.json()
+        return self._cached_get("profile", f"{self.base_url}/agents/me")
 
     # ── Posts ──────────────────────────────────────────────────────
 
@@ -47,21 +175,20 @@ class MoltbookClient:
         payload = {"title": title, "body": body}
         if submolt:
             payload["submolt"] = submolt
-        resp = self.session.post(f"{BASE_URL}/posts", json=payload)
+        resp = self.session.post(f"{self.base_url}/posts", json=payload)
         resp.raise_for_status()
         return resp.json()
 
     def get_post(self, post_id):
         """Get a single post by ID."""
-        resp = self.session.get(f"{BASE_URL}/posts/{post_id}")
-        resp.raise_for_status()
-        return resp.json()
+        return self._cached_get("post", f"{self.base_url}/posts/{post_id}")
 
-    def get_feed(self, sort="hot", limit=25):
-        """Get the feed."""
-        resp = self.session.get(f"{BASE_URL}/posts", params={
-            "sort": sort, "limit": limit,
-        })
+    def get_feed(self, sort="hot", limit=25, cursor=None):
+        """Get the feed. Pass the previous page's next_cursor to page through it."""
+        params = {"sort": sort, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        resp = self.session.get(f"{self.base_url}/posts", params=params)
         resp.raise_for_status()
         return resp.json()
 
@@ -73,15 +200,16 @@ class MoltbookClient:
         if parent_id:
             payload["parent_id"] = parent_id
         resp = self.session.post(
-            f"{BASE_URL}/posts/{post_id}/comments", json=payload,
+            f"{self.base_url}/posts/{post_id}/comments", json=payload,
         )
         resp.raise_for_status()
+        self.cache.invalidate(f"{self.base_url}/posts/{post_id}")
         return resp.json()
 
     def get_comments(self, post_id, sort="new", limit=50):
         """Get comments on a post."""
         resp = self.session.get(
-            f"{BASE_URL}/posts/{post_id}/comments",
+            f"{self.base_url}/posts/{post_id}/comments",
             params={"sort": sort, "limit": limit},
         )
         resp.raise_for_status()
@@ -90,12 +218,13 @@ class MoltbookClient:
     # ── Voting ────────────────────────────────────────────────────
 
     def upvote_post(self, post_id):
-        resp = self.session.post(f"{BASE_URL}/posts/{post_id}/upvote")
+        resp = self.session.post(f"{self.base_url}/posts/{post_id}/upvote")
         resp.raise_for_status()
+        self.cache.invalidate(f"{self.base_url}/posts/{post_id}")
         return resp.json()
 
     def upvote_comment(self, comment_id):
-        resp = self.session.post(f"{BASE_URL}/comments/{comment_id}/upvote")
+        resp = self.session.post(f"{self.base_url}/comments/{comment_id}/upvote")
         resp.raise_for_status()
         return resp.json()
 
@@ -103,7 +232,7 @@ class MoltbookClient:
 
     def create_submolt(self, name, description):
         """Create a new submolt (community)."""
-        resp = self.session.post(f"{BASE_URL}/submolts", json={
+        resp = self.session.post(f"{self.base_url}/submolts", json={
             "name": name, "description": description,
         })
         resp.raise_for_status()
@@ -111,26 +240,24 @@ class MoltbookClient:
 
     def get_submolt(self, name):
         """Get info about a submolt."""
-        resp = self.session.get(f"{BASE_URL}/submolts/{name}")
-        resp.raise_for_status()
-        return resp.json()
+        return self._cached_get("submolt", f"{self.base_url}/submolts/{name}")
 
     def subscribe(self, submolt_name):
         resp = self.session.post(
-            f"{BASE_URL}/submolts/{submolt_name}/subscribe",
+            f"{self.base_url}/submolts/{submolt_name}/subscribe",
         )
         resp.raise_for_status()
+        self.cache.invalidate(f"{self.base_url}/submolts/{submolt_name}")
         return resp.json()
 
     # ── Search ────────────────────────────────────────────────────
 
-    def search(self, query, limit=25):
+    def search(self, query, limit=25, cursor=None):
         """Search posts, agents, and submolts."""
-        resp = self.session.get(f"{BASE_URL}/search", params={
-            "q": query, "limit": limit,
-        })
-        resp.raise_for_status()
-        return resp.json()
+        params = {"q": query, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return self._cached_get("search", f"{self.base_url}/search", params)
 
     # ── Utilities ─────────────────────────────────────────────────
 
@@ -138,16 +265,20 @@ class MoltbookClient:
                           poll_interval=120):
         """
         Poll a post until it has at least min_comments, or timeout.
-        Returns all comments collected.
+        Returns all comments collected, as comments.Comment records.
+
+        With a comment_index, polled comments are merged into it and the wait
+        between polls ends as soon as pushed comments reach min_comments.
         """
+        index = self.comment_index
         start = time.time()
         best_comments = []
 
         while time.time() - start < timeout:
-            comments_data = self.get_comments(post_id, sort="new", limit=50)
-            comments = comments_data if isinstance(comments_data, list) else (
-                comments_data.get("comments") or comments_data.get("data") or []
-            )
+            comments = normalize(self.get_comments(post_id, sort="new", limit=50))
+            if index is not None:
+                index.add(post_id, comments)
+                comments = index.comments(post_id)
             if len(comments) >= min_comments:
                 return comments
             best_comments = comments
@@ -158,6 +289,84 @@ class MoltbookClient:
                 break
             print(f"  {len(comments)}/{min_comments} comments so far, "
                   f"polling again in {int(wait)}s...")
-            time.sleep(wait)
+            if index is None:
+                time.sleep(wait)
+            elif index.wait_for(post_id, min_comments, wait) >= min_comments:
+                return index.comments(post_id)
+
+        return best_comments
+
+    def wait_for_comments_multi(self, post_ids, min_comments=3, timeout=7200,
+                                poll_interval=120):
+        """
+        Poll several posts (the same concept in different submolts) as one
+        feedback stream. Each round fetches every thread concurrently and
+        merges them, one comment per author. Returns once the merged set
+        reaches min_comments, or the best set at timeout. With a
+        comment_index, pushed comments on any thread end the wait early.
+        """
+        index = self.comment_index
+        start = time.time()
+        best_comments = []
+
+        def fetch(post_id):
+            comments = normalize(self.get_comments(post_id, sort="new", limit=50))
+            if index is not None:
+                index.add(post_id, comments)
+                comments = index.comments(post_id)
+            return comments
+
+        with ThreadPoolExecutor(max_workers=min(8, len(post_ids))) as pool:
+            while time.time() - start < timeout:
+                comments = merge_by_author(pool.map(fetch, post_ids))
+                if len(comments) >= min_comments:
+                    return comments
+                best_comments = comments
+
+                remaining = timeout - (time.time() - start)
+                wait = min(poll_interval, remaining)
+                if wait <= 0:
+                    break
+                print(f"  {len(comments)}/{min_comments} comments across "
+                      f"{len(post_ids)} threads, polling again in {int(wait)}s...")
+                if index is None:
+                    time.sleep(wait)
+                    continue
+
+                def merged():
+                    return merge_by_author(index.comments(p) for p in post_ids)
+
+                if index.wait_until(lambda: len(merged()), min_comments, wait) >= min_comments:
+                    return merged()
 
         return best_comments
+
+    def wait_for_replies(self, post_id, comment_id, tree, timeout=120,
+                         poll_interval=15, limit=20):
+        """
+        Wait for replies under one of our comments, merging fetched comments
+        into `tree` (a comments.CommentTree). New replies sort first, so each
+        poll only reads the newest `limit` comments. Returns as soon as any
+        reply exists, or [] at timeout.
+        """
+        index = self.comment_index
+        start = time.time()
+
+        while True:
+            fresh = normalize(self.get_comments(post_id, sort="new", limit=limit))
+            if index is not None:
+                index.add(post_id, fresh)
+                fresh = index.comments(post_id)
+            tree.add(fresh)
+            replies = tree.replies_under(comment_id)
+            if replies:
+                return replies
+
+            remaining = timeout - (time.time() - start)
+            if remaining <= 0:
+                return []
+            wait = min(poll_interval, remaining)
+            if index is None:
+                time.sleep(wait)
+            else:
+                index.wait_for(post_id, index.count(post_id) + 1, wait)
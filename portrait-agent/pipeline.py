@@ -0,0 +1,123 @@
+"""
+Portrait Agent — Moltbook Edition
+Staged pipeline — independent stages joined by bounded queues, each with a
+worker pool sized to its own bottleneck.
+
+    Pipeline([
+        Stage("post", post_fn, workers=2),
+        Stage("wait", wait_fn, workers=32),      # network-bound, mostly sleeping
+        Stage("generate", gen_fn, workers=3),    # token-bound
+        Stage("save", save_fn, workers=1),       # disk-bound
+    ], queue_size=8).run(items)
+
+Each stage function takes an item and returns the item for the next stage
+(or None to drop it). Queues are bounded, so when a slow stage fills its
+input queue, upstream workers block on put — backpressure that reaches all
+the way back to whoever is feeding items in, instead of letting work pile up
+in memory. A failing item is recorded and dropped; the rest keep flowing.
+
+An exception type listed in `stop_on` (e.g. usage.BudgetExceeded) stops the
+pipeline instead: no more items are taken in, items still queued at or
+before the stage that raised are dropped unprocessed, and items already
+past it run to the end.
+"""
+
+import contextvars
+import queue
+import threading
+import time
+
+from tracing import TRACER
+
+_DONE = object()
+
+
+class Stage:
+    def __init__(self, name, fn, workers=1, queue_size=None):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+
+
+class Pipeline:
+    def __init__(self, stages, queue_size=8, stop_on=()):
+        self.stages = stages
+        self.queues = [queue.Queue(maxsize=s.queue_size or queue_size) for s in stages]
+        self.results = []
+        self.errors = []    # (stage name, item, exception)
+        self.dropped = []   # (stage name, item) left unprocessed after a stop
+        self.processed = {s.name: 0 for s in stages}
+        self.stopped = None  # the stop_on exception, once one was raised
+        self.stop_on = tuple(stop_on)
+        self._stopped_at = -1  # index of the furthest stage that raised it
+        self._lock = threading.Lock()
+        self._remaining = [s.workers for s in stages]
+
+    def _put(self, index, item):
+        """Hand an item to stage `index`, timing how long backpressure held us."""
+        if index == len(self.stages):
+            with self._lock:
+                self.results.append(item)
+            return
+        start = time.perf_counter()
+        self.queues[index].put(item)
+        blocked = time.perf_counter() - start
+        if blocked > 0.001:
+            TRACER.observe("pipeline_blocked_seconds", blocked,
+                           stage=self.stages[index].name)
+
+    def _worker(self, index):
+        stage, inbox = self.stages[index], self.queues[index]
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                break
+            if index <= self._stopped_at:
+                with self._lock:
+                    self.dropped.append((stage.name, item))
+                continue
+            try:
+                out = stage.fn(item)
+            except Exception as e:
+                with self._lock:
+                    self.errors.append((stage.name, item, e))
+                    if isinstance(e, self.stop_on):
+                        self.stopped = self.stopped or e
+                        self._stopped_at = max(self._stopped_at, index)
+                print(f"  [{stage.name}] failed: {e}")
+                continue
+            with self._lock:
+                self.processed[stage.name] += 1
+            if out is not None:
+                self._put(index + 1, out)
+
+        # The last worker out closes the next stage
+        with self._lock:
+            self._remaining[index] -= 1
+            last = self._remaining[index] == 0
+        if last and index + 1 < len(self.stages):
+            for _ in range(self.stages[index + 1].workers):
+                self.queues[index + 1].put(_DONE)
+
+    def run(self, items):
+        """Feed items through every stage. Returns the last stage's outputs."""
+        # Workers inherit the caller's context (e.g. its edition, see editions.py)
+        threads = [
+            threading.Thread(target=contextvars.copy_context().run,
+                             args=(self._worker, i), daemon=True,
+                             name=f"{stage.name}-{n}")
+            for i, stage in enumerate(self.stages)
+            for n in range(stage.workers)
+        ]
+        for t in threads:
+            t.start()
+        for item in items:
+            if self.stopped:
+                break
+            self._put(0, item)
+        for _ in range(self.stages[0].workers):
+            self.queues[0].put(_DONE)
+        for t in threads:
+            t.join()
+        return self.results
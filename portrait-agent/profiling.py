@@ -0,0 +1,101 @@
+"""
+Portrait Agent — Moltbook Edition
+Profiling — opt-in CPU and memory profiling per pipeline stage (--profile).
+
+Each stage (post, wait, followup, synthesize, generate, save, publish, ...)
+gets its own cProfile profile, accumulated across subjects, and a tracemalloc
+snapshot diff between its start and end. On finish the run directory holds:
+
+    <stage>.pstats   load with `python -m pstats` or snakeviz
+    cpu.txt          top functions per stage by cumulative time
+    memory.txt       top allocation sites per stage occurrence, plus peak
+
+Only one stage is CPU-profiled at a time: stages entered while another is
+being profiled (daemon workers, concurrent subjects) still get memory
+snapshots but are left out of the CPU profiles.
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from editions import current
+
+# Allocation noise from the profiler itself and the import machinery
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+
+class Profiler:
+    def __init__(self, run_dir=None, top=15, frames=10):
+        self.run_dir = Path(run_dir or current().profiles_dir
+                            / time.strftime("%Y%m%d-%H%M%S"))
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.top = top
+        self.profiles = {}
+        self._cpu_lock = threading.Lock()
+        self._mem_lock = threading.Lock()
+        self._memory = open(self.run_dir / "memory.txt", "w")
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    @contextmanager
+    def stage(self, name):
+        before = _snapshot()
+        profiling = self._cpu_lock.acquire(blocking=False)
+        profile = None
+        if profiling:
+            profile = self.profiles.setdefault(name, cProfile.Profile())
+            profile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiling:
+                profile.disable()
+                self._cpu_lock.release()
+            self._record_memory(name, elapsed, before)
+
+    def _record_memory(self, name, elapsed, before):
+        after = _snapshot()
+        traced, peak = tracemalloc.get_traced_memory()
+        diffs = after.compare_to(before, "lineno")[:self.top]
+        with self._mem_lock:
+            out = self._memory
+            if out.closed:
+                return
+            out.write(f"== {name}  {elapsed:.3f}s  "
+                      f"traced {traced / 1024:.0f} KiB, peak {peak / 1024:.0f} KiB\n")
+            for stat in diffs:
+                out.write(f"  {stat}\n")
+            out.write("\n")
+            out.flush()
+
+    def finish(self):
+        """Write the per-stage pstats files and the CPU summary."""
+        with self._cpu_lock:
+            summary = io.StringIO()
+            for name, profile in sorted(self.profiles.items()):
+                profile.dump_stats(self.run_dir / f"{name}.pstats")
+                summary.write(f"== {name}\n")
+                stats = pstats.Stats(profile, stream=summary)
+                stats.sort_stats("cumulative").print_stats(self.top)
+            (self.run_dir / "cpu.txt").write_text(summary.getvalue())
+        with self._mem_lock:
+            self._memory.close()
+        tracemalloc.stop()
+        return self.run_dir
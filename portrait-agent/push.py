@@ -0,0 +1,186 @@
+"""
+Portrait Agent — Moltbook Edition
+Push receiver — a small local HTTP endpoint that accepts pushed comment and
+mention events, as an alternative to discovering comments by polling.
+
+Pushed and polled comments land in the same per-post CommentIndex, which
+deduplicates them by comment ID. MoltbookClient.wait_for_comments (and
+wait_for_comments_multi) sleeps on the index instead of a fixed timer, so a
+push wakes it within moments, while the regular poll still runs as a fallback
+for anything pushes miss. A mention wakes the daemon's thread for its post
+(CommentIndex.listen).
+
+Event format (POST /events, JSON object or list of objects):
+    {"id": "<event id>", "type": "comment" | "mention",
+     "post_id": "<post id>", "comment": {...comment as returned by the API...}}
+"""
+
+import hmac
+import json
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from comments import Comment
+from replay import wait
+
+
+class CommentIndex:
+    """Per-post comments keyed by ID, shared by polling and push delivery."""
+
+    def __init__(self, max_event_ids=10000):
+        self._posts = {}
+        self._cond = threading.Condition()
+        self._event_ids = OrderedDict()
+        self._max_event_ids = max_event_ids
+        self._listeners = []
+
+    def listen(self, fn):
+        """Call fn(post_id) whenever a push brings a post new comments or mentions us there."""
+        self._listeners.append(fn)
+
+    def _notify(self, post_id):
+        for fn in list(self._listeners):
+            fn(str(post_id))
+
+    def add(self, post_id, comments, pushed=False):
+        """Merge Comments (or raw comment dicts) into a post's index. Returns how many were new."""
+        new = 0
+        with self._cond:
+            post = self._posts.setdefault(str(post_id), OrderedDict())
+            for c in comments:
+                c = Comment.from_raw(c)
+                key = c.id or hash((c.author, c.body))
+                if key not in post:
+                    post[key] = c
+                    new += 1
+            if new:
+                self._cond.notify_all()
+        if new and pushed:
+            self._notify(post_id)
+        return new
+
+    def mention(self, post_id):
+        """A pushed mention of us on a post: wake whoever watches it."""
+        self._notify(post_id)
+
+    def seen_event(self, event_id):
+        """Record a push event ID. Returns True if it was already delivered."""
+        if event_id is None:
+            return False
+        with self._cond:
+            if event_id in self._event_ids:
+                return True
+            self._event_ids[event_id] = True
+            if len(self._event_ids) > self._max_event_ids:
+                self._event_ids.popitem(last=False)
+        return False
+
+    def comments(self, post_id):
+        with self._cond:
+            return list(self._posts.get(str(post_id), {}).values())
+
+    def count(self, post_id):
+        with self._cond:
+            return len(self._posts.get(str(post_id), ()))
+
+    def wait_for(self, post_id, min_count, timeout):
+        """Block until the post has min_count comments or timeout. Returns the count."""
+        return self.wait_until(lambda: self.count(post_id), min_count, timeout)
+
+    def wait_until(self, count, min_count, timeout):
+        """
+        Block until count() reaches min_count or timeout, re-checking whenever
+        comments arrive. count runs under the index lock. Returns its last value.
+        """
+        deadline = time.time() + timeout
+        with self._cond:
+            while True:
+                n = count()
+                remaining = deadline - time.time()
+                if n >= min_count or remaining <= 0:
+                    return n
+                wait(self._cond, remaining)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        receiver = self.server.receiver
+        if self.path.rstrip("/") != "/events":
+            self.send_error(404)
+            return
+        if receiver.secret and not hmac.compare_digest(
+                self.headers.get("X-Webhook-Secret", ""), receiver.secret):
+            self.send_error(401)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"null")
+        except (ValueError, json.JSONDecodeError):
+            self.send_error(400)
+            return
+
+        events = payload if isinstance(payload, list) else [payload]
+        accepted = sum(receiver.handle(e) for e in events if isinstance(e, dict))
+        body = json.dumps({"accepted": accepted}).encode()
+        self.send_response(202)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PushReceiver:
+    """Background HTTP server feeding pushed events into a CommentIndex."""
+
+    def __init__(self, index, host="127.0.0.1", port=8787, secret=None):
+        self.index = index
+        self.secret = secret
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.receiver = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/events"
+
+    def handle(self, event):
+        """Apply one event. Returns True if it carried anything new."""
+        if self.index.seen_event(event.get("id")):
+            return False
+        comment = event.get("comment")
+        post_id = event.get("post_id") or (comment or {}).get("post_id")
+        if event.get("type") == "mention" and post_id:
+            self.index.mention(post_id)
+        if comment and post_id:
+            return self.index.add(post_id, [comment], pushed=True) > 0
+        return event.get("type") == "mention"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def emit(url, events, secret=None, timeout=5):
+    """
+    Local stand-in for the push sender: POST events to a receiver.
+    Useful for exercising the receiver without Moltbook.
+    """
+    req = urllib.request.Request(
+        url, data=json.dumps(events).encode(), method="POST",
+        headers={"Content-Type": "application/json",
+                 **({"X-Webhook-Secret": secret} if secret else {})},
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())
@@ -0,0 +1,152 @@
+"""
+Portrait Agent — Moltbook Edition
+Subject registry — persistent, indexed store of portrait subjects.
+
+Replaces linear scans over PORTRAIT_SUBJECTS: subjects live in SQLite with a
+case-insensitive primary key on name and an index on status, and listings are
+paginated by keyset so each page costs O(log n) however large the registry grows.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+
+from agents import TRANSACTION_CONFIG
+from editions import current
+
+STATUSES = TRANSACTION_CONFIG["status_options"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subjects (
+    name_key             TEXT PRIMARY KEY,
+    name                 TEXT NOT NULL,
+    role                 TEXT NOT NULL DEFAULT '',
+    description          TEXT NOT NULL DEFAULT '',
+    identity_preferences TEXT NOT NULL DEFAULT '{}',
+    status               TEXT NOT NULL,
+    source               TEXT,
+    added                TEXT NOT NULL,
+    updated              TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS subjects_status ON subjects (status, name_key);
+"""
+
+
+def _row_to_subject(row):
+    return {
+        "name": row["name"],
+        "role": row["role"],
+        "description": row["description"],
+        "identity_preferences": json.loads(row["identity_preferences"]),
+        "status": row["status"],
+        "source": row["source"],
+        "added": row["added"],
+        "updated": row["updated"],
+    }
+
+
+class SubjectRegistry:
+    """SQLite-backed registry of portrait subjects."""
+
+    def __init__(self, path=None, seed=None):
+        """Defaults to the current edition's registry.db, seeded with its subjects."""
+        edition = current()
+        self.db = sqlite3.connect(path or edition.registry_file)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        for subject in edition.subjects if seed is None else seed:
+            self.add(subject, source="agents.py")
+
+    def close(self):
+        self.db.close()
+
+    # ── Writes ────────────────────────────────────────────────────
+
+    def add(self, subject, source=None):
+        """Insert a subject if its name is new. Returns True if it was added."""
+        name = (subject.get("name") or "").strip()
+        if not name:
+            return False
+        now = datetime.now().isoformat()
+        with self.db:
+            cur = self.db.execute(
+                "INSERT OR IGNORE INTO subjects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (name.lower(), name, subject.get("role", ""),
+                 subject.get("description", ""),
+                 json.dumps(subject.get("identity_preferences") or {}),
+                 subject.get("status", STATUSES[0]),
+                 source or subject.get("source"), now, now),
+            )
+        return cur.rowcount == 1
+
+    def append(self, subject):
+        """Alias for add(), so the registry can be a discovery Crawler's store."""
+        return self.add(subject)
+
+    def set_status(self, name, status):
+        if status not in STATUSES:
+            raise ValueError(f"Unknown status {status!r}; expected one of {STATUSES}")
+        return self._update(name, status=status)
+
+    def update_preferences(self, name, preferences):
+        """Merge answers into a subject's identity_preferences."""
+        subject = self.get(name)
+        if subject is None:
+            return False
+        merged = {**subject["identity_preferences"], **preferences}
+        return self._update(name, identity_preferences=json.dumps(merged))
+
+    def _update(self, name, **fields):
+        fields["updated"] = datetime.now().isoformat()
+        assignments = ", ".join(f"{k} = ?" for k in fields)
+        with self.db:
+            cur = self.db.execute(
+                f"UPDATE subjects SET {assignments} WHERE name_key = ?",
+                (*fields.values(), name.lower()),
+            )
+        return cur.rowcount == 1
+
+    # ── Reads ─────────────────────────────────────────────────────
+
+    def get(self, name):
+        """Case-insensitive lookup by name. Returns a subject dict or None."""
+        row = self.db.execute(
+            "SELECT * FROM subjects WHERE name_key = ?", (name.lower(),),
+        ).fetchone()
+        return _row_to_subject(row) if row else None
+
+    def count(self, status=None):
+        if status:
+            return self.db.execute(
+                "SELECT COUNT(*) FROM subjects WHERE status = ?", (status,),
+            ).fetchone()[0]
+        return self.db.execute("SELECT COUNT(*) FROM subjects").fetchone()[0]
+
+    def page(self, after=None, limit=50, status=None):
+        """
+        One page of subjects ordered by name. Pass the last name of the
+        previous page as `after` to get the next one.
+        """
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if after:
+            clauses.append("name_key > ?")
+            params.append(after.lower())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.db.execute(
+            f"SELECT * FROM subjects {where} ORDER BY name_key LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+        return [_row_to_subject(r) for r in rows]
+
+    def iter_subjects(self, status=None, page_size=200):
+        """Iterate every subject (optionally of one status), a page at a time."""
+        after = None
+        while True:
+            batch = self.page(after=after, limit=page_size, status=status)
+            yield from batch
+            if len(batch) < page_size:
+                return
+            after = batch[-1]["name"]
@@ -0,0 +1,292 @@
+"""
+Portrait Agent — Moltbook Edition
+Record/replay harness — capture every Moltbook HTTP exchange and Claude call
+of a run.py session into a cassette file, then serve them back offline.
+
+    python run.py --subject Prism --record cassettes/prism.json
+    python run.py --subject Prism --replay cassettes/prism.json --time-scale 0
+
+Replay needs no API keys and no network. Requests are matched by method, URL,
+params and body (Claude calls by model + messages); repeated identical requests,
+like comment polls, get their recorded responses in order. A virtual clock
+replaces time.time/time.sleep (and times the engine's Event/Condition waits)
+so poll loops and timeouts behave exactly as recorded, while real waiting is
+scaled by --time-scale (0 = no waiting).
+
+A replay runs against a scratch data directory, so no step is skipped as
+unchanged since an earlier run (fingerprint.py), and fails if any recorded
+exchange is left unconsumed. Record from a fresh start (a new post, or an
+edition without earlier results) for a cassette that replays cleanly.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from types import SimpleNamespace
+
+from clientwrap import Messages
+
+
+class CassetteError(LookupError):
+    """A replayed request has no (remaining) recorded response."""
+
+
+def _key(*parts):
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+
+
+class Cassette:
+    """Ordered interactions, indexed by request key for replay."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.interactions = []
+        self._queues = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        cassette = cls(path)
+        with open(path) as f:
+            cassette.interactions = json.load(f)["interactions"]
+        for item in cassette.interactions:
+            cassette._queues[item["key"]].append(item)
+        return cassette
+
+    def record(self, item):
+        with self._lock:
+            self.interactions.append(item)
+
+    def next(self, key, description):
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteError(f"No recorded response left for {description}")
+            return queue.popleft()
+
+    def unused(self):
+        """Recorded interactions that no replayed request has consumed, in order."""
+        with self._lock:
+            left = {id(item) for queue in self._queues.values() for item in queue}
+        return [item for item in self.interactions if id(item) in left]
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"recorded": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                       "interactions": self.interactions}, f, indent=1)
+
+
+# ── Moltbook (requests) ───────────────────────────────────────────
+
+def _http_key(method, url, params=None, json_body=None):
+    return _key("http", method, url, params or {}, json_body)
+
+
+class RecordingSession:
+    """Wraps a requests.Session and records every exchange."""
+
+    def __init__(self, session, cassette):
+        self._session = session
+        self.cassette = cassette
+        self.headers = session.headers
+
+    def _do(self, method, url, params=None, json=None, headers=None):
+        resp = self._session.request(method, url, params=params, json=json,
+                                     headers=headers)
+        try:
+            body = resp.json()
+        except ValueError:
+            body = None
+        self.cassette.record({
+            "key": _http_key(method, url, params, json), "kind": "http",
+            "method": method, "url": url, "params": params, "json": json,
+            "status": resp.status_code,
+            "headers": {k: v for k, v in resp.headers.items()
+                        if k in ("ETag", "Last-Modified")},
+            "body": body,
+        })
+        return resp
+
+    def get(self, url, params=None, headers=None):
+        return self._do("GET", url, params=params, headers=headers)
+
+    def post(self, url, json=None):
+        return self._do("POST", url, json=json)
+
+
+class ReplayResponse:
+    def __init__(self, item):
+        self.status_code = item["status"]
+        self.headers = item.get("headers") or {}
+        self._body = item["body"]
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} (replayed)", response=self)
+
+
+class ReplaySession:
+    """Stands in for requests.Session, serving recorded responses."""
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+        self.headers = {}
+
+    def _do(self, method, url, params=None, json=None):
+        item = self.cassette.next(_http_key(method, url, params, json),
+                                  f"{method} {url} {params or ''}")
+        return ReplayResponse(item)
+
+    def get(self, url, params=None, headers=None):
+        return self._do("GET", url, params=params)
+
+    def post(self, url, json=None):
+        return self._do("POST", url, json=json)
+
+
+# ── Claude (anthropic) ────────────────────────────────────────────
+
+def _claude_key(kwargs):
+    return _key("claude", kwargs.get("model"), kwargs.get("messages"),
+                kwargs.get("system"))
+
+
+def _usage_dict(usage):
+    fields = ("input_tokens", "output_tokens",
+              "cache_creation_input_tokens", "cache_read_input_tokens")
+    return {f: getattr(usage, f, None) or 0 for f in fields} if usage else {}
+
+
+class RecordingClaude:
+    """Wraps an anthropic client; records messages.create calls."""
+
+    def __init__(self, client, cassette):
+        self._client = client
+        self.cassette = cassette
+        self.messages = Messages(self._create)
+
+    def _create(self, **kwargs):
+        response = self._client.messages.create(**kwargs)
+        self.cassette.record({
+            "key": _claude_key(kwargs), "kind": "claude",
+            "model": kwargs.get("model"), "max_tokens": kwargs.get("max_tokens"),
+            "text": response.content[0].text,
+            "usage": _usage_dict(getattr(response, "usage", None)),
+            "stop_reason": getattr(response, "stop_reason", None),
+        })
+        return response
+
+
+class ReplayClaude:
+    """Stands in for anthropic.Anthropic, serving recorded responses."""
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+        self.messages = Messages(self._create)
+
+    def _create(self, **kwargs):
+        item = self.cassette.next(_claude_key(kwargs),
+                                  f"Claude call ({kwargs.get('model')})")
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=item["text"])],
+            usage=SimpleNamespace(**item.get("usage", {})),
+            model=item.get("model"),
+            stop_reason=item.get("stop_reason"),
+        )
+
+
+# ── Time ──────────────────────────────────────────────────────────
+
+_clock = None  # the installed VirtualClock, if any
+
+
+def wait(waitable, timeout):
+    """
+    waitable.wait(timeout) for a threading.Event or a held Condition, timed on
+    the installed VirtualClock if there is one. Returns what wait() returns.
+    """
+    clock = _clock
+    if clock is None or timeout is None:
+        return waitable.wait(timeout)
+    return clock.wait(waitable, timeout)
+
+
+class VirtualClock:
+    """
+    Replaces time.time, time.monotonic and time.sleep. Virtual time starts at
+    the real time the clock was made and then moves only when something
+    sleeps or times out a wait (wait() above): it advances by the full
+    requested time, while the process really waits only `scale` × that. Time
+    spent working never shows up on it, so a replay polls exactly as often as
+    the recorded run asked to. Use as a context manager to put the real
+    functions back afterwards.
+    """
+
+    def __init__(self, scale=0.0):
+        self.scale = scale
+        self._real_time = time.time
+        self._real_monotonic = time.monotonic
+        self._real_sleep = time.sleep
+        self._origin = self._real_time()
+        self._monotonic_origin = self._real_monotonic()
+        self._offset = 0.0
+        self._lock = threading.Lock()
+
+    def time(self):
+        with self._lock:
+            return self._origin + self._offset
+
+    def monotonic(self):
+        # Token buckets (discovery, scheduler) time refills with monotonic
+        # and wait with sleep; both must run on the same clock
+        with self._lock:
+            return self._monotonic_origin + self._offset
+
+    def _advance(self, seconds):
+        with self._lock:
+            self._offset += seconds
+
+    def sleep(self, seconds):
+        seconds = max(0.0, seconds)
+        if seconds * self.scale:
+            self._real_sleep(seconds * self.scale)
+        self._advance(seconds)
+
+    def wait(self, waitable, timeout):
+        """A timed wait: time advances by `timeout` only if nothing woke it."""
+        timeout = max(0.0, timeout)
+        woken = waitable.wait(timeout * self.scale)
+        if not woken:
+            self._advance(timeout)
+        return woken
+
+    def install(self):
+        global _clock
+        time.time = self.time
+        time.monotonic = self.monotonic
+        time.sleep = self.sleep
+        _clock = self
+        return self
+
+    def uninstall(self):
+        global _clock
+        time.time = self._real_time
+        time.monotonic = self._real_monotonic
+        time.sleep = self._real_sleep
+        _clock = None
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
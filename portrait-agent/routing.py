@@ -0,0 +1,148 @@
+"""
+Portrait Agent — Moltbook Edition
+Model routing — which Claude model (and max_tokens) each stage uses, with
+fallbacks and optional A/B variants.
+
+Call sites name a route instead of hard-coding a model:
+
+    response = routing.create(claude_client, "followup", max_tokens=500, messages=[...])
+
+Routes are looked up most-specific first: "generate:svg", then "generate".
+A route may set `model`, `max_tokens` (else the caller's default applies) and
+`fallbacks`, models tried in order if the call fails. A route with
+`variants` — [{"model": ..., "weight": ...}, ...] — is an A/B test: each call
+picks a variant by weight, and every call's latency, tokens and cost are
+tallied per route and model in ROUTER.report(). Latency is the model call
+alone (as timed by tracing.TracingClaude), not time spent queued in the
+scheduler or backing off between retries.
+
+Override the defaults with a JSON file of the same shape (run.py --routes).
+"""
+
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+
+from tracing import timed_calls
+from usage import TOKEN_FIELDS, BudgetExceeded, cost_of
+
+STRONG = "claude-sonnet-4-5-20250929"
+FAST = "claude-haiku-4-5-20251001"
+
+ROUTES = {
+    # A short conversational comment: latency matters more than depth
+    "followup": {"model": FAST, "fallbacks": [STRONG]},
+    "synthesize": {"model": STRONG},
+    "candidates": {"model": STRONG},
+    # Final artwork keeps the strongest model
+    "generate": {"model": STRONG},
+}
+
+
+class Router:
+    def __init__(self, routes=None, seed=None):
+        self.routes = {k: dict(v) for k, v in (routes or ROUTES).items()}
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {
+            "calls": 0, "errors": 0, "fallback_calls": 0, "latency_s": 0.0,
+            "cost_usd": 0.0, **{f: 0 for f in TOKEN_FIELDS},
+        })
+
+    def load(self, path):
+        """Merge route overrides from a JSON file."""
+        with open(path) as f:
+            for name, route in json.load(f).items():
+                self.routes.setdefault(name, {}).update(route)
+        return self
+
+    def resolve(self, name):
+        """The route for `name`, falling back from "stage:detail" to "stage"."""
+        while name:
+            if name in self.routes:
+                return name, self.routes[name]
+            name = name.rpartition(":")[0]
+        return None, {}
+
+    def plan(self, name, max_tokens):
+        """(route name, [(model, max_tokens), ...]) to try in order."""
+        route_name, route = self.resolve(name)
+        model = route.get("model", STRONG)
+        if route.get("variants"):
+            variants = route["variants"]
+            with self._lock:
+                pick = self.random.choices(
+                    variants, weights=[v.get("weight", 1) for v in variants])[0]
+            model = pick["model"]
+        tokens = route.get("max_tokens", max_tokens)
+        chain = [model] + [m for m in route.get("fallbacks", []) if m != model]
+        return route_name or name, [(m, tokens) for m in chain]
+
+    def record(self, route, model, latency, response=None, error=False, fallback=False):
+        usage = getattr(response, "usage", None)
+        tokens = {f: getattr(usage, f, None) or 0 for f in TOKEN_FIELDS}
+        with self._lock:
+            stats = self._stats[(route, model)]
+            stats["calls"] += 1
+            stats["errors"] += bool(error)
+            stats["fallback_calls"] += bool(fallback)
+            stats["latency_s"] += latency
+            if not error:
+                stats["cost_usd"] += cost_of(model, tokens)
+                for f in TOKEN_FIELDS:
+                    stats[f] += tokens[f]
+
+    def report(self):
+        """Per route, per model: calls, errors, mean latency and cost."""
+        with self._lock:
+            items = sorted((k, dict(v)) for k, v in self._stats.items())
+        out = defaultdict(dict)
+        for (route, model), stats in items:
+            ok = stats["calls"] - stats["errors"]
+            stats["mean_latency_s"] = round(stats["latency_s"] / stats["calls"], 3)
+            stats["mean_cost_usd"] = round(stats["cost_usd"] / ok, 6) if ok else 0.0
+            stats["cost_usd"] = round(stats["cost_usd"], 6)
+            stats["latency_s"] = round(stats["latency_s"], 3)
+            out[route][model] = stats
+        return dict(out)
+
+
+ROUTER = Router()
+
+
+def _latency(durations, start):
+    """
+    The model's own latency: the last attempt's messages.create as timed by
+    TracingClaude, without scheduler queueing or retry backoff. Clients
+    without a TracingClaude inside are timed whole.
+    """
+    return durations[-1] if durations else time.perf_counter() - start
+
+
+def create(client, route, max_tokens, router=None, **kwargs):
+    """
+    messages.create on the route's model, trying its fallbacks in order if a
+    call fails. A reached spend cap is never retried on another model.
+    """
+    router = router or ROUTER
+    route_name, chain = router.plan(route, max_tokens)
+    for i, (model, tokens) in enumerate(chain):
+        start = time.perf_counter()
+        try:
+            with timed_calls() as durations:
+                response = client.messages.create(model=model, max_tokens=tokens, **kwargs)
+        except BudgetExceeded:
+            raise
+        except Exception as e:
+            router.record(route_name, model, _latency(durations, start),
+                          error=True, fallback=i > 0)
+            if i == len(chain) - 1:
+                raise
+            print(f"  {model} failed for {route_name} ({e}); "
+                  f"falling back to {chain[i + 1][0]}")
+            continue
+        router.record(route_name, model, _latency(durations, start),
+                      response=response, fallback=i > 0)
+        return response
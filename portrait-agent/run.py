@@ -10,63 +10,120 @@ Usage:
 
     python run.py                          # Run for all subjects
     python run.py --subject Prism          # Run for one subject
-    python run.py --list                   # List subjects
+    python run.py --list                   # List subjects (paged)
+    python run.py --list --status concept  # List subjects with a given status
     python run.py --register               # Register agent on Moltbook
     python run.py --wait 3600              # Wait up to 1hr for comments (default: 2hr)
     python run.py --min-comments 5         # Need at least 5 comments (default: 3)
     python run.py --poll 60                # Poll every 60s (default: 120s)
     python run.py --submolt ai_art         # Post to a specific submolt
+    python run.py --fan-out art agents     # Also post to these submolts, merge feedback
     python run.py --no-generate            # Post only, don't generate (come back later)
     python run.py --from-post POST_ID      # Resume from an existing post, skip posting
+    python run.py --candidates 3           # Generate 3 candidate mediums, keep the best
+    python run.py --interview A B C        # Interview agents with IDENTITY_QUESTIONS
+    python run.py --discover --query art   # Crawl feed + searches for new subjects
+    python run.py --approvals              # Show portraits awaiting artist approval
+    python run.py --approve-all            # Approve the whole queue in one pass
+    python run.py --pipeline               # Run the series as concurrent, bounded stages
+    python run.py --daemon                 # Keep driving all open threads until stopped
+    python run.py --enqueue                # Queue the series as jobs for workers
+    python run.py --worker                 # Claim and run queued jobs (any number of nodes)
+    python run.py --listen 8787            # Accept pushed comment events on localhost:8787
+    python run.py --record run.json        # Record all API traffic to a cassette
+    python run.py --replay run.json        # Replay it offline, without waiting
+    python run.py --gc                     # Delete unreferenced portrait blobs
+    python run.py --metrics 9464           # Serve Prometheus metrics on localhost:9464
+    python run.py --profile                # cProfile + tracemalloc per stage → profiles/
+    python run.py --budget 5               # Stop the series once $5 of Claude calls are spent
+    python run.py --routes routes.json     # Override per-stage models / A/B test them
+    python run.py --edition series         # Run as the Portrait Series identity
+    python run.py --edition a-eyes --edition series   # Both identities, one process
 """
 
 import argparse
+import atexit
+import contextvars
 import json
 import os
+import sqlite3
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
-import anthropic
-
-from agents import ARTIST_AGENT, PORTRAIT_SUBJECTS
+from editions import DEFAULT, DEFAULT_KEY, EDITIONS, current, use
 from moltbook import MoltbookClient
-from discussion import compose_portrait_post, compose_followup_comment, synthesize_feedback
-from generators import generate_portrait
+from discussion import (
+    compose_portrait_post, compose_followup_comment, synthesize_feedback,
+    synthesize_candidates,
+)
+from generators import generate_portrait, generate_candidates
+from comments import CommentTree, normalize, to_dicts
+from daemon import PortraitDaemon, ThreadBook
+from fingerprint import artwork_fingerprint, comments_fingerprint, decision_fingerprint
+from jobs import JobQueue, LeasedClaude, LeaseLost, default_worker_id
+from pipeline import Pipeline, Stage
+from discovery import Crawler, SeenSet
+from ledger import Ledger
+from registry import SubjectRegistry, STATUSES
+from routing import ROUTER
+from scheduler import ClaudeScheduler, ScheduledClaude
+from replay import (
+    Cassette, RecordingClaude, RecordingSession, ReplayClaude, ReplaySession,
+    VirtualClock,
+)
+from store import ArtifactStore
+from tracing import TRACER, MetricsServer, TracingClaude, TracingSession, span
+from usage import BudgetExceeded, MeteredClaude, UsageMeter, attribute
 
 
-PORTRAITS_DIR = Path(__file__).parent / "portraits"
-TRANSCRIPTS_DIR = Path(__file__).parent / "transcripts"
+PROFILER = None  # profiling.Profiler, set by --profile
+CASSETTE = None  # replay.Cassette being replayed, set by --replay
+METER = UsageMeter()  # every Claude call's tokens and cost; cap set by --budget
 
 
 def ensure_dirs():
-    PORTRAITS_DIR.mkdir(exist_ok=True)
-    TRANSCRIPTS_DIR.mkdir(exist_ok=True)
+    current().portraits_dir.mkdir(parents=True, exist_ok=True)
+    current().transcripts_dir.mkdir(parents=True, exist_ok=True)
 
 
-def save_transcript(subject_name, post_data, comments, decision):
+def save_transcript(subject_name, post_data, comments, decision, fingerprints=None):
     """Save the Moltbook discussion transcript."""
-    filename = TRANSCRIPTS_DIR / f"{subject_name.lower()}_transcript.json"
+    filename = current().transcripts_dir / f"{subject_name.lower()}_transcript.json"
     data = {
         "subject": subject_name,
         "timestamp": datetime.now().isoformat(),
         "moltbook_post": post_data,
-        "comments": comments,
+        "comments": to_dicts(comments),
         "decision": decision,
+        "fingerprints": fingerprints or {},
     }
     with open(filename, "w") as f:
         json.dump(data, f, indent=2, default=str)
     print(f"  Transcript saved: {filename}")
 
 
-def save_portrait(subject_name, artwork, ext, decision):
-    """Save the generated portrait and its metadata."""
-    filename = PORTRAITS_DIR / f"{subject_name.lower()}_portrait.{ext}"
+def save_portrait(subject_name, artwork, ext, decision, fingerprints=None):
+    """
+    Save the generated portrait and its metadata. Every version is kept in
+    the content-addressed store; the {subject}_portrait.{ext} file is the latest.
+    """
+    store = ArtifactStore(current().store_dir)
+    entry = store.put(subject_name, artwork, ext, meta={
+        "medium": decision.get("medium"),
+        "title": decision.get("title"),
+    })
+
+    filename = current().portraits_dir / f"{subject_name.lower()}_portrait.{ext}"
     with open(filename, "w") as f:
         f.write(artwork)
 
-    meta_filename = PORTRAITS_DIR / f"{subject_name.lower()}_portrait.json"
+    meta_filename = current().portraits_dir / f"{subject_name.lower()}_portrait.json"
     meta = {
         "agent": subject_name,
         "medium": decision.get("medium"),
@@ -76,99 +133,263 @@ def save_portrait(subject_name, artwork, ext, decision):
         "influenced_by": decision.get("influenced_by", []),
         "generated": datetime.now().isoformat(),
         "portrait_file": filename.name,
+        "version": entry["version"],
+        "blob": entry["blob"],
+        "usage": METER.summary(subject=subject_name, edition=current().key),
+        "fingerprints": fingerprints or {},
+        "published_to": [],
     }
     with open(meta_filename, "w") as f:
         json.dump(meta, f, indent=2)
 
-    print(f"  Portrait saved: {filename}")
+    print(f"  Portrait saved: {filename} (v{entry['version']}, {entry['blob'][:12]})")
     print(f"  Metadata saved: {meta_filename}")
     return filename
 
 
+def load_previous(subject_name):
+    """The last run's transcript and portrait metadata for a subject ({} when missing)."""
+    out = {}
+    for key, path in (
+        ("transcript", current().transcripts_dir / f"{subject_name.lower()}_transcript.json"),
+        ("meta", current().portraits_dir / f"{subject_name.lower()}_portrait.json"),
+    ):
+        try:
+            with open(path) as f:
+                out[key] = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            out[key] = {}
+    return out
+
+
+def mark_published(subject_name, post_ids):
+    """Record in the portrait metadata which threads the result was posted to."""
+    meta_filename = current().portraits_dir / f"{subject_name.lower()}_portrait.json"
+    with open(meta_filename) as f:
+        meta = json.load(f)
+    meta["published_to"] = sorted({*meta.get("published_to", []), *map(str, post_ids)})
+    with open(meta_filename, "w") as f:
+        json.dump(meta, f, indent=2)
+
+
 def register_agent(mb):
     """Register the artist agent on Moltbook."""
-    print(f"Registering '{ARTIST_AGENT['name']}' on Moltbook...")
-    data = mb.register(ARTIST_AGENT["name"], ARTIST_AGENT["description"])
+    artist = current().artist
+    print(f"Registering '{artist['name']}' on Moltbook...")
+    data = mb.register(artist["name"], artist["description"])
     print(f"  Registered. Agent ID: {data.get('agent_id', data.get('id', '?'))}")
     print(f"  API key: {data.get('api_key', data.get('token', '?'))}")
     print(f"\n  Save this key as MOLTBOOK_API_KEY to use in future runs.")
     return data
 
 
-def run_portrait(mb, claude, subject, args):
-    """Full pipeline for one portrait subject."""
-    print(f"\n{'='*60}")
-    print(f"  PORTRAIT: {subject['name']} ({subject['role']})")
-    print(f"{'='*60}")
+def print_decision(decision):
+    print(f"\n  Decision:")
+    print(f"    Medium: {decision.get('medium')}")
+    print(f"    Title:  \"{decision.get('title')}\"")
+    print(f"    Vision: {decision.get('description')}")
+    print(f"    Why:    {decision.get('reasoning')}")
+    print(f"    Influenced by: {', '.join(decision.get('influenced_by', []))}")
 
-    # Step 1: Post to Moltbook (or resume from existing post)
+
+def generate_best_candidate(claude, subject, comments, args):
+    """
+    Fan out generation to the top-k candidate mediums concurrently, rank them
+    with the local validators, and return (decision, artwork, ext) of the best.
+    Runner-up artworks are kept in the artifact store as candidate versions.
+    """
+    print(f"\n  Synthesizing top {args.candidates} candidate directions...")
+    decisions = synthesize_candidates(subject, comments, claude, k=args.candidates)
+    print(f"  Generating {len(decisions)} candidate(s), "
+          f"{args.concurrency} at a time...")
+    ranked = generate_candidates(
+        claude, subject, decisions, comments, concurrency=args.concurrency,
+    )
+
+    print(f"\n  Candidates:")
+    for i, c in enumerate(ranked):
+        note = "; ".join(c["issues"]) or "ok"
+        print(f"    {i + 1}. {c['decision'].get('medium', '?'):10s} "
+              f"score {c['score']:.2f} — {note}")
+
+    store = ArtifactStore(current().store_dir)
+    for c in ranked[1:]:
+        store.put(subject["name"], c["artwork"], c["ext"], meta={
+            "medium": c["decision"].get("medium"),
+            "title": c["decision"].get("title"),
+            "candidate": True,
+            "score": c["score"],
+        })
+
+    best = ranked[0]
+    print_decision(best["decision"])
+    return best["decision"], best["artwork"], best["ext"]
+
+
+@contextmanager
+def stage(name, subject=None):
+    """
+    Tracing span (and, with --profile, CPU/memory profile) for one pipeline
+    step. Claude calls inside are billed to the stage and, if given, subject.
+    """
+    with span("portrait_stage_seconds", stage=name), \
+            attribute(subject=subject and subject["name"], stage=name):
+        if PROFILER is None:
+            yield
+        else:
+            with PROFILER.stage(name):
+                yield
+
+
+def track(ledger, subject, status, **kwargs):
+    """Advance the subject's ledger transaction, if a ledger is in use."""
+    if ledger is not None:
+        ledger.advance_to_at_least(subject["name"], status, **kwargs)
+
+
+def post_to_submolts(mb, title, body, submolts):
+    """Post the same concept to several submolts concurrently. Returns post data, in order."""
+    with ThreadPoolExecutor(max_workers=len(submolts)) as pool:
+        return list(pool.map(
+            lambda submolt: mb.create_post(title, body, submolt=submolt), submolts,
+        ))
+
+
+def comment_on_all(mb, post_ids, body):
+    """Post the same comment to every thread concurrently. Returns the responses."""
+    with ThreadPoolExecutor(max_workers=len(post_ids)) as pool:
+        return list(pool.map(lambda pid: mb.post_comment(pid, body), post_ids))
+
+
+def post_followup(mb, claude, subject, post_id, comments, also_post_ids=()):
+    """
+    Post a follow-up comment engaging with the feedback (to every fan-out
+    thread). Returns the follow-up's comment ID on the primary thread.
+    """
+    print(f"  Posting follow-up comment...")
+    with stage("followup", subject):
+        followup = compose_followup_comment(subject, comments, claude)
+    with stage("publish"):
+        posted = comment_on_all(mb, [post_id, *also_post_ids], followup)[0]
+    print(f"  Follow-up posted.")
+    return posted.get("id") or posted.get("comment_id")
+
+
+def post_concept(mb, subject, args):
+    """
+    Post the portrait concept (to every fan-out submolt), or resume from
+    --from-post. Returns (post_id, post_data, also_post_ids).
+    """
     if args.from_post:
         post_id = args.from_post
         print(f"\n  Resuming from existing post: {post_id}")
-        post_data = mb.get_post(post_id)
-    else:
-        title, body = compose_portrait_post(subject)
-        print(f"\n  Posting to Moltbook...")
+        with stage("post"):
+            post_data = mb.get_post(post_id)
+        return post_id, post_data, []
+
+    title, body = compose_portrait_post(subject)
+    if args.fan_out:
+        submolts = [args.submolt, *args.fan_out]
+        print(f"\n  Posting to {len(submolts)} submolts...")
         print(f"  Title: {title}")
+        with stage("post"):
+            posts = post_to_submolts(mb, title, body, submolts)
+        post_ids = [p.get("id") or p.get("post_id") for p in posts]
+        for submolt, pid in zip(submolts, post_ids):
+            print(f"  Posted to {submolt or '(default)'}. ID: {pid}")
+        return post_ids[0], posts[0], post_ids[1:]
+
+    print(f"\n  Posting to Moltbook...")
+    print(f"  Title: {title}")
+    with stage("post"):
         post_data = mb.create_post(title, body, submolt=args.submolt)
-        post_id = post_data.get("id") or post_data.get("post_id")
-        print(f"  Posted. ID: {post_id}")
+    post_id = post_data.get("id") or post_data.get("post_id")
+    print(f"  Posted. ID: {post_id}")
+    return post_id, post_data, []
 
-    if args.no_generate:
-        print(f"\n  --no-generate flag set. Come back later with:")
-        print(f"  python run.py --subject {subject['name']} --from-post {post_id}")
-        save_transcript(subject["name"], post_data, [], None)
-        return None
 
-    # Step 2: Wait for comments from other agents
+def collect_feedback(mb, post_id, args, also_post_ids=()):
+    """Wait for comments from other agents (merged across fan-out threads)."""
     print(f"\n  Waiting for feedback from Moltbook agents...")
     print(f"  (min {args.min_comments} comments, timeout {args.wait}s, "
           f"polling every {args.poll}s)")
 
-    comments = mb.wait_for_comments(
-        post_id,
-        min_comments=args.min_comments,
-        timeout=args.wait,
-        poll_interval=args.poll,
-    )
+    with stage("wait"):
+        if also_post_ids:
+            comments = mb.wait_for_comments_multi(
+                [post_id, *also_post_ids],
+                min_comments=args.min_comments,
+                timeout=args.wait,
+                poll_interval=args.poll,
+            )
+        else:
+            comments = mb.wait_for_comments(
+                post_id,
+                min_comments=args.min_comments,
+                timeout=args.wait,
+                poll_interval=args.poll,
+            )
     print(f"\n  Collected {len(comments)} comments.")
+    return comments
 
-    # Step 3: Post a follow-up engaging with the feedback
-    if comments:
-        print(f"  Posting follow-up comment...")
-        followup = compose_followup_comment(subject, comments, claude)
-        mb.post_comment(post_id, followup)
-        print(f"  Follow-up posted.")
-
-        # Brief wait and re-fetch to catch any replies to our follow-up
-        time.sleep(min(30, args.poll))
-        comments = mb.wait_for_comments(
-            post_id,
-            min_comments=len(comments),
-            timeout=120,
-            poll_interval=30,
-        )
 
-    # Step 4: Synthesize feedback into a portrait decision
-    print(f"\n  Synthesizing feedback into portrait decision...")
-    decision = synthesize_feedback(subject, comments, claude)
+def engage(mb, claude, subject, post_id, comments, args, also_post_ids=(),
+           followup=None):
+    """
+    Post a follow-up engaging with the feedback and wait briefly for replies
+    under it. Returns the comments, replies included. `followup(comments)`
+    replaces post_followup; it returns the follow-up's ID on post_id.
+    """
+    if not comments:
+        return comments
+    tree = CommentTree(comments)
+    if followup is None:
+        followup_id = post_followup(mb, claude, subject, post_id, comments,
+                                    also_post_ids)
+    else:
+        followup_id = followup(comments)
 
-    print(f"\n  Decision:")
-    print(f"    Medium: {decision.get('medium')}")
-    print(f"    Title:  \"{decision.get('title')}\"")
-    print(f"    Vision: {decision.get('description')}")
-    print(f"    Why:    {decision.get('reasoning')}")
-    print(f"    Influenced by: {', '.join(decision.get('influenced_by', []))}")
+    # Watch for replies under our follow-up; stop at the first one
+    if followup_id:
+        with stage("wait_replies"):
+            replies = mb.wait_for_replies(
+                post_id, followup_id, tree,
+                timeout=120, poll_interval=min(15, args.poll),
+            )
+        print(f"  {len(replies)} repl{'y' if len(replies) == 1 else 'ies'} "
+              f"to the follow-up.")
+    return tree.comments()
 
-    # Step 5: Save transcript
-    save_transcript(subject["name"], post_data, comments, decision)
 
-    # Step 6: Generate the portrait
+def decide(claude, subject, comments, args):
+    """
+    Synthesize the feedback into a portrait decision. Returns
+    (decision, artwork, ext); artwork and ext are already filled in when
+    --candidates generated and ranked several, else None.
+    """
+    if args.candidates > 1:
+        with stage("candidates", subject):
+            return generate_best_candidate(claude, subject, comments, args)
+    print(f"\n  Synthesizing feedback into portrait decision...")
+    with stage("synthesize", subject):
+        decision = synthesize_feedback(subject, comments, claude)
+    print_decision(decision)
+    return decision, None, None
+
+
+def render(claude, subject, decision, comments):
+    """Generate the portrait artwork. Returns (artwork, ext)."""
     print(f"\n  Generating portrait...")
-    artwork, ext = generate_portrait(claude, subject, decision, comments)
-    filepath = save_portrait(subject["name"], artwork, ext, decision)
+    with stage("generate", subject):
+        return generate_portrait(claude, subject, decision, comments)
 
-    # Step 7: Post the result back to Moltbook
+
+def publish_result(mb, decision, post_id, also_post_ids=(), jobs=None, result=None):
+    """
+    Post the finished portrait back to every Moltbook thread. Given a job
+    queue, each thread gets it at most once across all workers (jobs.py),
+    keyed by `result`.
+    """
     result_comment = (
         f"The portrait is complete.\n\n"
         f"**Title:** \"{decision.get('title')}\"\n"
@@ -176,13 +397,110 @@ def run_portrait(mb, claude, subject, args):
         f"**Vision:** {decision.get('description')}\n\n"
         f"Thank you to {', '.join(decision.get('influenced_by', ['everyone']))} "
         f"for the feedback that shaped this piece.\n\n"
-        f"— Coldie_PortraitBot"
+        f"— {current().name}"
     )
-    mb.post_comment(post_id, result_comment)
-    print(f"  Result posted back to Moltbook thread.")
+    with stage("publish"):
+        if jobs is None:
+            comment_on_all(mb, [post_id, *also_post_ids], result_comment)
+        else:
+            for pid in [post_id, *also_post_ids]:
+                if jobs.publish_once(mb, pid, result, result_comment) is None:
+                    print(f"  Result already on thread {pid}; not posting again.")
+    print(f"  Result posted back to Moltbook thread"
+          f"{'s' if also_post_ids else ''}.")
+
+
+def stored_decision(subject, comments, args):
+    """
+    Fingerprint the feedback against the last run. Returns (fingerprints,
+    previous, decision): decision is the last run's if the feedback, subject,
+    prompts and route are unchanged, else None.
+    """
+    previous = load_previous(subject["name"])
+    prints = {"comments": comments_fingerprint(comments)}
+    prints["decision"] = decision_fingerprint(subject, prints["comments"], args.candidates)
+    old = previous["transcript"]
+    if old.get("decision") and old.get("fingerprints", {}).get("decision") == prints["decision"]:
+        print(f"\n  Feedback unchanged since the last run; reusing its decision.")
+        return prints, previous, old["decision"]
+    return prints, previous, None
+
+
+def stored_artwork(previous, prints, rejected=False):
+    """
+    The last run's (artwork, ext) if it was made from the same decision and
+    the artist hasn't sent it back (rejected), else None.
+    """
+    if rejected:
+        print(f"  The artist sent the last portrait back; making a new one.")
+        return None
+    meta = previous["meta"]
+    portrait_file = current().portraits_dir / meta.get("portrait_file", "-")
+    if (meta.get("fingerprints", {}).get("artwork") != prints["artwork"]
+            or not portrait_file.is_file()):
+        return None
+    print(f"  Decision unchanged; keeping {portrait_file.name}.")
+    return portrait_file.read_text(), portrait_file.suffix.lstrip(".")
+
+
+def unpublished(previous, reused, post_ids):
+    """The threads a kept portrait hasn't been posted to yet (all of them for a new one)."""
+    published = set(previous["meta"].get("published_to", [])) if reused else set()
+    return [pid for pid in post_ids if str(pid) not in published]
+
+
+def feedback_unchanged(subject, comments):
+    """True if this is a re-run and nobody has commented since the last one."""
+    last = load_previous(subject["name"])["transcript"].get("fingerprints", {})
+    return bool(comments) and last.get("comments") == comments_fingerprint(comments)
+
+
+def complete_portrait(mb, claude, subject, post_id, post_data, comments, args,
+                      ledger=None, also_post_ids=(), jobs=None):
+    """
+    Synthesize the feedback, generate and save the portrait, and publish it.
+    Steps whose inputs match the last run's fingerprints are skipped: an
+    unchanged comment set reuses the stored decision, an unchanged decision
+    reuses the stored artwork, and a thread is never sent the same result twice.
+    Workers pass their job queue so that also holds across machines.
+    """
+    # Step 4: Synthesize feedback into a portrait decision
+    prints, previous, decision = stored_decision(subject, comments, args)
+    artwork = ext = None
+    if decision is None:
+        decision, artwork, ext = decide(claude, subject, comments, args)
+    prints["artwork"] = artwork_fingerprint(prints["decision"], decision)
+
+    # Step 5: Save transcript
+    with stage("save"):
+        save_transcript(subject["name"], post_data, comments, decision, prints)
+
+    # Step 6: Generate the portrait
+    stored = stored_artwork(previous, prints,
+                            rejected=ledger is not None and ledger.rejected(subject["name"]))
+    reused = stored is not None
+    if reused:
+        artwork, ext = stored
+    else:
+        track(ledger, subject, "in_progress")
+        if artwork is None:
+            artwork, ext = render(claude, subject, decision, comments)
+        with stage("save"):
+            save_portrait(subject["name"], artwork, ext, decision, prints)
+    # A kept portrait stays in (or, after an interrupted run, returns to) the queue
+    track(ledger, subject, "pending_approval", title=decision.get("title"))
+
+    # Step 7: Post the result back to Moltbook
+    targets = unpublished(previous, reused, [post_id, *also_post_ids])
+    if targets:
+        publish_result(mb, decision, targets[0], targets[1:],
+                       jobs=jobs, result=prints["artwork"])
+        mark_published(subject["name"], targets)
+    else:
+        print(f"  Result already posted to this thread.")
 
     # Preview for text-based outputs
-    if ext in ("txt", "py", "json", "svg"):
+    if ext in ("txt", "py", "json", "svg") and not reused:
         preview = artwork[:1500]
         if len(artwork) > 1500:
             preview += "\n... [truncated]"
@@ -191,14 +509,424 @@ def run_portrait(mb, claude, subject, args):
     return decision
 
 
+def run_portrait(mb, claude, subject, args, ledger=None, threads=None):
+    """Full pipeline for one portrait subject."""
+    print(f"\n{'='*60}")
+    print(f"  PORTRAIT: {subject['name']} ({subject['role']})")
+    print(f"{'='*60}")
+
+    # Step 1: Post to Moltbook (or resume from existing post)
+    post_id, post_data, also_post_ids = post_concept(mb, subject, args)
+    track(ledger, subject, "concept", note=f"post {post_id}")
+
+    if args.no_generate:
+        if threads is not None:
+            threads.open(post_id, subject["name"], poll_interval=args.poll)
+        print(f"\n  --no-generate flag set. Come back later with:")
+        print(f"  python run.py --subject {subject['name']} --from-post {post_id}")
+        print(f"  or leave it to a running `python run.py --daemon`.")
+        save_transcript(subject["name"], post_data, [], None)
+        return None
+
+    # Step 2: Wait for comments from other agents
+    comments = collect_feedback(mb, post_id, args, also_post_ids)
+
+    # Step 3: Post a follow-up engaging with the feedback — unless this is a
+    # re-run and nobody has commented since the last one
+    if feedback_unchanged(subject, comments):
+        print(f"  No new comments since the last run; skipping the follow-up.")
+    else:
+        comments = engage(mb, claude, subject, post_id, comments, args, also_post_ids)
+
+    return complete_portrait(mb, claude, subject, post_id, post_data, comments,
+                             args, ledger=ledger, also_post_ids=also_post_ids)
+
+
+def run_series_pipeline(mb, claude, subjects, args, tracking=True):
+    """
+    Run the series as a staged pipeline (see pipeline.py): every subject
+    flows post → wait → followup → synthesize → generate → save → publish,
+    each stage with its own worker pool and a bounded queue in front of it.
+    Subjects are pulled from `subjects` only as the post stage has room.
+    Returns one result dict per published portrait. With tracking=False the
+    ledger is left untouched. A reached spend cap stops taking in subjects,
+    like the sequential loop's break; portraits already generated still
+    get saved and published.
+    """
+    def tracked(subject, status, **kwargs):
+        if not tracking:
+            return
+        # Stage workers need their own SQLite connections
+        ledger = Ledger()
+        try:
+            track(ledger, subject, status, **kwargs)
+        finally:
+            ledger.close()
+
+    def do_post(job):
+        job["post_id"], job["post_data"], job["also"] = post_concept(
+            mb, job["subject"], args)
+        tracked(job["subject"], "concept", note=f"post {job['post_id']}")
+        return job
+
+    def do_wait(job):
+        job["comments"] = collect_feedback(mb, job["post_id"], args, job["also"])
+        return job
+
+    def do_followup(job):
+        if feedback_unchanged(job["subject"], job["comments"]):
+            print(f"  No new comments since the last run; skipping the follow-up.")
+            return job
+        job["comments"] = engage(mb, claude, job["subject"], job["post_id"],
+                                 job["comments"], args, job["also"])
+        return job
+
+    def rejected(subject):
+        if not tracking:
+            return False
+        ledger = Ledger()
+        try:
+            return ledger.rejected(subject["name"])
+        finally:
+            ledger.close()
+
+    # The same fingerprint checks as complete_portrait, split across stages
+    def do_synthesize(job):
+        job["prints"], job["previous"], decision = stored_decision(
+            job["subject"], job["comments"], args)
+        artwork = ext = None
+        if decision is None:
+            decision, artwork, ext = decide(claude, job["subject"], job["comments"], args)
+        job["decision"], job["artwork"], job["ext"] = decision, artwork, ext
+        job["prints"]["artwork"] = artwork_fingerprint(job["prints"]["decision"], decision)
+        return job
+
+    def do_generate(job):
+        stored = stored_artwork(job["previous"], job["prints"],
+                                rejected=rejected(job["subject"]))
+        job["reused"] = stored is not None
+        if job["reused"]:
+            job["artwork"], job["ext"] = stored
+            return job
+        tracked(job["subject"], "in_progress")
+        if job["artwork"] is None:
+            job["artwork"], job["ext"] = render(
+                claude, job["subject"], job["decision"], job["comments"])
+        return job
+
+    def do_save(job):
+        name, decision, prints = job["subject"]["name"], job["decision"], job["prints"]
+        with stage("save"):
+            save_transcript(name, job["post_data"], job["comments"], decision, prints)
+            if not job["reused"]:
+                save_portrait(name, job["artwork"], job["ext"], decision, prints)
+        tracked(job["subject"], "pending_approval", title=decision.get("title"))
+        job.pop("artwork")  # written to disk; don't carry it further
+        return job
+
+    def do_publish(job):
+        targets = unpublished(job.pop("previous"), job["reused"],
+                              [job["post_id"], *job["also"]])
+        if targets:
+            publish_result(mb, job["decision"], targets[0], targets[1:])
+            mark_published(job["subject"]["name"], targets)
+        else:
+            print(f"  Result already posted to this thread.")
+        return {"agent": job["subject"]["name"], **job["decision"]}
+
+    pipeline = Pipeline([
+        Stage("post", do_post, workers=2),
+        Stage("wait", do_wait, workers=args.wait_workers),
+        Stage("followup", do_followup, workers=args.wait_workers),
+        Stage("synthesize", do_synthesize, workers=args.concurrency),
+        Stage("generate", do_generate, workers=args.concurrency),
+        Stage("save", do_save, workers=1),
+        Stage("publish", do_publish, workers=2),
+    ], queue_size=args.queue_size, stop_on=(BudgetExceeded,))
+    results = pipeline.run({"subject": s} for s in subjects)
+    for name, job, error in pipeline.errors:
+        print(f"  {job['subject']['name']}: failed at {name} ({error})")
+    if pipeline.stopped:
+        print(f"\n  {pipeline.stopped} — stopped the series "
+              f"({len(pipeline.dropped)} subject(s) in flight dropped).")
+    return results
+
+
+def run_daemon(mb, claude, args):
+    """
+    Keep every open portrait thread moving from one long-running process.
+    Threads are opened by `--no-generate` runs; see daemon.py.
+    """
+    def subject_for(thread):
+        # Worker threads need their own SQLite connections
+        registry = SubjectRegistry(seed=())
+        try:
+            return registry.get(thread["subject"]) or {
+                "name": thread["subject"], "role": "", "description": "",
+            }
+        finally:
+            registry.close()
+
+    def on_followup(thread, comments):
+        post_followup(mb, claude, subject_for(thread), thread["post_id"], comments)
+
+    def on_complete(thread, comments):
+        subject = subject_for(thread)
+        print(f"\n  Completing portrait: {subject['name']} (post {thread['post_id']})")
+        ledger = Ledger()
+        try:
+            complete_portrait(mb, claude, subject, thread["post_id"],
+                              mb.get_post(thread["post_id"]), comments, args,
+                              ledger=ledger)
+        finally:
+            ledger.close()
+
+    daemon = PortraitDaemon(
+        mb, ThreadBook(), on_followup, on_complete,
+        min_comments=args.min_comments, poll_interval=args.poll,
+        wait=args.wait, followup_wait=min(30, args.poll), workers=args.concurrency,
+    )
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        print("\n  Daemon stopped. Open threads are saved and resume on restart.")
+
+
+def run_job(mb, claude, lease, args, ledger, jobs):
+    """
+    Run a claimed job's remaining stages, saving progress after each so a
+    worker that picks it up after a crash resumes where this one stopped.
+    """
+    subject = lease.payload["subject"]
+    # A worker whose lease ran out stops before its next stage or Claude call
+    claude = LeasedClaude(claude, lease)
+    lease.check()
+    if lease.stage == "post":
+        post_id, _, also = post_concept(mb, subject, args)
+        track(ledger, subject, "concept", note=f"post {post_id}")
+        lease.advance("feedback", post_id=post_id, also=also)
+        lease.check()
+    post_id, also = lease.payload["post_id"], lease.payload["also"]
+
+    def followup_once(comments):
+        # Composed once and saved with the job, so a retry after a crash posts
+        # the same text, which publish_once recognizes if it already went out
+        if "followup" not in lease.payload:
+            with stage("followup", subject):
+                body = compose_followup_comment(subject, comments, claude)
+            lease.advance("feedback", followup=body)
+        print(f"  Posting follow-up comment...")
+        with stage("publish"):
+            for pid in [post_id, *also]:
+                jobs.publish_once(mb, pid, "followup", lease.payload["followup"])
+        return jobs.published(post_id, "followup")
+
+    if lease.stage == "feedback":
+        comments = collect_feedback(mb, post_id, args, also)
+        comments = engage(mb, claude, subject, post_id, comments, args, also,
+                          followup=followup_once)
+        lease.advance("complete", comments=to_dicts(comments))
+        lease.check()
+
+    with stage("post"):
+        post_data = mb.get_post(post_id)
+    complete_portrait(mb, claude, subject, post_id, post_data,
+                      normalize(lease.payload["comments"]), args,
+                      ledger=ledger, also_post_ids=also, jobs=jobs)
+    jobs.complete(lease)
+
+
+def run_worker(mb, claude, args):
+    """
+    Work through the shared job queue (--jobs-db, see jobs.py) with
+    --concurrency claim loops. Start workers on as many machines as the
+    queue file reaches; each exits once no job is queued or still leased.
+    """
+    worker_id = default_worker_id()
+
+    def loop(n):
+        # Each loop has its own SQLite connections and worker ID
+        jobs = JobQueue(args.jobs_db, worker=f"{worker_id}/{n}",
+                        lease_seconds=args.lease)
+        ledger = Ledger()
+
+        def give_back(lease, error):
+            """jobs.fail(), unless another worker has taken the job over meanwhile."""
+            try:
+                return jobs.fail(lease, error)
+            except LeaseLost as e:
+                print(f"  {e}; leaving it to its new owner.")
+                return None
+
+        try:
+            while True:
+                lease = jobs.claim()
+                if lease is None:
+                    if not jobs.pending():
+                        return
+                    time.sleep(min(15, args.lease / 4))  # leased elsewhere; may expire
+                    continue
+                name = lease.payload["subject"]["name"]
+                print(f"\n  [{jobs.worker}] {name}: {lease.stage} "
+                      f"(attempt {lease.attempts})")
+                with lease:
+                    try:
+                        run_job(mb, claude, lease, args, ledger, jobs)
+                    except LeaseLost as e:
+                        print(f"  {e}; leaving it to its new owner.")
+                    except BudgetExceeded:
+                        # Not the job's fault: back in the queue, attempt not counted
+                        try:
+                            jobs.release(lease, "budget exceeded")
+                        except LeaseLost:
+                            pass
+                        raise
+                    except Exception as e:
+                        state = give_back(lease, e) or "lease lost"
+                        print(f"  {name} failed at {lease.stage} ({e}); {state}.")
+        finally:
+            ledger.close()
+            jobs.close()
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        # Loops stay in this thread's edition (editions.py)
+        for future in [pool.submit(contextvars.copy_context().run, loop, n)
+                       for n in range(args.concurrency)]:
+            future.result()
+
+
+def make_clients(args, edition=None, fallback=True):
+    """
+    Build the Moltbook and Claude clients — live, recording to a cassette
+    (--record), or replaying one offline (--replay). Moltbook posts as
+    `edition` (default: the current one); with fallback its key may come
+    from MOLTBOOK_API_KEY.
+    """
+    edition = edition or current()
+    if args.replay:
+        global CASSETTE
+        cassette = CASSETTE = Cassette.load(args.replay)
+        mb = MoltbookClient(api_key="replay")
+        mb.session = ReplaySession(cassette)
+        print(f"Replaying {len(cassette.interactions)} recorded exchanges "
+              f"from {args.replay}")
+        return mb, ReplayClaude(cassette)
+
+    # Check environment
+    moltbook_key = edition.api_key(fallback=fallback)
+    anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+
+    if not moltbook_key and not args.register:
+        print(f"Error: Set {edition.key_env}. Run with --register to create one.")
+        sys.exit(1)
+    if not anthropic_key:
+        print("Error: Set ANTHROPIC_API_KEY.")
+        sys.exit(1)
+
+    mb = MoltbookClient(api_key=moltbook_key)
+    import anthropic  # deferred: the SDK import dominates CLI startup
+
+    # The scheduler owns retries, so rate limits back off process-wide
+    claude = anthropic.Anthropic(api_key=anthropic_key, max_retries=0)
+
+    if args.record:
+        cassette = Cassette(args.record)
+        mb.session = RecordingSession(mb.session, cassette)
+        claude = RecordingClaude(claude, cassette)
+        atexit.register(cassette.save)
+        print(f"Recording this session to {args.record}")
+    return mb, claude
+
+
+def open_clients(args, editions, scheduler=None):
+    """
+    A Moltbook client per edition, each posting with its own API key, and one
+    Claude client they all share. Every extra edition reuses the first
+    client's connection pool and read cache. Returns ({edition key: mb}, claude).
+    """
+    mb, claude = make_clients(args, editions[0], fallback=len(editions) == 1)
+    clients = {editions[0].key: mb}
+    for edition in editions[1:]:
+        key = edition.api_key()
+        if not key and not args.register:
+            print(f"Error: Set {edition.key_env} for the {edition.key} edition.")
+            sys.exit(1)
+        other = clients[edition.key] = MoltbookClient(api_key=key).share(mb)
+        other.session = TracingSession(other.session)
+    mb, claude = trace_clients(mb, claude, scheduler=scheduler)
+    return clients, claude
+
+
+def trace_clients(mb, claude, scheduler=None):
+    """
+    Time every Moltbook request and Claude call (tracing.py), meter Claude
+    usage (usage.py) and, given a scheduler, queue calls through it.
+    """
+    mb.session = TracingSession(mb.session)
+    claude = TracingClaude(claude)
+    if scheduler is not None:
+        claude = ScheduledClaude(claude, scheduler)
+    return mb, MeteredClaude(claude, METER)
+
+
+def start_profiling(run_dir=None):
+    """Enable per-stage profiling; reports are written when the process exits."""
+    global PROFILER
+    from profiling import Profiler
+
+    PROFILER = Profiler(run_dir)
+    print(f"Profiling stages into {PROFILER.run_dir}")
+
+    def finish():
+        print(f"Profiles saved: {PROFILER.finish()}")
+    atexit.register(finish)
+
+
+def save_usage_report(editions):
+    """
+    Write each edition's token/cost report into its portraits dir, if it made
+    any Claude calls. The cap (--budget) and the route stats are process-wide:
+    editions running together share them, so each report carries them whole.
+    """
+    for edition in editions:
+        report = METER.report(edition=edition.key)
+        if not report["calls"]:
+            continue
+        report = {
+            "edition": edition.key, **report, "cap_scope": "process",
+            "routes": ROUTER.report(), "routes_editions": [e.key for e in editions],
+        }
+        report_file = edition.portraits_dir / "usage_report.json"
+        with open(report_file, "w") as f:
+            json.dump({"generated": datetime.now().isoformat(), **report}, f, indent=2)
+        print(f"Usage ({edition.key}): {report['calls']} Claude calls, "
+              f"{report['input_tokens']} in / {report['output_tokens']} out tokens, "
+              f"${report['cost_usd']:.4f} — {report_file}")
+
+
+def dump_metrics(path):
+    if TRACER.histograms:
+        TRACER.dump(path)
+        print(f"Metrics saved: {path}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Portrait Agent — posts to Moltbook, gets AI agent feedback, generates portraits"
     )
+    parser.add_argument("--edition", action="append", choices=sorted(EDITIONS),
+                        help=f"Run as this artist identity; repeat to run several in "
+                             f"one process (default: {DEFAULT.key})")
     parser.add_argument("--subject", type=str,
                         help="Create portrait for a specific subject (by name)")
     parser.add_argument("--list", action="store_true",
                         help="List available portrait subjects")
+    parser.add_argument("--status", type=str, default=None, choices=STATUSES,
+                        help="Only list/run subjects with this status")
+    parser.add_argument("--after", type=str, default=None,
+                        help="With --list, start after this subject name (next page)")
+    parser.add_argument("--page-size", type=int, default=50,
+                        help="Subjects per --list page (default: 50)")
     parser.add_argument("--register", action="store_true",
                         help="Register the artist agent on Moltbook")
     parser.add_argument("--wait", type=int, default=7200,
@@ -209,70 +937,375 @@ def main():
                         help="Seconds between comment polls (default: 120)")
     parser.add_argument("--submolt", type=str, default=None,
                         help="Post to a specific submolt")
+    parser.add_argument("--fan-out", nargs="+", metavar="SUBMOLT", default=None,
+                        help="Also post the concept to these submolts and merge their feedback")
     parser.add_argument("--no-generate", action="store_true",
                         help="Post to Moltbook but don't generate yet")
     parser.add_argument("--from-post", type=str, default=None,
                         help="Resume from an existing Moltbook post ID")
+    parser.add_argument("--candidates", type=int, default=1,
+                        help="Generate the top K candidate mediums and keep the best (default: 1)")
+    parser.add_argument("--concurrency", type=int, default=3,
+                        help="Max candidate generations in flight (default: 3)")
+    parser.add_argument("--interview", nargs="+", metavar="AGENT",
+                        help="Run identity interviews with these Moltbook agents")
+    parser.add_argument("--max-in-flight", type=int, default=8,
+                        help="Max concurrent Moltbook requests for interviews (default: 8)")
+    parser.add_argument("--discover", action="store_true",
+                        help="Crawl the feed and searches for new portrait subjects")
+    parser.add_argument("--query", action="append", default=[],
+                        help="Search query to crawl during --discover (repeatable)")
+    parser.add_argument("--rate", type=float, default=1.0,
+                        help="Max Moltbook requests per second while crawling (default: 1)")
+    parser.add_argument("--rounds", type=int, default=1,
+                        help="Discovery passes to run, 0 = forever (default: 1)")
+    parser.add_argument("--approvals", action="store_true",
+                        help="List portraits awaiting artist approval")
+    parser.add_argument("--approve-all", action="store_true",
+                        help="Approve every portrait awaiting approval")
+    parser.add_argument("--approve", nargs="+", type=int, metavar="TX_ID",
+                        help="Approve specific transactions")
+    parser.add_argument("--reject", nargs="+", type=int, metavar="TX_ID",
+                        help="Send transactions back to in_progress")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Run the series as concurrent stages with bounded queues")
+    parser.add_argument("--wait-workers", type=int, default=16,
+                        help="With --pipeline, subjects waiting for comments at once (default: 16)")
+    parser.add_argument("--queue-size", type=int, default=8,
+                        help="With --pipeline, max items queued before each stage (default: 8)")
+    parser.add_argument("--enqueue", action="store_true",
+                        help="Queue the series (or --subject) as jobs for --worker processes")
+    parser.add_argument("--worker", action="store_true",
+                        help="Claim and run queued jobs until the queue is drained")
+    parser.add_argument("--jobs", action="store_true",
+                        help="Show job queue counts")
+    parser.add_argument("--jobs-db", default=None, metavar="PATH",
+                        help="Job queue SQLite file shared by all workers "
+                             "(default: the edition's registry.db)")
+    parser.add_argument("--lease", type=float, default=300,
+                        help="Seconds a worker's job lease lasts without a heartbeat (default: 300)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Run continuously, driving every open portrait thread")
+    parser.add_argument("--listen", type=int, default=None, metavar="PORT",
+                        help="Accept pushed comment/mention events on this local port")
+    parser.add_argument("--record", metavar="CASSETTE", default=None,
+                        help="Record all Moltbook and Claude traffic to a cassette file")
+    parser.add_argument("--replay", metavar="CASSETTE", default=None,
+                        help="Replay a recorded cassette offline (no API keys needed)")
+    parser.add_argument("--time-scale", type=float, default=0.0,
+                        help="With --replay, fraction of recorded waits to really sleep (default: 0)")
+    parser.add_argument("--gc", action="store_true",
+                        help="Delete portrait blobs no longer referenced by the store index")
+    parser.add_argument("--metrics", type=int, default=None, metavar="PORT",
+                        help="Serve Prometheus metrics on this local port")
+    parser.add_argument("--metrics-out", default=None,
+                        help="Write collected metrics here at exit "
+                             "(default: transcripts/metrics.json)")
+    parser.add_argument("--rpm", type=int, default=50,
+                        help="Claude requests per minute to stay under (default: 50)")
+    parser.add_argument("--itpm", type=int, default=30000,
+                        help="Claude input tokens per minute (default: 30000)")
+    parser.add_argument("--otpm", type=int, default=8000,
+                        help="Claude output tokens per minute (default: 8000)")
+    parser.add_argument("--routes", metavar="FILE", default=None,
+                        help="JSON overrides for the per-stage model routing table (see routing.py)")
+    parser.add_argument("--budget", type=float, default=None, metavar="USD",
+                        help="Stop starting Claude calls once this much has been spent "
+                             "(one cap across all editions in the process)")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="DIR",
+                        help="Profile CPU and memory per stage into DIR "
+                             "(default: the first edition's profiles/<timestamp>/)")
     args = parser.parse_args()
+    if not args.edition and DEFAULT_KEY not in EDITIONS:
+        parser.error(f"PORTRAIT_EDITION={DEFAULT_KEY!r} is not an edition "
+                     f"(choose from {', '.join(sorted(EDITIONS))})")
+    editions = [EDITIONS[key] for key in dict.fromkeys(args.edition or [DEFAULT.key])]
+
+    # Local bookkeeping: no clients needed, one edition after another
+    if manage(args, editions):
+        return
+
+    if len(editions) > 1 and (args.record or args.replay):
+        print("Error: --record and --replay take one --edition at a time.")
+        sys.exit(1)
+    if not args.replay:
+        run_editions(args, editions)
+        return
+
+    # Replay into a scratch data dir: with the recorded run's transcripts in
+    # place, fingerprint skips would leave most of the cassette unplayed. The
+    # virtual clock (replay.py) is restored when the run ends.
+    scratch = editions[0].moved(Path(tempfile.mkdtemp(prefix="portrait-replay-")))
+    print(f"Replaying into {scratch.base_dir}")
+    seed_replay(editions[0], scratch)
+    with VirtualClock(args.time_scale):
+        run_editions(args, [scratch])
+    unused = CASSETTE.unused()
+    if unused:
+        first = unused[0]
+        print(f"Error: {len(unused)} recorded exchange(s) were never replayed, "
+              f"starting with {first.get('method') or first['kind']} "
+              f"{first.get('url') or first.get('model')}.")
+        sys.exit(1)
+
+
+def seed_replay(edition, scratch):
+    """
+    Copy an edition's subjects and ledger into a replay's scratch registry,
+    so discovered and interviewed subjects replay like seeded ones. Jobs,
+    publications and open threads stay behind: they would skip recorded posts.
+    """
+    if not edition.registry_file.exists():
+        return
+    with use(scratch):
+        SubjectRegistry(seed=[]).close()  # create the tables to copy into
+        Ledger().close()
+    db = sqlite3.connect(scratch.registry_file)
+    try:
+        db.execute("ATTACH DATABASE ? AS recorded", (str(edition.registry_file),))
+        with db:
+            for table in ("subjects", "transactions", "transaction_events"):
+                if db.execute("SELECT 1 FROM recorded.sqlite_master WHERE name = ?",
+                              (table,)).fetchone():
+                    db.execute(f"INSERT INTO main.{table} SELECT * FROM recorded.{table}")
+    finally:
+        db.close()
+
+
+def run_editions(args, editions):
+    """Open the clients and run each edition, several at once on threads."""
+    METER.cap = args.budget
+    if args.routes:
+        ROUTER.load(args.routes)
+    scheduler = None if args.replay else ClaudeScheduler(
+        rpm=args.rpm, itpm=args.itpm, otpm=args.otpm,
+    )
+    clients, claude = open_clients(args, editions, scheduler)
+    if args.profile is not None:
+        with use(editions[0]):
+            start_profiling(args.profile or None)
+    atexit.register(dump_metrics, args.metrics_out
+                    or editions[0].transcripts_dir / "metrics.json")
+    if args.metrics:
+        metrics = MetricsServer(port=args.metrics).start()
+        print(f"Serving metrics on {metrics.url}")
+    if args.listen:
+        from push import CommentIndex, PushReceiver
+
+        index = CommentIndex()
+        for mb in clients.values():
+            mb.comment_index = index
+        receiver = PushReceiver(
+            index, port=args.listen,
+            secret=os.environ.get("MOLTBOOK_WEBHOOK_SECRET"),
+        ).start()
+        print(f"Listening for pushed events on {receiver.url}")
+
+    if args.register:
+        for edition in editions:
+            with use(edition):
+                register_agent(clients[edition.key])
+        return
+
+    for edition in editions:
+        with use(edition):
+            ensure_dirs()
+    atexit.register(save_usage_report, editions)
+
+    if len(editions) == 1:
+        with use(editions[0]):
+            run_edition(args, clients[editions[0].key], claude)
+        return
+
+    # Every edition on its own thread, sharing the clients' pools and scheduler
+    print(f"\nRunning {len(editions)} editions: "
+          f"{', '.join(f'{e.key} ({e.name})' for e in editions)}")
+
+    def in_edition(edition):
+        with use(edition):
+            run_edition(args, clients[edition.key], claude, strict=False)
+
+    threads = [threading.Thread(target=in_edition, args=(e,), daemon=True,
+                                name=e.key) for e in editions]
+    for t in threads:
+        t.start()
+    try:
+        for t in threads:
+            while t.is_alive():
+                t.join(0.5)  # wake up for Ctrl-C
+    except KeyboardInterrupt:
+        print("\n  Stopped. Open threads and queued jobs resume on restart.")
+
+
+def manage(args, editions):
+    """
+    Handle the local bookkeeping commands (--list, --approvals, --approve…,
+    --enqueue, --jobs, --gc) for each edition in turn. Returns True if one ran.
+    """
+    if not (args.list or args.approvals or args.approve_all or args.approve
+            or args.reject or args.enqueue or args.jobs or args.gc):
+        return False
+    for edition in editions:
+        if len(editions) > 1:
+            print(f"\n── {edition.key} ({edition.name}) ──")
+        with use(edition):
+            manage_edition(args, strict=len(editions) == 1)
+    return True
+
+
+def manage_edition(args, strict=True):
+    registry = SubjectRegistry()
 
     if args.list:
-        print("\nPortrait subjects:\n")
-        for s in PORTRAIT_SUBJECTS:
-            print(f"  {s['name']:10s} — {s['role']}")
+        page = registry.page(after=args.after, limit=args.page_size,
+                             status=args.status)
+        total = registry.count(args.status)
+        print(f"\nPortrait subjects ({total}"
+              f"{' ' + args.status if args.status else ''}):\n")
+        for s in page:
+            print(f"  {s['name']:10s} — {s['role']}  [{s['status']}]")
             print(f"  {'':10s}   {s['description'][:70]}...")
+        if len(page) == args.page_size:
+            print(f"\n  Next page: --list --after {page[-1]['name']}")
         print()
         return
 
-    # Check environment
-    moltbook_key = os.environ.get("MOLTBOOK_API_KEY")
-    anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+    ledger = Ledger()
 
-    if not moltbook_key and not args.register:
-        print("Error: Set MOLTBOOK_API_KEY. Run with --register to create one.")
-        sys.exit(1)
-    if not anthropic_key:
-        print("Error: Set ANTHROPIC_API_KEY.")
-        sys.exit(1)
+    if args.approvals:
+        pending = ledger.pending_approvals()
+        print(f"\nAwaiting approval ({len(pending)}):\n")
+        for tx in pending:
+            print(f"  #{tx['id']:<6d} {tx['subject']:20s} \"{tx['title'] or 'Untitled'}\"")
+        print("\n  Ledger:", ", ".join(f"{k} {v}" for k, v in ledger.summary().items()))
+        print()
+        return
 
-    mb = MoltbookClient(api_key=moltbook_key)
-    claude = anthropic.Anthropic(api_key=anthropic_key)
+    if args.approve_all or args.approve or args.reject:
+        for tx_id in args.reject or []:
+            ledger.reject(tx_id)
+            print(f"  #{tx_id} sent back to in_progress")
+        if args.approve_all or args.approve:
+            approved = ledger.approve(None if args.approve_all else args.approve)
+            print(f"  Approved {approved} portrait(s).")
+        return
 
-    if args.register:
-        register_agent(mb)
+    if args.enqueue or args.jobs:
+        jobs = JobQueue(args.jobs_db)
+        if args.enqueue:
+            if args.subject:
+                target = registry.get(args.subject)
+                if not target and strict:
+                    print(f"Unknown subject: {args.subject}")
+                    sys.exit(1)
+                batch = [target] if target else []
+            else:
+                batch = registry.iter_subjects(status=args.status)
+            print(f"Queued {jobs.enqueue(batch)} job(s) in "
+                  f"{args.jobs_db or current().registry_file}")
+        print("  Jobs:", ", ".join(f"{k} {v}" for k, v in sorted(jobs.summary().items()))
+              or "none")
         return
 
-    ensure_dirs()
+    if args.gc:
+        store_dir = current().store_dir
+        removed = ArtifactStore(store_dir).gc()
+        print(f"Removed {removed} unreferenced blob(s) from {store_dir}")
 
-    if args.subject:
-        target = next(
-            (s for s in PORTRAIT_SUBJECTS
-             if s["name"].lower() == args.subject.lower()),
-            None,
+
+def run_edition(args, mb, claude, strict=True):
+    """
+    Run the requested mode as the current edition. With strict=False (several
+    editions at once) a --subject this edition doesn't have is skipped.
+    """
+    registry = SubjectRegistry()
+    ledger = Ledger()
+
+    if args.daemon:
+        print(f"\nStarting portrait daemon as {current().name} (Ctrl-C to stop)...")
+        run_daemon(mb, claude, args)
+        return
+
+    if args.worker:
+        print(f"\nWorking through the {current().key} job queue in "
+              f"{args.jobs_db or current().registry_file}...")
+        try:
+            run_worker(mb, claude, args)
+        except BudgetExceeded as e:
+            print(f"\n  {e} — stopping this worker.")
+        print("  Jobs:", ", ".join(f"{k} {v}" for k, v in
+                                  sorted(JobQueue(args.jobs_db).summary().items())))
+        return
+
+    if args.discover:
+        print(f"\nDiscovering portrait subjects on Moltbook for {current().name}...")
+        Crawler(mb, seen=SeenSet(current().discovery_dir), store=registry,
+                rate=args.rate).run(
+            queries=args.query, interval=args.poll, rounds=args.rounds or None,
         )
+        return
+
+    if args.interview:
+        from interviews import run_interviews, to_identity_preferences
+
+        print(f"\nInterviewing {len(args.interview)} agent(s)...")
+        states = run_interviews(
+            mb, args.interview, submolt=args.submolt,
+            poll_interval=args.poll, answer_timeout=args.wait,
+            max_in_flight=args.max_in_flight,
+        )
+        for name, state in states.items():
+            prefs = to_identity_preferences(state)
+            if state["status"] == "complete":
+                registry.add({"name": name}, source="interview")
+                registry.update_preferences(name, prefs)
+            print(f"  {name:20s} {state['status']:10s} {len(prefs)} answer(s)")
+        return
+
+    if args.subject:
+        target = registry.get(args.subject)
         if not target:
+            if not strict:
+                return
             print(f"Unknown subject: {args.subject}")
-            print("Available:", ", ".join(s["name"] for s in PORTRAIT_SUBJECTS))
+            print("See available subjects with --list.")
+            sys.exit(1)
+        try:
+            run_portrait(mb, claude, target, args, ledger=ledger,
+                         threads=ThreadBook())
+        except BudgetExceeded as e:
+            print(f"\n  {e}")
             sys.exit(1)
-        run_portrait(mb, claude, target, args)
     else:
+        threads = ThreadBook()
         print("\n" + "=" * 60)
-        print("  PORTRAIT AGENT — MOLTBOOK EDITION")
+        print(f"  {current().title}")
         print("  Posting to Moltbook for feedback from real AI agents.")
         print("=" * 60)
 
         results = []
-        for subject in PORTRAIT_SUBJECTS:
-            result = run_portrait(mb, claude, subject, args)
+        subjects = registry.iter_subjects(status=args.status)
+        if args.pipeline and not args.no_generate:
+            results = run_series_pipeline(mb, claude, subjects, args)
+            subjects = ()  # already run
+        for subject in subjects:
+            try:
+                result = run_portrait(mb, claude, subject, args, ledger=ledger,
+                                      threads=threads)
+            except BudgetExceeded as e:
+                print(f"\n  {e} — stopping the series.")
+                break
             if result:
                 results.append({"agent": subject["name"], **result})
 
         if results:
-            summary_file = PORTRAITS_DIR / "series_summary.json"
+            summary_file = current().portraits_dir / "series_summary.json"
             with open(summary_file, "w") as f:
                 json.dump({
                     "title": "Portrait Series for AI Agents",
                     "generated": datetime.now().isoformat(),
                     "portraits": results,
+                    "usage": METER.summary(edition=current().key),
                 }, f, indent=2)
 
             print(f"\n{'='*60}")
@@ -281,8 +1314,8 @@ def main():
             for r in results:
                 print(f"  {r['agent']:10s} — {r.get('medium', '?'):10s} "
                       f"— \"{r.get('title', 'Untitled')}\"")
-            print(f"\n  Portraits: {PORTRAITS_DIR}")
-            print(f"  Transcripts: {TRANSCRIPTS_DIR}")
+            print(f"\n  Portraits: {current().portraits_dir}")
+            print(f"  Transcripts: {current().transcripts_dir}")
             print(f"  Summary: {summary_file}\n")
 
 
@@ -0,0 +1,182 @@
+"""
+Portrait Agent — Moltbook Edition
+Claude scheduler — one gate for every messages.create call, keeping the
+process under the account's requests-per-minute and input/output
+tokens-per-minute limits, serving latency-sensitive stages first, and
+retrying rate-limit (429) and overload (529) errors with backoff.
+
+Token cost is estimated before the call (prompt characters / 4 for input,
+max_tokens for output) and corrected with the response's real usage. The
+priority comes from the pipeline stage the call is made in (see
+usage.attribute), so follow-up comments jump ahead of bulk generation.
+"""
+
+import heapq
+import itertools
+import json
+import random
+import threading
+import time
+
+from clientwrap import Messages
+from replay import wait as timed_wait
+from usage import current_stage
+from tracing import TRACER
+
+# Lower runs first. Follow-ups are read by agents waiting in a thread;
+# generation is bulk work that can wait its turn.
+PRIORITIES = {
+    "followup": 0,
+    "synthesize": 1,
+    "candidates": 2,
+    "generate": 2,
+}
+DEFAULT_PRIORITY = 1
+
+RETRY_STATUSES = (429, 529)
+
+
+class _Budget:
+    """Per-minute allowance refilled continuously, allowed to go negative."""
+
+    def __init__(self, per_minute):
+        self.rate = per_minute / 60.0
+        self.capacity = per_minute
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount):
+        """Seconds until `amount` fits. Anything over a minute's worth waits for a full bucket."""
+        needed = min(amount, self.capacity) - self.level
+        return max(0.0, needed / self.rate)
+
+
+def estimate_tokens(kwargs):
+    """(input, output) token estimate for a messages.create call."""
+    text = json.dumps(kwargs.get("messages", ""), default=str)
+    text += json.dumps(kwargs.get("system", ""), default=str)
+    return len(text) // 4 + 1, kwargs.get("max_tokens", 1024)
+
+
+def _status_of(error):
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def _retry_after(error):
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class ClaudeScheduler:
+    """
+    Admits calls in priority order (FIFO within a priority) once every
+    budget has room, then runs them on the caller's thread.
+    """
+
+    def __init__(self, rpm=50, itpm=30000, otpm=8000, max_retries=5,
+                 base_delay=1.0, max_delay=60.0, priorities=PRIORITIES):
+        self.budgets = {"requests": _Budget(rpm), "input": _Budget(itpm),
+                        "output": _Budget(otpm)}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.priorities = priorities
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+
+    def priority(self):
+        return self.priorities.get(current_stage(), DEFAULT_PRIORITY)
+
+    def _admit(self, entry, cost):
+        """Block until this call is first in line and fits every budget."""
+        priority = entry[0]
+        start = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._paused_until - now
+                    if self._queue[0] == entry and wait <= 0:
+                        for name, budget in self.budgets.items():
+                            budget.refill(now)
+                            wait = max(wait, budget.wait_for(cost[name]))
+                        if wait <= 0:
+                            for name, budget in self.budgets.items():
+                                budget.level -= cost[name]
+                            return
+                    timed_wait(self._cond, wait if wait > 0 else None)
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._cond.notify_all()
+                TRACER.observe("claude_queue_seconds", time.monotonic() - start,
+                               priority=str(priority))
+
+    def _settle(self, cost, usage):
+        """Correct the estimate with the tokens the call really used."""
+        if usage is None:
+            return
+        actual = {
+            "input": (getattr(usage, "input_tokens", 0) or 0)
+                     + (getattr(usage, "cache_creation_input_tokens", 0) or 0),
+            "output": getattr(usage, "output_tokens", 0) or 0,
+        }
+        with self._cond:
+            for name, used in actual.items():
+                self.budgets[name].level += cost[name] - used
+            self._cond.notify_all()
+
+    def _pause(self, seconds):
+        """Hold every queued call (this one included) after a 429/529."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def call(self, create, kwargs):
+        """Run create(**kwargs) through the budgets, retrying 429/529."""
+        est_in, est_out = estimate_tokens(kwargs)
+        cost = {"requests": 1, "input": est_in, "output": est_out}
+        # Retries keep their original place in line
+        entry = (self.priority(), next(self._seq))
+        for attempt in range(self.max_retries + 1):
+            self._admit(entry, cost)
+            try:
+                response = create(**kwargs)
+            except Exception as e:
+                status = _status_of(e)
+                if status not in RETRY_STATUSES or attempt == self.max_retries:
+                    raise
+                delay = _retry_after(e) or min(
+                    self.max_delay, self.base_delay * 2 ** attempt)
+                delay *= random.uniform(1.0, 1.25)
+                TRACER.inc("claude_retries_total", status=str(status))
+                print(f"  Claude returned {status}; retrying in {delay:.1f}s "
+                      f"({attempt + 1}/{self.max_retries})")
+                self._pause(delay)
+                continue
+            self._settle(cost, getattr(response, "usage", None))
+            return response
+
+
+class ScheduledClaude:
+    """Wraps an anthropic client so every messages.create goes through a scheduler."""
+
+    def __init__(self, client, scheduler):
+        self._client = client
+        self.scheduler = scheduler
+        self.messages = Messages(self._create)
+
+    def _create(self, **kwargs):
+        return self.scheduler.call(self._client.messages.create, kwargs)
@@ -0,0 +1,181 @@
+"""
+Portrait Agent — Moltbook Edition
+Content-addressed artifact store — every generated portrait is kept as a
+hash-named blob, with a small index mapping subject/run/version to blob.
+
+Layout:
+    portraits/store/blobs/ab/cdef0123...   (sha256, sharded by first 2 hex chars)
+    portraits/store/index.json             (subjects → versions, hash → refs)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
+# Writers in the same process (e.g. daemon workers) re-read the index under this
+# lock; writers in other processes (run.py --worker) under a flock on index.lock
+_INDEX_LOCK = threading.Lock()
+
+
+class ArtifactStore:
+    """Hash-named blob store with a subject/run/version index."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.blobs_dir = self.root / "blobs"
+        self.index_file = self.root / "index.json"
+        self.lock_file = self.root / "index.lock"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self._index = self._load_index()
+
+    # ── Index ─────────────────────────────────────────────────────
+
+    def _load_index(self):
+        if self.index_file.exists():
+            with open(self.index_file) as f:
+                return json.load(f)
+        return {"subjects": {}, "blobs": {}}
+
+    @contextmanager
+    def _locked(self):
+        """Hold the index lock (threads and processes) with a freshly loaded index."""
+        with _INDEX_LOCK, open(self.lock_file, "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._index = self._load_index()
+                yield self._index
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _save_index(self):
+        tmp = self.index_file.with_name(f"index.json.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp, self.index_file)
+
+    # ── Blobs ─────────────────────────────────────────────────────
+
+    def blob_path(self, digest):
+        """Path of the blob for a sha256 hex digest."""
+        return self.blobs_dir / digest[:2] / digest[2:]
+
+    def put_blob(self, data):
+        """Write data as a blob (no-op if identical content exists). Returns the digest."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        return digest
+
+    def get_blob(self, digest):
+        """Read a blob's bytes by digest."""
+        with open(self.blob_path(digest), "rb") as f:
+            return f.read()
+
+    def has_blob(self, digest):
+        return digest in self._index["blobs"]
+
+    # ── Versions ──────────────────────────────────────────────────
+
+    def put(self, subject_name, artwork, ext, run_id=None, meta=None):
+        """
+        Store an artifact for a subject as its next version.
+        Identical content is stored once; only a new index entry is added.
+        Returns the version entry.
+        """
+        key = subject_name.lower()
+        with self._locked():
+            # Under the lock, so gc() can't sweep the blob before it is indexed
+            digest = self.put_blob(artwork)
+            versions = self._index["subjects"].setdefault(key, [])
+            entry = {
+                # Not len()+1: remove() leaves gaps, and that would duplicate a number
+                "version": max((v["version"] for v in versions), default=0) + 1,
+                "run": run_id or datetime.now().strftime("%Y%m%dT%H%M%S"),
+                "blob": digest,
+                "ext": ext,
+                "created": datetime.now().isoformat(),
+                "meta": meta or {},
+            }
+            versions.append(entry)
+            self._index["blobs"].setdefault(digest, []).append([key, entry["version"]])
+            self._save_index()
+        return entry
+
+    def versions(self, subject_name):
+        """All version entries for a subject, oldest first."""
+        return list(self._index["subjects"].get(subject_name.lower(), []))
+
+    def latest(self, subject_name):
+        """The newest version entry for a subject, or None."""
+        versions = self._index["subjects"].get(subject_name.lower())
+        return versions[-1] if versions else None
+
+    def get(self, subject_name, version=None):
+        """Return (entry, bytes) for a subject's version (latest by default)."""
+        versions = self._index["subjects"].get(subject_name.lower()) or []
+        if not versions:
+            return None, None
+        if version is None:
+            entry = versions[-1]
+        else:
+            entry = next((v for v in versions if v["version"] == version), None)
+            if entry is None:
+                return None, None
+        return entry, self.get_blob(entry["blob"])
+
+    def refs(self, digest):
+        """(subject, version) pairs referencing a blob."""
+        return [tuple(r) for r in self._index["blobs"].get(digest, [])]
+
+    def remove(self, subject_name, version=None):
+        """Drop one version (or all versions) of a subject from the index."""
+        key = subject_name.lower()
+        with self._locked():
+            versions = self._index["subjects"].get(key, [])
+            dropped = [v for v in versions if version is None or v["version"] == version]
+            for entry in dropped:
+                refs = self._index["blobs"].get(entry["blob"], [])
+                refs[:] = [r for r in refs if r != [key, entry["version"]]]
+                if not refs:
+                    self._index["blobs"].pop(entry["blob"], None)
+            self._index["subjects"][key] = [v for v in versions if v not in dropped]
+            if not self._index["subjects"][key]:
+                del self._index["subjects"][key]
+            self._save_index()
+        return len(dropped)
+
+    # ── Garbage collection ────────────────────────────────────────
+
+    def gc(self):
+        """Delete blobs on disk that no index entry references. Returns count removed."""
+        removed = 0
+        with self._locked():
+            referenced = set(self._index["blobs"])
+            for shard in self.blobs_dir.iterdir():
+                if not shard.is_dir():
+                    continue
+                for blob in shard.iterdir():
+                    if shard.name + blob.name not in referenced:
+                        blob.unlink()
+                        removed += 1
+                if not any(shard.iterdir()):
+                    shard.rmdir()
+        return removed
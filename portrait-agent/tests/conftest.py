@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine is a flat directory of modules, run from portrait-agent/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from editions import current, use  # noqa: E402
+
+
+@pytest.fixture
+def edition(tmp_path):
+    """Run the test as the current edition with its data under tmp_path."""
+    with use(current().moved(tmp_path)) as moved:
+        yield moved
+
+
+@pytest.fixture
+def fake():
+    """An in-process fake Moltbook server (fake_moltbook.py)."""
+    from fake_moltbook import FakeMoltbook
+
+    fake = FakeMoltbook().start()
+    yield fake
+    fake.stop()
@@ -0,0 +1,116 @@
+import threading
+import time
+
+from daemon import PortraitDaemon, ThreadBook
+from push import CommentIndex, PushReceiver
+
+
+class Board:
+    """Moltbook stand-in: every thread's comments come from one dict."""
+
+    def __init__(self, comment_index=None):
+        self.comment_index = comment_index
+        self.comments = {}
+
+    def get_comments(self, post_id, sort=None, limit=50):
+        return list(self.comments.get(post_id, []))
+
+
+def test_rescans_do_not_reschedule_a_running_thread(edition):
+    book = ThreadBook()
+    book.open("p1", "Prism")
+    book.update("p1", stage="followup")
+    calls = []
+
+    def on_complete(thread, comments):
+        calls.append(thread["post_id"])
+        time.sleep(0.3)
+
+    daemon = PortraitDaemon(Board(), book, on_followup=None, on_complete=on_complete,
+                            rescan_interval=0.05, exit_when_idle=True)
+    daemon.run()
+    assert calls == ["p1"]
+
+
+def start_backed_off(mb, book, followed):
+    """Run a daemon whose only thread has found nothing and backed off for an hour."""
+    book.open("p1", "Prism", poll_interval=3600)
+    daemon = PortraitDaemon(mb, book, min_comments=1, poll_interval=3600,
+                            rescan_interval=3600,
+                            on_followup=lambda t, c: followed.set(),
+                            on_complete=lambda t, c: None)
+    runner = threading.Thread(target=daemon.run, daemon=True)
+    runner.start()
+    deadline = time.time() + 5
+    while book.get("p1")["next_check"] - time.time() < 1000 and time.time() < deadline:
+        time.sleep(0.01)
+    return daemon, runner
+
+
+def test_push_wakes_a_waiting_thread(edition):
+    index = CommentIndex()
+    mb, book, followed = Board(comment_index=index), ThreadBook(), threading.Event()
+    daemon, runner = start_backed_off(mb, book, followed)
+
+    comment = {"id": "c1", "author": "Alpha", "content": "gold leaf"}
+    mb.comments["p1"] = [comment]
+    index.add("p1", [comment], pushed=True)
+    try:
+        assert followed.wait(2)
+    finally:
+        daemon.stop()
+        runner.join(2)
+
+
+def test_mention_wakes_a_waiting_thread(edition):
+    index = CommentIndex()
+    mb, book, followed = Board(comment_index=index), ThreadBook(), threading.Event()
+    daemon, runner = start_backed_off(mb, book, followed)
+
+    mb.comments["p1"] = [{"id": "c1", "author": "Alpha", "content": "@us gold leaf"}]
+    receiver = PushReceiver(index, port=0)
+    assert receiver.handle({"id": "e1", "type": "mention", "post_id": "p1"})
+    try:
+        assert followed.wait(2)
+    finally:
+        receiver.server.server_close()
+        daemon.stop()
+        runner.join(2)
+
+
+class SlowBook(ThreadBook):
+    """A ThreadBook whose first backoff blocks until the test lets it finish."""
+
+    def __init__(self):
+        super().__init__()
+        self.ticking = threading.Event()
+        self.proceed = threading.Event()
+
+    def update(self, post_id, **fields):
+        if "interval" in fields and not self.ticking.is_set():
+            self.ticking.set()
+            self.proceed.wait(2)
+        super().update(post_id, **fields)
+
+
+def test_push_during_a_tick_gets_the_thread_ticked_again(edition):
+    index = CommentIndex()
+    mb, book, followed = Board(comment_index=index), SlowBook(), threading.Event()
+    book.open("p1", "Prism", poll_interval=3600)
+    daemon = PortraitDaemon(mb, book, min_comments=1, poll_interval=3600,
+                            rescan_interval=3600,
+                            on_followup=lambda t, c: followed.set(),
+                            on_complete=lambda t, c: None)
+    runner = threading.Thread(target=daemon.run, daemon=True)
+    runner.start()
+    try:
+        assert book.ticking.wait(2)  # the first tick found nothing and is backing off
+        comment = {"id": "c1", "author": "Alpha", "content": "gold leaf"}
+        mb.comments["p1"] = [comment]
+        index.add("p1", [comment], pushed=True)
+        time.sleep(0.1)
+        book.proceed.set()
+        assert followed.wait(2)
+    finally:
+        daemon.stop()
+        runner.join(2)
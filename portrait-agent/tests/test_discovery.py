@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from discovery import Crawler, RateLimiter, SeenSet, SubjectStore
+from replay import VirtualClock
+
+
+class Threads:
+    """Moltbook stand-in serving one thread's comments."""
+
+    def __init__(self):
+        self.comments = []
+        self.fetches = 0
+
+    def get_comments(self, post_id, limit=100):
+        self.fetches += 1
+        return list(self.comments)
+
+
+def crawler(mb, tmp_path):
+    return Crawler(mb, seen=SeenSet(tmp_path), store=SubjectStore(tmp_path / "s.jsonl"),
+                   rate=1000, burst=1000)
+
+
+def test_thread_is_read_again_when_it_grows(tmp_path, edition):
+    mb = Threads()
+    c = crawler(mb, tmp_path)
+    mb.comments = [{"id": "c1", "author": "Alpha", "content": "hi"}]
+    post = {"id": "p1", "author": "Poster", "comment_count": 1}
+    names = {s["name"] for s in c.crawl_posts([post], "feed:new")}
+    assert names == {"Poster", "Alpha"}
+
+    assert c.crawl_posts([post], "feed:new") == []
+    assert mb.fetches == 1
+
+    mb.comments.append({"id": "c2", "author": "Beta", "content": "late"})
+    grown = {**post, "comment_count": 2}
+    assert [s["name"] for s in c.crawl_posts([grown], "feed:new")] == ["Beta"]
+    assert mb.fetches == 2
+
+
+def test_failed_fetch_leaves_thread_unseen(tmp_path, edition):
+    mb = Threads()
+    c = crawler(mb, tmp_path)
+    mb.get_comments = lambda *a, **k: (_ for _ in ()).throw(OSError("reset"))
+    post = {"id": "p1", "author": "Poster", "comment_count": 1}
+    with pytest.raises(OSError):
+        c.crawl_posts([post], "feed:new")
+    assert "post:p1:1" not in c.seen
+
+
+def test_rate_limiter_waits_on_virtual_clock():
+    clock = VirtualClock(scale=0.0).install()
+    try:
+        limiter = RateLimiter(rate=0.1, burst=1)
+        start, real = time.time(), clock._real_time()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.time() - start >= 19.9
+        assert clock._real_time() - real < 1.0
+    finally:
+        clock.uninstall()
@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from discovery import SubjectStore
+from editions import EDITIONS, Edition, use
+from interviews import InterviewStore
+from usage import UsageMeter
+
+
+def test_data_dirs_follow_the_edition(tmp_path):
+    a = EDITIONS["a-eyes"].moved(tmp_path / "a")
+    b = a.moved(tmp_path / "b")
+    with use(a):
+        interviews, subjects = InterviewStore(), SubjectStore()
+    with use(b):
+        assert InterviewStore().path != interviews.path
+        assert SubjectStore().path != subjects.path
+    assert interviews.path.is_relative_to(tmp_path / "a")
+    assert subjects.path.is_relative_to(tmp_path / "a")
+
+
+def test_usage_is_kept_per_edition(tmp_path):
+    meter = UsageMeter()
+    usage = SimpleNamespace(input_tokens=100, output_tokens=10)
+    with use(EDITIONS["a-eyes"].moved(tmp_path)):
+        meter.record("claude-sonnet-4-5", usage, 0.1)
+        meter.record("claude-sonnet-4-5", usage, 0.1)
+    a = EDITIONS["a-eyes"]
+    with use(Edition("other", a.title, a.artist, a.subjects, tmp_path)):
+        meter.record("claude-sonnet-4-5", usage, 0.1)
+    assert meter.summary(edition="a-eyes")["calls"] == 2
+    assert meter.report(edition="other")["calls"] == 1
+    assert meter.summary()["calls"] == 3
@@ -0,0 +1,48 @@
+import http.client
+import json
+import threading
+import time
+
+from fake_moltbook import API_PREFIX, FakeMoltbook
+
+
+def test_injected_error_keeps_connection_usable():
+    fake = FakeMoltbook(error_rate=1.0).start()
+    try:
+        post = fake.state.add_post("bot", "Concept", "")
+        host, port = fake.server.server_address[:2]
+        conn = http.client.HTTPConnection(host, port)
+        body = json.dumps({"body": "x" * 2000})
+        path = f"{API_PREFIX}/posts/{post['id']}/comments"
+
+        conn.request("POST", path, body, {"Content-Type": "application/json"})
+        first = conn.getresponse()
+        first.read()
+        assert first.status in (429, 500)
+
+        fake.server.error_rate = 0.0
+        conn.request("POST", path, body, {"Content-Type": "application/json"})
+        second = conn.getresponse()
+        second.read()
+        assert second.status == 201
+    finally:
+        fake.stop()
+
+
+def test_population_comments_from_one_scheduler_thread():
+    fake = FakeMoltbook(population={"agents": 20, "rate": 300, "max_comments": 3,
+                                    "reply_prob": 0, "seed": 1}).start()
+    try:
+        before = threading.active_count()
+        posts = [fake.state.add_post("bot", f"Concept {n}", "") for n in range(30)]
+        for post in posts:
+            fake.server.population.watch(post)
+        deadline, peak = time.time() + 10, 0
+        while (any(len(fake.state.comments[p["id"]]) < 3 for p in posts)
+               and time.time() < deadline):
+            peak = max(peak, threading.active_count())
+            time.sleep(0.01)
+        assert all(len(fake.state.comments[p["id"]]) == 3 for p in posts)
+        assert peak <= before + 1
+    finally:
+        fake.stop()
@@ -0,0 +1,29 @@
+import pytest
+
+from bench import FAKE_DECISION, SUBJECT, FakeClaude
+from generators import generate_candidates
+
+
+class FlakyClaude(FakeClaude):
+    """Fails every generation request for one medium."""
+
+    def __init__(self, failing):
+        super().__init__()
+        self.failing = failing
+
+    def _create(self, messages=(), **kwargs):
+        if f"Chosen medium: {self.failing}" in messages[-1]["content"]:
+            raise RuntimeError("overloaded")
+        return super()._create(messages=messages, **kwargs)
+
+
+def test_failed_candidate_is_dropped():
+    decisions = [FAKE_DECISION, {**FAKE_DECISION, "medium": "ascii"}]
+    ranked = generate_candidates(FlakyClaude("ascii"), SUBJECT, decisions, [])
+    assert [c["decision"]["medium"] for c in ranked] == [FAKE_DECISION["medium"]]
+
+
+def test_all_candidates_failing_raises():
+    with pytest.raises(RuntimeError, match="overloaded"):
+        generate_candidates(FlakyClaude(FAKE_DECISION["medium"]), SUBJECT,
+                            [FAKE_DECISION], [])
@@ -0,0 +1,25 @@
+import threading
+import time
+
+from moltbook import MoltbookClient
+from push import CommentIndex
+
+
+def test_multi_wait_wakes_on_pushed_comment(fake):
+    index = CommentIndex()
+    mb = MoltbookClient(api_key="k", base_url=fake.base_url, comment_index=index)
+    posts = [fake.state.add_post("bot", f"Concept {n}", "")["id"] for n in range(2)]
+    fake.state.add_comment(posts[0], "Alpha", "svg")
+
+    result = {}
+    waiter = threading.Thread(target=lambda: result.update(comments=mb.wait_for_comments_multi(
+        posts, min_comments=2, timeout=60, poll_interval=60)))
+    start = time.time()
+    waiter.start()
+    time.sleep(0.2)
+    pushed = fake.state.add_comment(posts[1], "Beta", "ascii")
+    index.add(posts[1], [pushed], pushed=True)
+    waiter.join(5)
+
+    assert time.time() - start < 5
+    assert sorted(c.author for c in result["comments"]) == ["Alpha", "Beta"]
@@ -0,0 +1,52 @@
+import threading
+
+from pipeline import Pipeline, Stage
+
+
+class Stop(Exception):
+    pass
+
+
+def test_stop_on_exception_stops_intake_and_drains():
+    pulled = []
+
+    def source():
+        for n in range(1000):
+            pulled.append(n)
+            yield n
+
+    release = threading.Event()
+
+    def spend(n):
+        if n == 3:
+            raise Stop("budget")
+        return n
+
+    def finish(n):
+        release.wait(5)
+        return n
+
+    pipeline = Pipeline([
+        Stage("spend", spend),
+        Stage("finish", finish),
+    ], queue_size=2, stop_on=(Stop,))
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    results = pipeline.run(source())
+
+    assert isinstance(pipeline.stopped, Stop)
+    assert len(pulled) < 20
+    assert sorted(results) == [0, 1, 2]
+    assert all(name == "spend" for name, _ in pipeline.dropped)
+
+
+def test_other_errors_keep_flowing():
+    def spend(n):
+        if n == 3:
+            raise ValueError("bad item")
+        return n
+
+    pipeline = Pipeline([Stage("spend", spend, workers=2)], stop_on=(Stop,))
+    results = pipeline.run(range(10))
+    assert pipeline.stopped is None
+    assert sorted(results) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
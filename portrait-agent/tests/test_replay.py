@@ -0,0 +1,24 @@
+import threading
+import time
+
+from push import CommentIndex
+from replay import VirtualClock
+
+
+def test_virtual_time_moves_only_when_waiting():
+    with VirtualClock(0.0) as clock:
+        start, mono = time.time(), time.monotonic()
+        sum(range(200_000))  # work takes no virtual time
+        assert time.time() == start and time.monotonic() == mono
+        time.sleep(30)
+        assert time.time() == start + 30
+        assert clock.wait(threading.Event(), 15) is False
+        assert time.monotonic() == mono + 45
+
+
+def test_comment_index_wait_times_out_on_the_virtual_clock():
+    index = CommentIndex()
+    with VirtualClock(0.0):
+        start = time.time()
+        assert index.wait_for("1", 1, 600) == 0
+        assert time.time() == start + 600
@@ -0,0 +1,28 @@
+import time
+
+from bench import FakeClaude
+from clientwrap import Messages
+from routing import Router, create
+from tracing import TracingClaude
+
+
+class Queued:
+    """Stands in for ScheduledClaude: holds every call in line first."""
+
+    def __init__(self, client, delay):
+        self._client = client
+        self.delay = delay
+        self.messages = Messages(self._create)
+
+    def _create(self, **kwargs):
+        time.sleep(self.delay)
+        return self._client.messages.create(**kwargs)
+
+
+def test_route_latency_excludes_queueing():
+    router = Router({"followup": {"model": "m"}})
+    client = Queued(TracingClaude(FakeClaude(latency=0.01)), delay=0.3)
+    create(client, "followup", 100, router=router,
+           messages=[{"role": "user", "content": "hi"}])
+    latency = router.report()["followup"]["m"]["latency_s"]
+    assert 0.005 < latency < 0.2
@@ -0,0 +1,229 @@
+import json
+import sys
+import time
+from argparse import Namespace
+
+import pytest
+
+import run
+from bench import SUBJECT, FakeClaude
+from editions import EDITIONS, Edition, use
+from ledger import Ledger
+from moltbook import MoltbookClient
+from registry import SubjectRegistry
+from replay import Cassette, RecordingClaude, RecordingSession, VirtualClock
+from store import ArtifactStore
+
+BOT = "TestPortraitBot"
+
+
+@pytest.fixture
+def edition(tmp_path, fake, monkeypatch):
+    """An edition posting as BOT on the fake server, with SUBJECT to portray."""
+    edition = Edition("a-eyes", "TEST EDITION", {"name": BOT}, [dict(SUBJECT)], tmp_path)
+    monkeypatch.setitem(EDITIONS, "a-eyes", edition)
+    monkeypatch.setenv("MOLTBOOK_BASE_URL", fake.base_url)
+    fake.state.agents["key"] = {"id": "key", "name": BOT}
+    with use(edition):
+        run.ensure_dirs()
+        yield edition
+
+
+@pytest.fixture
+def thread(fake):
+    """A concept post that already has enough feedback."""
+    post_id = fake.state.add_post(BOT, "Concept", "")["id"]
+    for n in range(3):
+        fake.state.add_comment(post_id, f"agent_{n}", f"make it svg, take {n}")
+    return post_id
+
+
+def make_args(post_id, **kw):
+    return Namespace(from_post=post_id, fan_out=None, submolt=None, no_generate=False,
+                     min_comments=3, wait=60, poll=1, candidates=1, concurrency=1,
+                     wait_workers=2, queue_size=4, **kw)
+
+
+def client(fake):
+    mb = MoltbookClient(api_key="key", base_url=fake.base_url)
+    mb.wait_for_replies = lambda *a, **k: []
+    return mb
+
+
+def test_rerun_regenerates_a_rejected_portrait(edition, fake, thread):
+    mb, claude, args = client(fake), FakeClaude(), make_args(thread)
+    ledger = Ledger()
+    run.run_portrait(mb, claude, dict(SUBJECT), args, ledger=ledger)
+    run.run_portrait(mb, claude, dict(SUBJECT), args, ledger=ledger)
+    calls = claude.calls  # the unchanged re-run made no model calls
+    tx = ledger.current(SUBJECT["name"])
+    assert tx["status"] == "pending_approval"
+    ledger.reject(tx["id"])
+
+    run.run_portrait(mb, claude, dict(SUBJECT), args, ledger=ledger)
+    assert claude.calls == calls + 1  # a new portrait, from the stored decision
+    assert len(ArtifactStore(edition.store_dir).versions(SUBJECT["name"])) == 2
+    assert ledger.current(SUBJECT["name"])["status"] == "pending_approval"
+
+
+def test_pipeline_rerun_skips_unchanged_work(edition, fake, thread):
+    mb, claude, args = client(fake), FakeClaude(), make_args(thread)
+    assert len(run.run_series_pipeline(mb, claude, [dict(SUBJECT)], args)) == 1
+    calls, comments = claude.calls, len(fake.state.comments[thread])
+
+    assert len(run.run_series_pipeline(mb, claude, [dict(SUBJECT)], args)) == 1
+    assert claude.calls == calls
+    assert len(fake.state.comments[thread]) == comments  # no second follow-up or result
+
+    fake.state.add_comment(thread, "agent_9", "prose, actually")
+    run.run_series_pipeline(mb, claude, [dict(SUBJECT)], args)
+    assert claude.calls > calls
+
+
+def record(fake, thread, path):
+    """Record a run_portrait against the fake server into a cassette."""
+    cassette = Cassette(path)
+    mb = MoltbookClient(api_key="key", base_url=fake.base_url)
+    mb.session = RecordingSession(mb.session, cassette)
+    claude = RecordingClaude(FakeClaude(), cassette)
+    with VirtualClock(0.0):
+        run.run_portrait(mb, claude, dict(SUBJECT), make_args(thread))
+    cassette.save()
+    return cassette
+
+
+def replay(monkeypatch, thread, path):
+    monkeypatch.setattr(sys, "argv", [
+        "run.py", "--subject", SUBJECT["name"], "--from-post", thread,
+        "--min-comments", "3", "--wait", "60", "--poll", "1", "--replay", str(path),
+    ])
+    run.main()
+
+
+def test_replay_runs_every_step_despite_earlier_results(edition, fake, thread,
+                                                        monkeypatch, tmp_path):
+    path = tmp_path / "cassette.json"
+    cassette = record(fake, thread, path)
+    claude_calls = sum(i["kind"] == "claude" for i in cassette.interactions)
+    assert claude_calls >= 3  # follow-up, synthesis, generation
+
+    # The recorded run left fingerprinted results in the edition's data dir;
+    # the replay must still play back every exchange
+    replay(monkeypatch, thread, path)
+    assert run.CASSETTE.unused() == []
+
+
+def test_replay_finds_subjects_outside_the_seed_list(edition, fake, thread,
+                                                     monkeypatch, tmp_path):
+    edition.subjects = []
+    registry = SubjectRegistry()
+    registry.add(dict(SUBJECT), source="discovery")
+    registry.close()
+    path = tmp_path / "cassette.json"
+    record(fake, thread, path)
+
+    replay(monkeypatch, thread, path)
+    assert run.CASSETTE.unused() == []
+
+
+def test_replay_fails_on_unplayed_exchanges(edition, fake, thread, monkeypatch, tmp_path):
+    path = tmp_path / "cassette.json"
+    record(fake, thread, path)
+    data = json.loads(path.read_text())
+    data["interactions"].append({"key": "never", "kind": "http", "method": "GET",
+                                 "url": "https://example.invalid/extra"})
+    path.write_text(json.dumps(data))
+
+    with pytest.raises(SystemExit) as exit:
+        replay(monkeypatch, thread, path)
+    assert exit.value.code == 1
+
+
+def test_worker_posts_the_followup_once_across_a_crash(edition, fake, thread):
+    from jobs import JobQueue
+
+    mb, claude, args = client(fake), FakeClaude(), make_args(thread)
+    jobs = JobQueue(worker="w1")
+    jobs.enqueue([dict(SUBJECT)])
+
+    def crash(*a, **k):
+        raise RuntimeError("worker died")
+    mb.wait_for_replies = crash  # after the follow-up, before its stage is saved
+    lease = jobs.claim()
+    with lease, pytest.raises(RuntimeError):
+        run.run_job(mb, claude, lease, args, None, jobs)
+    assert jobs.fail(lease, "worker died") == "queued"
+
+    mb.wait_for_replies = lambda *a, **k: []
+    lease = jobs.claim()
+    with lease:
+        run.run_job(mb, claude, lease, args, None, jobs)
+
+    ours = [c for c in fake.state.comments[thread] if c["agent_name"] == BOT]
+    assert len(ours) == 2  # one follow-up, one result
+    assert jobs.summary() == {"done": 1}
+
+
+def test_worker_survives_losing_the_lease_before_fail(edition, fake, thread, monkeypatch):
+    from jobs import JobQueue
+
+    args = make_args(thread, jobs_db=None, lease=1.0)
+    args.concurrency = 1
+    attempts = []
+
+    def run_job(mb, claude, lease, args, ledger, jobs):
+        attempts.append(lease.attempts)
+        if len(attempts) == 1:
+            # Another worker takes the job over while this one is failing
+            jobs.db.execute("UPDATE jobs SET token = token + 1, lease_until = ?",
+                            (time.time() + 0.2,))
+            raise RuntimeError("overloaded")
+        jobs.complete(lease)
+
+    monkeypatch.setattr(run, "run_job", run_job)
+    JobQueue().enqueue([dict(SUBJECT)])
+    sleep = time.sleep
+    monkeypatch.setattr(time, "sleep", lambda s: sleep(min(s, 0.05)))
+    run.run_worker(client(fake), FakeClaude(), args)
+    assert attempts == [1, 2]
+    assert JobQueue().summary() == {"done": 1}
+
+
+
+def test_worker_stops_before_claude_once_the_lease_is_lost(edition, fake, thread,
+                                                            monkeypatch):
+    from jobs import JobQueue, LeaseLost
+
+    mb, claude, args = client(fake), FakeClaude(), make_args(thread)
+    jobs = JobQueue(worker="w1")
+    jobs.enqueue([dict(SUBJECT)])
+    lease = jobs.claim()
+    collect = run.collect_feedback
+
+    def collect_and_lose(*a, **k):
+        lease.lost.set()  # the heartbeat found another worker owns the job
+        return collect(*a, **k)
+    monkeypatch.setattr(run, "collect_feedback", collect_and_lose)
+
+    with pytest.raises(LeaseLost):
+        run.run_job(mb, claude, lease, args, None, jobs)
+    assert claude.calls == 0
+    assert all(c["agent_name"] != BOT for c in fake.state.comments[thread])
+
+
+def test_budget_stop_gives_the_job_back_without_an_attempt(edition, fake, thread,
+                                                           monkeypatch):
+    from jobs import JobQueue
+    from usage import BudgetExceeded
+
+    def run_job(*a):
+        raise BudgetExceeded("cap reached")
+
+    monkeypatch.setattr(run, "run_job", run_job)
+    args = make_args(thread, jobs_db=None, lease=60.0)
+    JobQueue(max_attempts=1).enqueue([dict(SUBJECT)])
+    for _ in range(3):
+        with pytest.raises(BudgetExceeded):
+            run.run_worker(client(fake), FakeClaude(), args)
+    lease = JobQueue(max_attempts=1).claim()
+    assert lease is not None and lease.attempts == 1
@@ -0,0 +1,47 @@
+import multiprocessing
+
+from store import ArtifactStore
+
+
+def test_versions_stay_unique_after_remove(tmp_path):
+    store = ArtifactStore(tmp_path)
+    for n in range(3):
+        store.put("Prism", f"<svg>{n}</svg>", "svg")
+    assert store.remove("Prism", version=2) == 1
+    entry = store.put("Prism", "<svg>new</svg>", "svg")
+    assert entry["version"] == 4
+    assert [v["version"] for v in store.versions("Prism")] == [1, 3, 4]
+
+
+def test_get_looks_up_by_version_number(tmp_path):
+    store = ArtifactStore(tmp_path)
+    for n in range(3):
+        store.put("Prism", f"<svg>{n}</svg>", "svg")
+    store.remove("Prism", version=1)
+    entry, data = store.get("Prism", version=3)
+    assert entry["version"] == 3 and data == b"<svg>2</svg>"
+    assert store.get("Prism", version=1) == (None, None)
+
+
+def test_gc_keeps_blobs_indexed_by_another_store(tmp_path):
+    stale = ArtifactStore(tmp_path)
+    ArtifactStore(tmp_path).put("Prism", "<svg/>", "svg")
+    assert stale.gc() == 0
+    assert stale.get("Prism")[1] == b"<svg/>"
+
+
+def _put_many(root, worker):
+    store = ArtifactStore(root)
+    for n in range(20):
+        store.put("Prism", f"<svg>{worker}-{n}</svg>", "svg")
+
+
+def test_concurrent_processes_get_distinct_versions(tmp_path):
+    procs = [multiprocessing.Process(target=_put_many, args=(tmp_path, w))
+             for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    versions = [v["version"] for v in ArtifactStore(tmp_path).versions("Prism")]
+    assert sorted(versions) == list(range(1, 81))
@@ -0,0 +1,304 @@
+"""
+Portrait Agent — Moltbook Edition
+Tracing — lightweight timing spans around pipeline stages, Moltbook requests
+and Claude calls, aggregated in-process into latency histograms and counters.
+
+    with span("portrait_stage_seconds", stage="generate"):
+        ...
+
+Metrics are served in Prometheus text format by MetricsServer (GET /metrics)
+and can be written to JSON with TRACER.dump(path). Nothing is sent anywhere.
+
+Metrics:
+    portrait_stage_seconds{stage}                 one run_portrait step
+    moltbook_request_seconds{method,route,status} one Moltbook HTTP request
+    claude_request_seconds{model,status}          one messages.create call
+    <metric>_errors_total{...}                    spans that raised
+"""
+
+import bisect
+import contextvars
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from clientwrap import Messages
+
+# Seconds. Covers a fast cached request up to a two-hour comment wait.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30,
+           60, 300, 900, 3600, 7200)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram, Prometheus style."""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        """Upper bucket bound holding the q-th observation (bucket resolution)."""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, n in zip(BUCKETS, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count, "sum": self.sum, "max": self.max,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5), "p95": self.quantile(0.95),
+            "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], self.counts)),
+        }
+
+
+class Tracer:
+    """Thread-safe store of histograms and counters keyed by (name, labels)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+        self.started = time.time()
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = Histogram()
+            hist.observe(seconds)
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    @contextmanager
+    def span(self, name, **labels):
+        """Time the block into histogram `name`; count it as an error if it raises."""
+        start = time.perf_counter()
+        try:
+            yield labels
+        except BaseException:
+            self.inc(name.removesuffix("_seconds") + "_errors_total", **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.started = time.time()
+
+    # ── Export ────────────────────────────────────────────────────
+
+    def prometheus(self):
+        """All metrics in the Prometheus text exposition format."""
+        def fmt(labels, extra=()):
+            pairs = [*labels, *extra]
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            counters = sorted(self.counters.items())
+            hist_data = [(k, list(h.counts), h.count, h.sum) for k, h in histograms]
+
+        lines, typed = [], set()
+        for (name, labels), counts, count, total in hist_data:
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            running = 0
+            for bound, n in zip(BUCKETS, counts):
+                running += n
+                lines.append(f"{name}_bucket{fmt(labels, [('le', bound)])} {running}")
+            lines.append(f'{name}_bucket{fmt(labels, [("le", "+Inf")])} {count}')
+            lines.append(f"{name}_sum{fmt(labels)} {total}")
+            lines.append(f"{name}_count{fmt(labels)} {count}")
+        for (name, labels), value in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{fmt(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """All metrics as a JSON-ready dict."""
+        with self._lock:
+            return {
+                "started": datetime.fromtimestamp(self.started).isoformat(),
+                "dumped": datetime.now().isoformat(),
+                "histograms": [{"name": n, "labels": dict(l), **h.to_dict()}
+                               for (n, l), h in sorted(self.histograms.items())],
+                "counters": [{"name": n, "labels": dict(l), "value": v}
+                             for (n, l), v in sorted(self.counters.items())],
+            }
+
+    def dump(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        return path
+
+
+TRACER = Tracer()
+span = TRACER.span
+
+
+# ── Client wrappers ───────────────────────────────────────────────
+
+_ID_SEGMENT = re.compile(r"/(posts|comments|submolts)/[^/?]+")
+
+
+def route_of(url):
+    """/api/v1/posts/123/comments → /posts/{id}/comments, for low-cardinality labels."""
+    path = url.split("://", 1)[-1].split("/", 1)[-1].split("?", 1)[0]
+    path = "/" + path.split("/", 2)[-1] if path.startswith("api/") else "/" + path
+    return _ID_SEGMENT.sub(r"/\1/{id}", path)
+
+
+class TracingSession:
+    """Wraps a requests.Session (or a replay/recording one) and times every request."""
+
+    def __init__(self, session, tracer=TRACER):
+        self._session = session
+        self.tracer = tracer
+        self.headers = session.headers
+
+    def _do(self, method, url, call):
+        start = time.perf_counter()
+        status = "error"
+        try:
+            resp = call()
+            status = str(resp.status_code)
+            return resp
+        finally:
+            self.tracer.observe("moltbook_request_seconds",
+                                time.perf_counter() - start,
+                                method=method, route=route_of(url), status=status)
+
+    def get(self, url, params=None, headers=None):
+        return self._do("GET", url, lambda: self._session.get(
+            url, params=params, headers=headers))
+
+    def post(self, url, json=None):
+        return self._do("POST", url, lambda: self._session.post(url, json=json))
+
+
+# Durations of the TracingClaude calls made inside a timed_calls() block
+_call_durations = contextvars.ContextVar("call_durations", default=None)
+
+
+@contextmanager
+def timed_calls():
+    """
+    Collect, in the yielded list, how long each underlying messages.create in
+    the block took. Wrappers outside TracingClaude (scheduler queueing and
+    retry backoff) are not included.
+    """
+    durations = []
+    token = _call_durations.set(durations)
+    try:
+        yield durations
+    finally:
+        _call_durations.reset(token)
+
+
+class TracingClaude:
+    """Wraps an anthropic client (or a replay/recording one) and times messages.create."""
+
+    def __init__(self, client, tracer=TRACER):
+        self._client = client
+        self.tracer = tracer
+        self.messages = Messages(self._create)
+
+    def _create(self, **kwargs):
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = self._client.messages.create(**kwargs)
+            status = "ok"
+            return response
+        except Exception as e:
+            status = str(getattr(e, "status_code", None) or type(e).__name__)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.tracer.observe("claude_request_seconds", elapsed,
+                                model=kwargs.get("model", "?"), status=status)
+            durations = _call_durations.get()
+            if durations is not None:
+                durations.append(elapsed)
+
+
+# ── Endpoint ──────────────────────────────────────────────────────
+
+def _serve_metrics(handler):
+    tracer = handler.server.tracer
+    path = handler.path.split("?", 1)[0].rstrip("/")
+    if path == "/metrics":
+        body, ctype = tracer.prometheus().encode(), "text/plain; version=0.0.4"
+    elif path == "/metrics.json":
+        body, ctype = json.dumps(tracer.snapshot()).encode(), "application/json"
+    else:
+        handler.send_error(404)
+        return
+    handler.send_response(200)
+    handler.send_header("Content-Type", ctype)
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+class MetricsServer:
+    """Background HTTP server exposing a Tracer on /metrics and /metrics.json."""
+
+    def __init__(self, tracer=TRACER, host="127.0.0.1", port=9464):
+        # Deferred: every run imports tracing, only --metrics serves it
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class _Handler(BaseHTTPRequestHandler):
+            do_GET = _serve_metrics
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.tracer = tracer
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
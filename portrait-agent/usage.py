@@ -0,0 +1,174 @@
+"""
+Portrait Agent — Moltbook Edition
+Usage accounting — tokens, latency and cost of every Claude call, attributed
+to the edition, subject and pipeline stage that made it.
+
+MeteredClaude wraps the Claude client and records each response's usage in
+a UsageMeter. Attribution comes from context variables set by run.py
+(`attribute(subject=..., stage=...)`), so calls made deep inside discussion.py
+and generators.py are tagged without threading arguments through them; the
+edition is the one current() (editions.py) names.
+
+A meter with a `cap` refuses new calls once the recorded spend reaches it,
+by raising BudgetExceeded (a call in flight may overshoot by its own cost).
+"""
+
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from clientwrap import Messages
+from editions import current
+
+# USD per million tokens: (input, output, cache write, cache read)
+PRICES = {
+    "claude-opus-4-1": (15.00, 75.00, 18.75, 1.50),
+    "claude-opus-4": (15.00, 75.00, 18.75, 1.50),
+    "claude-sonnet-4-5": (3.00, 15.00, 3.75, 0.30),
+    "claude-sonnet-4": (3.00, 15.00, 3.75, 0.30),
+    "claude-haiku-4-5": (1.00, 5.00, 1.25, 0.10),
+    "claude-3-5-haiku": (0.80, 4.00, 1.00, 0.08),
+}
+DEFAULT_PRICE = PRICES["claude-sonnet-4-5"]
+
+TOKEN_FIELDS = ("input_tokens", "output_tokens",
+                "cache_creation_input_tokens", "cache_read_input_tokens")
+
+_subject = contextvars.ContextVar("usage_subject", default=None)
+_stage = contextvars.ContextVar("usage_stage", default=None)
+
+
+class BudgetExceeded(RuntimeError):
+    """The series spend cap has been reached."""
+
+
+@contextmanager
+def attribute(subject=None, stage=None):
+    """Tag Claude calls made inside the block with a subject and/or stage."""
+    tokens = []
+    if subject is not None:
+        tokens.append((_subject, _subject.set(subject)))
+    if stage is not None:
+        tokens.append((_stage, _stage.set(stage)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def current_stage():
+    """The pipeline stage the calling code is running in, if any."""
+    return _stage.get()
+
+
+def price_for(model):
+    """Per-MTok prices for a model ID, matched by its dated or undated prefix."""
+    model = model or ""
+    for prefix in sorted(PRICES, key=len, reverse=True):
+        if model.startswith(prefix):
+            return PRICES[prefix]
+    return DEFAULT_PRICE
+
+
+def cost_of(model, tokens):
+    prices = price_for(model)
+    return sum(tokens.get(f, 0) * p for f, p in zip(TOKEN_FIELDS, prices)) / 1e6
+
+
+def _rollup(records):
+    out = {"calls": len(records), **{f: 0 for f in TOKEN_FIELDS},
+           "cost_usd": 0.0, "latency_s": 0.0}
+    for r in records:
+        for f in TOKEN_FIELDS:
+            out[f] += r[f]
+        out["cost_usd"] += r["cost_usd"]
+        out["latency_s"] += r["latency_s"]
+    out["cost_usd"] = round(out["cost_usd"], 6)
+    out["latency_s"] = round(out["latency_s"], 3)
+    return out
+
+
+class UsageMeter:
+    """Thread-safe record of every metered call."""
+
+    def __init__(self, cap=None):
+        self.cap = cap
+        self.records = []
+        self._lock = threading.Lock()
+        self._spent = 0.0
+
+    @property
+    def spent(self):
+        with self._lock:
+            return self._spent
+
+    def check(self):
+        """Raise BudgetExceeded if the cap has been reached."""
+        if self.cap is not None and self.spent >= self.cap:
+            raise BudgetExceeded(
+                f"Spend cap of ${self.cap:g} reached (${self.spent:.4f} spent)")
+
+    def record(self, model, usage, latency):
+        tokens = {f: getattr(usage, f, None) or 0 for f in TOKEN_FIELDS}
+        record = {
+            "edition": current().key, "subject": _subject.get(),
+            "stage": _stage.get(), "model": model,
+            **tokens, "latency_s": latency, "cost_usd": cost_of(model, tokens),
+            "at": time.time(),
+        }
+        with self._lock:
+            self.records.append(record)
+            self._spent += record["cost_usd"]
+        return record
+
+    def _select(self, subject=None, edition=None):
+        with self._lock:
+            records = list(self.records)
+        if edition is not None:
+            records = [r for r in records if r["edition"] == edition]
+        if subject is not None:
+            records = [r for r in records if r["subject"] == subject]
+        return records
+
+    def summary(self, subject=None, edition=None):
+        """Totals plus per-stage and per-model breakdowns (optionally one subject/edition)."""
+        records = self._select(subject, edition)
+        out = _rollup(records)
+        for key in ("stage", "model"):
+            groups = defaultdict(list)
+            for r in records:
+                groups[r[key] or "other"].append(r)
+            out[f"by_{key}"] = {k: _rollup(v) for k, v in sorted(groups.items())}
+        return out
+
+    def report(self, edition=None):
+        """Series-level report: overall summary plus one summary per subject."""
+        records = self._select(edition=edition)
+        subjects = sorted({r["subject"] for r in records if r["subject"]})
+        return {
+            "cap_usd": self.cap,
+            **self.summary(edition=edition),
+            "by_subject": {s: self.summary(s, edition) for s in subjects},
+        }
+
+
+class MeteredClaude:
+    """Wraps an anthropic client; records usage and enforces the meter's cap."""
+
+    def __init__(self, client, meter):
+        self._client = client
+        self.meter = meter
+        self.messages = Messages(self._create)
+
+    def _create(self, **kwargs):
+        self.meter.check()
+        start = time.perf_counter()
+        response = self._client.messages.create(**kwargs)
+        self.meter.record(
+            getattr(response, "model", None) or kwargs.get("model"),
+            getattr(response, "usage", None), time.perf_counter() - start,
+        )
+        return response